@@ -51,14 +51,14 @@ def setup(b: SetupBody, request: Request):
 
 
 @router.post("/login")
-def login(b: LoginBody, request: Request, response: Response):
+async def login(b: LoginBody, request: Request, response: Response):
     if not b.password and not b.pin:
         raise HTTPException(400, "missing_secret")
     ip = get_client_ip(request.headers, request.client.host if request.client else None)
     req_id = request.headers.get("x-request-id", secrets.token_urlsafe(8))
     use_pin = b.pin is not None
     secret = b.pin if use_pin else b.password
-    uid, pending, status = auth.begin_password_or_pin_login(b.username, secret, use_pin, ip, req_id)
+    uid, pending, status = await auth.abegin_password_or_pin_login(b.username, secret, use_pin, ip, req_id)
     if status == "rate_limited":
         raise HTTPException(429, "rate_limited")
     if status == "locked":
@@ -80,9 +80,9 @@ def login(b: LoginBody, request: Request, response: Response):
 
 
 @router.post("/mfa/verify")
-def mfa_verify(b: MfaVerifyBody, request: Request, response: Response):
+async def mfa_verify(b: MfaVerifyBody, request: Request, response: Response):
     req_id = request.headers.get("x-request-id", secrets.token_urlsafe(8))
-    uid = auth.verify_mfa(b.pending_token, b.code, b.recovery_code, req_id)
+    uid = await auth.averify_mfa(b.pending_token, b.code, b.recovery_code, req_id)
     if not uid:
         raise HTTPException(401, "mfa_invalid")
     sid = sessions.create(uid, mfa_verified=True)
@@ -0,0 +1,150 @@
+"""
+Shared pytest fixtures for the JAI test scripts.
+
+The Gmail and web API scripts double as manual checks against a real account
+or a running server; under pytest their OAuth and HTTP round-trips are
+replaced with canned results.
+
+With JAI_LIVE_TESTS=1 they talk to the real services instead, through VCR.py:
+the first run records each test's traffic to cassettes/<module>.<test>.yaml
+(OAuth headers stripped) and later runs replay it without touching the network.
+"""
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+# The test scripts import the top-level JAI modules; put the repo root on the
+# path once here instead of each script mutating sys.path
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+_LIVE_TESTS = os.environ.get('JAI_LIVE_TESTS') == '1'
+_CASSETTE_DIR = os.path.join(_ROOT, 'cassettes')
+
+# Modules whose Gmail calls run against mock_gmail_service automatically
+_OFFLINE_GMAIL_MODULES = ('test_gmail',)
+
+_CANNED_PROFILE = {'emailAddress': 'jai-test@example.com', 'messagesTotal': 0, 'historyId': '1'}
+_CANNED_MESSAGE_ID = 'mock-id'
+
+# Modules that talk to the JAI web server on localhost:8080
+_OFFLINE_SERVER_MODULES = ('test_voice_api',)
+_JAI_BASE_URL = 'http://localhost:8080'
+# (method, path) -> (status, JSON body); with no audio/image attached the real
+# upload endpoints answer 400
+_JAI_ROUTES = {
+    ('GET', '/'): (200, {'name': 'JAI'}),
+    ('GET', '/api/health'): (200, {'status': 'ok'}),
+    ('POST', '/api/text'): (200, {'response': 'hi'}),
+    ('POST', '/api/persona'): (200, {'success': True, 'persona': 'therapist'}),
+    ('POST', '/api/voice'): (400, {'error': 'No audio file'}),
+    ('POST', '/api/image'): (400, {'error': 'No image file'}),
+}
+
+
+@pytest.fixture
+def mock_gmail_service():
+    """MagicMock Gmail API service installed by GmailOAuth.authenticate (no OAuth flow, no network)
+
+    Everything past authentication (validation, MIME encoding, result
+    handling) is the real GmailOAuth code; a fresh shared client is used.
+    """
+    import gmail_oauth
+
+    if not gmail_oauth.GOOGLE_APIS_AVAILABLE:
+        pytest.skip('Google API client libraries not installed')
+    service = mock.MagicMock()
+    users = service.users.return_value
+    users.getProfile.return_value.execute.return_value = dict(_CANNED_PROFILE)
+    users.messages.return_value.send.return_value.execute.return_value = {'id': _CANNED_MESSAGE_ID}
+
+    def _authenticate(self):
+        self.service = service
+        return True
+
+    client_module = sys.modules[gmail_oauth.GmailOAuth.__module__]
+    with mock.patch.object(client_module, '_gmail_client', None), \
+            mock.patch.object(gmail_oauth.GmailOAuth, 'authenticate', autospec=True, side_effect=_authenticate), \
+            mock.patch.object(gmail_oauth.GmailOAuth, '_authorized_http', autospec=True, return_value=None):
+        yield service
+
+
+def _live_cassette(request):
+    """(VCR cassette context for the current test, whether it was already recorded)"""
+    vcr = pytest.importorskip('vcr')
+    recorder = vcr.VCR(
+        cassette_library_dir=_CASSETTE_DIR,
+        record_mode='once',
+        filter_headers=['authorization'],
+        filter_post_data_parameters=['client_secret', 'refresh_token'],
+    )
+    name = f'{request.module.__name__}.{request.function.__name__}.yaml'
+    return recorder.use_cassette(name), os.path.exists(os.path.join(_CASSETTE_DIR, name))
+
+
+@pytest.fixture(autouse=True)
+def _offline_gmail(request, monkeypatch):
+    """Patch the Gmail helpers imported by the Gmail test scripts"""
+    module = request.module
+    if module.__name__ not in _OFFLINE_GMAIL_MODULES:
+        yield
+        return
+    if _LIVE_TESTS:
+        cassette, _ = _live_cassette(request)
+        with cassette:
+            yield
+        return
+    monkeypatch.setenv('JAI_TEST_RECIPIENT', 'jai-test@example.com')
+    # The scripts look for ./credentials.json; report it present without creating
+    # a file, so the result does not depend on the developer's checkout
+    real_exists = os.path.exists
+    monkeypatch.setattr(os.path, 'exists', lambda path: path == 'credentials.json' or real_exists(path))
+    request.getfixturevalue('mock_gmail_service')
+    yield
+
+
+@pytest.fixture
+def mock_jai_server():
+    """requests_mock Mocker answering the JAI web API endpoints in-process"""
+    requests_mock = pytest.importorskip('requests_mock')
+    with requests_mock.Mocker() as m:
+        for (method, path), (status, body) in _JAI_ROUTES.items():
+            m.register_uri(method, f'{_JAI_BASE_URL}{path}', status_code=status, json=body)
+        yield m
+
+
+def _jai_route(request):
+    """httpx.MockTransport handler serving _JAI_ROUTES"""
+    import httpx
+
+    status, body = _JAI_ROUTES.get((request.method, request.url.path), (404, {'error': 'Not found'}))
+    return httpx.Response(status, json=body)
+
+
+@pytest.fixture(autouse=True)
+def _offline_jai_server(request, monkeypatch):
+    """Serve the web API scripts from mock_jai_server instead of localhost:8080"""
+    module = request.module
+    if module.__name__ not in _OFFLINE_SERVER_MODULES:
+        yield
+        return
+    if _LIVE_TESTS:
+        cassette, recorded = _live_cassette(request)
+        if recorded and hasattr(module, 'wait_for_server'):
+            # Replaying: the raw TCP probe is not recorded, and the server may be down
+            monkeypatch.setattr(module, 'wait_for_server', lambda *args, **kwargs: True)
+        with cassette:
+            yield
+        return
+    request.getfixturevalue('mock_jai_server')
+    if hasattr(module, 'wait_for_server'):
+        # Skip the TCP probe; the mocked endpoints are always up
+        monkeypatch.setattr(module, 'wait_for_server', lambda *args, **kwargs: True)
+    if hasattr(module, '_probe_transport'):
+        import httpx
+        monkeypatch.setattr(module, '_probe_transport', httpx.MockTransport(_jai_route))
+    yield
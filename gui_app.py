@@ -692,10 +692,7 @@ class MainWindow(QMainWindow):
         if not key or not val:
             QMessageBox.information(self, "Memory", "Enter key and value.")
             return
-        if self.session.memory.recall_long_term(key) is None:
-            self.session.memory.remember_long_term(key, val, importance=0.5)
-        else:
-            self.session.memory.update_long_term(key, val)
+        self.session.memory.upsert_long_term(key, val, importance=0.5)
         self._refresh_memory_tables()
 
     def _on_mem_forget(self):
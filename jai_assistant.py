@@ -904,78 +904,87 @@ def is_likely_math(text: str) -> bool:
 # -----------------------------
 # Intent Classification
 # -----------------------------
+# Intent patterns in priority order (first match wins), compiled once at import
+_INTENT_PATTERNS = {
+    "activate aj": r"act(?:iv|ic)?ate\s+(?:aj|jai|ai|assistant)",
+    "activate text mode": r"act(?:iv|ic)?ate\s+text(?:\s+mode)?",
+    "activate voice mode": r"act(?:iv|ic)?ate\s+voice(?:\s+mode)?",
+    "screenshot": r"screenshot|screen\s+capture|snap",
+    "mouse up": r"mouse\s+up|move\s+up",
+    "open browser": r"open\s+browser|open\s+tab|open\s+firefox",
+    "open app": r"open\s+(notepad|calculator|word|excel|spotify|vscode|code|file explorer|recycle bin|control panel|google chrome|chrome|microsoft store|youtube)",
+    "set timer": r"set\s+timer\s+(for\s+)?(\d+)(?:\s+(minutes?|seconds?))?",
+    "terminate": r"terminate\b",
+    "shutdown": r"shutdown|power\s+off",
+    "restart": r"restart|reboot",
+    "sleep": r"sleep|snooze",
+    "hibernate": r"hibernate",
+    "lock": r"lock\s+screen",  # Expanded PC control
+    "download from chrome": r"download\s+(.+)\s+from\s+chrome",
+    "volume": r"set\s+volume\s+to\s+(\d+)|(?:^|\s)mute(?:$|\s)|unmute",
+    "system info": r"check\s+(battery|cpu|ram|memory|disk)",
+    "search": r"search\s+(.+)",
+    "search memory": r"search\s+memory\s+(.+)",
+    "remember": r"remember\s+(.+)",
+    "update": r"update\s+(.+?)\s+(to|with)\s+(.+)",
+    "forget": r"forget\s+(.+)",
+    "recall": r"recall\s+(.+)",
+    "set_fact": r"my\s+([a-z ]+?)\s+is\s+(.+)",
+    "recall_fact": r"(?:do\s+you\s+)?(?:remember|recall|know)\s+my\s+(.+?)\??$|what(?:'s|\s+is)\s+my\s+(.+?)\??$",
+    "show short term memory": r"(?:show|tell\s+me\s+about)\s+(?:your\s+)?short\s+term\s+memory|list\s+short\s+term\s+memories",
+    "show long term memory": r"(?:show|tell\s+me\s+about)\s+(?:your\s+)?long\s+term\s+memory|list\s+long\s+term\s+memories",
+    "close app": r"close\s+(notepad|calculator|word|excel|chrome|google chrome|youtube|browser|file explorer|vscode)",
+    "greeting": r"hello|hi|hey|good\s+(morning|evening|night)",
+    "set language": r"(?:(?:you\s+will\s+)?(?:speak|set|use)\s+(?:only\s+)?(hindi|urdu|arabic|russian|spanish|english))|(?:english\s+only|only\s+english|always\s+english)",
+    "auto language": r"(?:auto\s+language|auto\s+lang|speak\s+auto|default\s+language)",
+    "who are you": r"who\s+(are\s+you|is\s+(?:jai|aj))",
+    "set name": r"my\s+name\s+is\s+(\w+)",
+    "weather": r"weather(?:\s+in\s+(.+))?",
+    "news": r"news|headlines|top\s+\d*\s*(?:latest|recent)?\s*(?:world|global)?\s*news",  # New intent for news
+    "nasa apod": r"(?:(?:nasa\s+(?:apod|pictures?\s+of\s+(?:the\s+day|today)))|apod)(?:\s+(today|yesterday|\d{4}-\d{2}-\d{2}))?(?:\s+(hd))?",
+    "analyze_sentiment": r"analyz[e]?\s+.*sentiment|sentiment.*analyz|sentiment.*(?:positive|negative|neutral)",  # Sentiment analysis
+    "summarize_news": r"(?:create|write|make).*(?:summary|bulletin|paragraph).*(?:news|stories|headlines)|summarize.*(?:news|headlines|stories)|read.*(?:news|bulletin)",  # News summary
+    "rewrite_headlines": r"(?:rewrite|make|create|write).*?(?:catchy|social|friendly)?\s*headlines|headlines.*(?:catchy|social|friendly|style)",  # Rewrite headlines
+    "business_insights": r".*(?:trends|risks|insights|implications).*(?:business|owner|company)|business.*(?:trends|risks|insights)|(?:what|which).*(?:trends|risks).*(?:business|owner)",  # Business insights from news
+    "remind_me": r"remind me|set (?:a )?reminder|reminder for",  # Reminders
+    "list_reminders": r"list reminders|show reminders|what are my reminders|my reminders",  # List reminders
+    "list_events": r"list events|show events|what's on my calendar|my calendar|upcoming events",  # List events
+    "add_event": r"add event|create event|schedule (?:a |an )?(?:event|meeting|appointment)",  # Add calendar event
+    "write_here": r"(?:write|right|type)\s+(.+?)\s+(?:here|hear|hair|hare)\s*$",
+    "write_in_app": r"(?:write|right|type)\s+(.+?)\s+in\s+(notepad|word|chrome|edge|vscode|code|excel|teams)\s*$",
+    "start_dictation": r"(?:write\s+what\s+i\s+say\s+here|dictate\s+here|start\s+dictation)",
+    "stop_dictation": r"(?:stop\s+(?:dictation|writing)|cancel\s+(?:dictation|writing))",
+    "write_description_here": r"write\s+your\s+description\s+here",
+    "sum_primes": r"(?:compute|calculate|find|sum)\s+(?:the\s+)?(?:exact\s+)?sum\s+of\s+primes?(?:\s+which\s+is)?\s*(?:<=|less\s+and\s*equal\s+than|less\s+than\s+or\s+equal\s+to|up\s+to|below)\s*([\d_, ]+)",
+    "solve_math": r"(?:solve|calculate|simplify|factor|expand|integrate|differentiate)\s+(.+)$",
+    "feedback_wrong": r"(?:(?:this|that|it)\s+is\s+wrong|(?:you're|you are)\s+wrong|wrong\s+(?:answer|response)|that's\s+wrong|not\s+correct|incorrect)",
+    "muse_image": r"(?:muse\s+)?(?:generate|create|make)\s+(?:an?\s+)?image(?:\s+of|\s+for)?\s+(.+)",
+    "muse_transcribe": r"(?:muse\s+)?transcribe\s+(.+)",
+    "muse_detect": r"(?:muse\s+)?detect\s+objects\s+in\s+(.+)",
+    "muse_search": r"(?:muse\s+)?search\s+images?\s+for\s+(.+)",
+    "send_email": r"send\s+(?:an?\s+)?email\s+(?:to\s+)?(.+?)(?:\s+(?:with|about|subject)\s+(.+))?$|email\s+(.+?)(?:\s+(?:with|about|subject)\s+(.+))?$",
+    "test_gmail": r"test\s+gmail|gmail\s+test|check\s+gmail",
+    "current_time": r"what time is it|what's the time|tell me the time|current time|time now"  # Current time
+}
+_COMPILED_INTENTS = tuple((intent, re.compile(pattern)) for intent, pattern in _INTENT_PATTERNS.items())
+# Fuzzy fallback compares against the intent names with spaces removed
+_FUZZY_INTENT_NAMES = tuple((intent, intent.replace(" ", "")) for intent in _INTENT_PATTERNS)
+
 def classify_intent(command: str) -> tuple[str, Optional[tuple]]:
     command = command.lower().strip()
-    patterns = {
-        "activate aj": r"act(?:iv|ic)?ate\s+(?:aj|jai|ai|assistant)",
-        "activate text mode": r"act(?:iv|ic)?ate\s+text(?:\s+mode)?",
-        "activate voice mode": r"act(?:iv|ic)?ate\s+voice(?:\s+mode)?",
-        "screenshot": r"screenshot|screen\s+capture|snap",
-        "mouse up": r"mouse\s+up|move\s+up",
-        "open browser": r"open\s+browser|open\s+tab|open\s+firefox",
-        "open app": r"open\s+(notepad|calculator|word|excel|spotify|vscode|code|file explorer|recycle bin|control panel|google chrome|chrome|microsoft store|youtube)",
-        "set timer": r"set\s+timer\s+(for\s+)?(\d+)(?:\s+(minutes?|seconds?))?",
-        "terminate": r"terminate\b",
-        "shutdown": r"shutdown|power\s+off",
-        "restart": r"restart|reboot",
-        "sleep": r"sleep|snooze",
-        "hibernate": r"hibernate",
-        "lock": r"lock\s+screen",  # Expanded PC control
-        "download from chrome": r"download\s+(.+)\s+from\s+chrome",
-        "volume": r"set\s+volume\s+to\s+(\d+)|(?:^|\s)mute(?:$|\s)|unmute",
-        "system info": r"check\s+(battery|cpu|ram|memory|disk)",
-        "search": r"search\s+(.+)",
-        "search memory": r"search\s+memory\s+(.+)",
-        "remember": r"remember\s+(.+)",
-        "update": r"update\s+(.+?)\s+(to|with)\s+(.+)",
-        "forget": r"forget\s+(.+)",
-        "recall": r"recall\s+(.+)",
-        "set_fact": r"my\s+([a-z ]+?)\s+is\s+(.+)",
-        "recall_fact": r"(?:do\s+you\s+)?(?:remember|recall|know)\s+my\s+(.+?)\??$|what(?:'s|\s+is)\s+my\s+(.+?)\??$",
-        "show short term memory": r"(?:show|tell\s+me\s+about)\s+(?:your\s+)?short\s+term\s+memory|list\s+short\s+term\s+memories",
-        "show long term memory": r"(?:show|tell\s+me\s+about)\s+(?:your\s+)?long\s+term\s+memory|list\s+long\s+term\s+memories",
-        "close app": r"close\s+(notepad|calculator|word|excel|chrome|google chrome|youtube|browser|file explorer|vscode)",
-        "greeting": r"hello|hi|hey|good\s+(morning|evening|night)",
-        "set language": r"(?:(?:you\s+will\s+)?(?:speak|set|use)\s+(?:only\s+)?(hindi|urdu|arabic|russian|spanish|english))|(?:english\s+only|only\s+english|always\s+english)",
-        "auto language": r"(?:auto\s+language|auto\s+lang|speak\s+auto|default\s+language)",
-        "who are you": r"who\s+(are\s+you|is\s+(?:jai|aj))",
-        "set name": r"my\s+name\s+is\s+(\w+)",
-        "weather": r"weather(?:\s+in\s+(.+))?",
-        "news": r"news|headlines|top\s+\d*\s*(?:latest|recent)?\s*(?:world|global)?\s*news",  # New intent for news
-        "nasa apod": r"(?:(?:nasa\s+(?:apod|pictures?\s+of\s+(?:the\s+day|today)))|apod)(?:\s+(today|yesterday|\d{4}-\d{2}-\d{2}))?(?:\s+(hd))?",
-        "analyze_sentiment": r"analyz[e]?\s+.*sentiment|sentiment.*analyz|sentiment.*(?:positive|negative|neutral)",  # Sentiment analysis
-        "summarize_news": r"(?:create|write|make).*(?:summary|bulletin|paragraph).*(?:news|stories|headlines)|summarize.*(?:news|headlines|stories)|read.*(?:news|bulletin)",  # News summary
-        "rewrite_headlines": r"(?:rewrite|make|create|write).*?(?:catchy|social|friendly)?\s*headlines|headlines.*(?:catchy|social|friendly|style)",  # Rewrite headlines
-        "business_insights": r".*(?:trends|risks|insights|implications).*(?:business|owner|company)|business.*(?:trends|risks|insights)|(?:what|which).*(?:trends|risks).*(?:business|owner)",  # Business insights from news
-        "remind_me": r"remind me|set (?:a )?reminder|reminder for",  # Reminders
-        "list_reminders": r"list reminders|show reminders|what are my reminders|my reminders",  # List reminders
-        "list_events": r"list events|show events|what's on my calendar|my calendar|upcoming events",  # List events
-        "add_event": r"add event|create event|schedule (?:a |an )?(?:event|meeting|appointment)",  # Add calendar event
-        "write_here": r"(?:write|right|type)\s+(.+?)\s+(?:here|hear|hair|hare)\s*$",
-        "write_in_app": r"(?:write|right|type)\s+(.+?)\s+in\s+(notepad|word|chrome|edge|vscode|code|excel|teams)\s*$",
-        "start_dictation": r"(?:write\s+what\s+i\s+say\s+here|dictate\s+here|start\s+dictation)",
-        "stop_dictation": r"(?:stop\s+(?:dictation|writing)|cancel\s+(?:dictation|writing))",
-        "write_description_here": r"write\s+your\s+description\s+here",
-        "sum_primes": r"(?:compute|calculate|find|sum)\s+(?:the\s+)?(?:exact\s+)?sum\s+of\s+primes?(?:\s+which\s+is)?\s*(?:<=|less\s+and\s*equal\s+than|less\s+than\s+or\s+equal\s+to|up\s+to|below)\s*([\d_, ]+)",
-        "solve_math": r"(?:solve|calculate|simplify|factor|expand|integrate|differentiate)\s+(.+)$",
-        "feedback_wrong": r"(?:(?:this|that|it)\s+is\s+wrong|(?:you're|you are)\s+wrong|wrong\s+(?:answer|response)|that's\s+wrong|not\s+correct|incorrect)",
-        "muse_image": r"(?:muse\s+)?(?:generate|create|make)\s+(?:an?\s+)?image(?:\s+of|\s+for)?\s+(.+)",
-        "muse_transcribe": r"(?:muse\s+)?transcribe\s+(.+)",
-        "muse_detect": r"(?:muse\s+)?detect\s+objects\s+in\s+(.+)",
-        "muse_search": r"(?:muse\s+)?search\s+images?\s+for\s+(.+)",
-        "send_email": r"send\s+(?:an?\s+)?email\s+(?:to\s+)?(.+?)(?:\s+(?:with|about|subject)\s+(.+))?$|email\s+(.+?)(?:\s+(?:with|about|subject)\s+(.+))?$",
-        "test_gmail": r"test\s+gmail|gmail\s+test|check\s+gmail",
-        "current_time": r"what time is it|what's the time|tell me the time|current time|time now"  # Current time
-    }
-    for intent, pattern in patterns.items():
-        match = re.match(pattern, command)
+    for intent, regex in _COMPILED_INTENTS:
+        match = regex.match(command)
         if match:
             return intent, match.groups() if match.groups() else None
-    for intent in patterns:
-        if fuzz.partial_ratio(command, intent.replace(" ", "")) > 85:
+    for intent, name in _FUZZY_INTENT_NAMES:
+        if fuzz.partial_ratio(command, name) > 85:
             return intent, None
     return "query", None
 
+def classify_intent_batch(commands: List[str]) -> List[tuple[str, Optional[tuple]]]:
+    """Classify several commands; results line up with the input order."""
+    return [classify_intent(command) for command in commands]
+
 def is_memory_intent(intent: str) -> bool:
     return intent in {
         "search memory",
@@ -1479,8 +1488,6 @@ def execute_command(command: str, session: UserSession, suppress_tts: bool = Fal
             "Good day! How may I assist you?",
             "Greetings! What can I do for you today?"
         ]
-                "Ready and waiting, sir."
-            ]
         resp_greet = random.choice(greetings)
         try:
             if getattr(session, "tts_enabled", False):
@@ -1924,9 +1931,7 @@ def execute_command(command: str, session: UserSession, suppress_tts: bool = Fal
             value = args[1].strip() if isinstance(args, tuple) and len(args) > 1 else ""
             if attr and value:
                 key = attr.lower()
-                ok = session.memory.remember_long_term(key, value, importance=0.9)
-                if not ok:
-                    session.memory.update_long_term(key, value)
+                session.memory.upsert_long_term(key, value, importance=0.9)
                 return f"Noted, sir. I'll remember your {attr}."
             return "Please specify the information clearly, sir."
         except Exception as e:
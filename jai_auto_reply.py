@@ -5,7 +5,9 @@ Smart auto-reply functionality using Hugging Face language models
 
 import json
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -68,6 +70,10 @@ class AutoReplyEngine:
         self.reply_counts: Dict[str, int] = {}
         self.last_reset = datetime.now()
         
+        # Generated replies keyed by a digest of the exact prompt (LRU)
+        self._reply_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._reply_cache_size = 4096
+        
         # Hugging Face model
         self.model = None
         self.tokenizer = None
@@ -317,6 +323,14 @@ New message from {email.sender} with subject "{email.subject}":
 
 Generate a brief, professional reply:"""
             
+            # Identical prompts (templated mail, bots, the /test endpoint)
+            # skip model inference entirely
+            cache_key = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+            cached = self._reply_cache.get(cache_key)
+            if cached is not None:
+                self._reply_cache.move_to_end(cache_key)
+                return cached
+            
             # Generate response
             responses = self.generator(
                 prompt,
@@ -338,7 +352,12 @@ Generate a brief, professional reply:"""
                 if len(sentences) > 2:
                     reply = '. '.join(sentences[:2]) + '.'
                 
-                return reply if reply else self._generate_template_reply(email)
+                if not reply:
+                    return self._generate_template_reply(email)
+                self._reply_cache[cache_key] = reply
+                if len(self._reply_cache) > self._reply_cache_size:
+                    self._reply_cache.popitem(last=False)
+                return reply
             
         except Exception as e:
             self.logger.error(f"Error generating smart reply: {e}")
@@ -367,7 +386,7 @@ Generate a brief, professional reply:"""
         
         return reply
     
-    async def process_incoming_email(self, email: EmailContent) -> Dict:
+    async def process_incoming_email(self, email: EmailContent, save_history: bool = True) -> Dict:
         """Process incoming email and generate auto-reply if appropriate"""
         try:
             # Check if should auto-reply
@@ -387,8 +406,9 @@ Generate a brief, professional reply:"""
             # Update conversation context
             self._update_conversation_context(email, reply)
             
-            # Save conversation history
-            self._save_conversation_history()
+            # Save conversation history (batch callers save once at the end)
+            if save_history:
+                self._save_conversation_history()
             
             # In a real implementation, this would send the email
             # For now, we'll return the reply for sending
@@ -411,6 +431,15 @@ Generate a brief, professional reply:"""
                 "message_id": email.message_id
             }
     
+    async def process_incoming_emails(self, emails: List[EmailContent]) -> List[Dict]:
+        """Process a batch of emails, rewriting the history file once instead of per email"""
+        results = []
+        for email in emails:
+            results.append(await self.process_incoming_email(email, save_history=False))
+        if any(r.get("auto_replied") for r in results):
+            self._save_conversation_history()
+        return results
+    
     async def _send_reply(self, email: EmailContent, reply: str) -> bool:
         """Send auto-reply (placeholder for actual email sending)"""
         try:
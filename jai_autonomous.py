@@ -639,7 +639,8 @@ class JAIAutonomous:
             
             task.completed_at = datetime.now()
             self.task_history.append(task)
-            del self.active_tasks[task_id]
+            # emergency_stop may already have swapped the active-task dict out
+            self.active_tasks.pop(task_id, None)
             
             return {
                 'success': task.status == TaskStatus.COMPLETED,
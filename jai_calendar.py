@@ -17,6 +17,14 @@ except ImportError:
     SCHEDULER_AVAILABLE = False
     logging.warning("APScheduler not available. Install: pip install apscheduler")
 
+# Time/command patterns, compiled once at import
+_SIMPLE_TIME_RE = re.compile(r'^(\d{1,2})(?::(\d{2}))?\s*([ap]\.?m\.?)?$', re.IGNORECASE)
+_RELATIVE_RE = re.compile(r'in\s+(\d+)\s+(second|sec|secs|minute|hour|day|week)s?')
+_CLOCK_PERIOD_RE = re.compile(r'(\d+):(\d+)\s*(am|pm)')
+_HOUR_PERIOD_RE = re.compile(r'(\d+)\s*(am|pm)')
+_REMIND_AT_RE = re.compile(r'remind me (?:to\s+)?(.+?)\s+(?:at|in)\s+(.+)')
+_REMIND_RE = re.compile(r'remind me (?:to\s+)?(.+)')
+
 
 class CalendarManager:
     """Manages events and reminders."""
@@ -115,6 +123,31 @@ class CalendarManager:
             self.cursor.execute("UPDATE reminders SET completed = 1 WHERE id = ?", (reminder_id,))
             self.conn.commit()
     
+    def fire_due_reminders(self, now: Optional[datetime] = None) -> int:
+        """
+        Trigger every pending reminder that is due at `now`, without waiting on the scheduler.
+        
+        Args:
+            now: Reference time (default: current time); tests pass a future time to fast-forward
+            
+        Returns:
+            int: Number of reminders triggered
+        """
+        now = now or datetime.now()
+        self.cursor.execute(
+            "SELECT id FROM reminders WHERE completed = 0 AND remind_at <= ?",
+            (now.isoformat(),)
+        )
+        reminder_ids = [row[0] for row in self.cursor.fetchall()]
+        
+        for reminder_id in reminder_ids:
+            # Drop the scheduled job first so the reminder cannot fire twice
+            if self.scheduler and self.scheduler.get_job(f"reminder_{reminder_id}"):
+                self.scheduler.remove_job(f"reminder_{reminder_id}")
+            self._trigger_reminder(reminder_id)
+        
+        return len(reminder_ids)
+    
     def add_event(self, title: str, start_time: datetime, end_time: Optional[datetime] = None, description: str = "") -> int:
         """
         Add a calendar event.
@@ -232,7 +265,12 @@ class CalendarManager:
         
         return reminders
     
-    def parse_relative_time(self, text: str) -> Optional[datetime]:
+    def parse_relative_times_batch(self, exprs: List[str]) -> List[Optional[datetime]]:
+        """Parse several time expressions against a single reference time."""
+        now = datetime.now()
+        return [self.parse_relative_time(expr, now=now) for expr in exprs]
+
+    def parse_relative_time(self, text: str, now: Optional[datetime] = None) -> Optional[datetime]:
         """
         Parse relative time expressions.
         
@@ -245,11 +283,11 @@ class CalendarManager:
             "9" (assumes next 9 AM or PM, whichever is closer)
             "9:20 p.m."
         """
-        now = datetime.now()
+        now = now or datetime.now()
         text = text.lower().strip()
         
         # Handle simple time formats like "9" or "9 p.m." or "9:20 p.m."
-        simple_time = re.search(r'^(\d{1,2})(?::(\d{2}))?\s*([ap]\.?m\.?)?$', text, re.IGNORECASE)
+        simple_time = _SIMPLE_TIME_RE.search(text)
         if simple_time:
             hour = int(simple_time.group(1))
             minute = int(simple_time.group(2) or 0)
@@ -282,7 +320,7 @@ class CalendarManager:
             return target
         
         # Handle "in X minutes/hours"
-        match = re.search(r'in\s+(\d+)\s+(second|sec|secs|minute|hour|day|week)s?', text)
+        match = _RELATIVE_RE.search(text)
         if match:
             value = int(match.group(1))
             unit = match.group(2)
@@ -302,7 +340,7 @@ class CalendarManager:
         if 'tomorrow' in text:
             tomorrow = now + timedelta(days=1)
             # Try to extract time
-            time_match = re.search(r'(\d+):(\d+)\s*(am|pm)', text)
+            time_match = _CLOCK_PERIOD_RE.search(text)
             if time_match:
                 hour = int(time_match.group(1))
                 minute = int(time_match.group(2))
@@ -313,7 +351,7 @@ class CalendarManager:
                     hour = 0
                 return tomorrow.replace(hour=hour, minute=minute, second=0, microsecond=0)
             
-            time_match = re.search(r'(\d+)\s*(am|pm)', text)
+            time_match = _HOUR_PERIOD_RE.search(text)
             if time_match:
                 hour = int(time_match.group(1))
                 if time_match.group(2) == 'pm' and hour != 12:
@@ -358,7 +396,7 @@ def handle_calendar_command(command: str, calendar: CalendarManager) -> Optional
     if command_lower.startswith("remind me") or "set reminder" in command_lower:
         # Extract the reminder details
         # Try pattern: "remind me to [task] at/in [time]"
-        match = re.search(r'remind me (?:to\s+)?(.+?)\s+(?:at|in)\s+(.+)', command_lower)
+        match = _REMIND_AT_RE.search(command_lower)
         
         if match:
             title = match.group(1).strip()
@@ -373,7 +411,7 @@ def handle_calendar_command(command: str, calendar: CalendarManager) -> Optional
                 return f"Couldn't parse time expression: {time_expr}"
         
         # Fallback: just "remind me [task]" without time
-        match = re.search(r'remind me (?:to\s+)?(.+)', command_lower)
+        match = _REMIND_RE.search(command_lower)
         if match:
             return "Please specify when you'd like to be reminded, sir. For example: 'remind me to call mom at 3 PM' or 'remind me to call mom in 30 minutes'"
         
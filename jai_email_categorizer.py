@@ -199,6 +199,12 @@ class EmailCategorizationEngine:
             }
         }
         
+        # Category regexes compiled once instead of per email and category
+        self._compiled_patterns = {
+            category: [re.compile(pattern, re.IGNORECASE) for pattern in config["patterns"]]
+            for category, config in self.categories.items()
+        }
+        
         # Load learning data
         self.learning_data = self._load_learning_data()
         
@@ -303,36 +309,38 @@ class EmailCategorizationEngine:
     
     def _calculate_category_scores(self, features: Dict) -> Dict[str, float]:
         """Calculate scores for each category"""
-        scores = {}
+        # Per-email terms are accumulated in one pass each, then each category
+        # only sums its own pattern matches
+        base_scores = dict.fromkeys(self.categories, 0.0)
         
-        for category, config in self.categories.items():
-            score = 0.0
-            
-            # Keyword matching
-            for cat, keyword, count in features["keywords_found"]:
-                if cat == category:
-                    score += count * 2.0
-            
-            # Pattern matching
-            combined_text = f"{features['subject_lower']} {features['body_lower']}"
-            for pattern in config["patterns"]:
-                matches = len(re.findall(pattern, combined_text, re.IGNORECASE))
-                score += matches * 3.0
-            
-            # Sender pattern learning
-            sender_domain = features["sender_domain"]
-            if sender_domain in self.learning_data.get("sender_patterns", {}):
-                learned_category = self.learning_data["sender_patterns"][sender_domain].get("category")
-                if learned_category == category:
-                    score += 5.0
-            
-            # Subject pattern learning
-            for pattern in self.learning_data.get("subject_patterns", {}):
-                if pattern in features["subject_lower"]:
-                    learned_category = self.learning_data["subject_patterns"][pattern].get("category")
-                    if learned_category == category:
-                        score += 4.0
-            
+        # Keyword matching
+        for cat, keyword, count in features["keywords_found"]:
+            if cat in base_scores:
+                base_scores[cat] += count * 2.0
+        
+        # Sender pattern learning
+        sender_patterns = self.learning_data.get("sender_patterns", {})
+        sender_domain = features["sender_domain"]
+        if sender_domain in sender_patterns:
+            learned_category = sender_patterns[sender_domain].get("category")
+            if learned_category in base_scores:
+                base_scores[learned_category] += 5.0
+        
+        # Subject pattern learning
+        subject_lower = features["subject_lower"]
+        subject_patterns = self.learning_data.get("subject_patterns", {})
+        for pattern, learned in subject_patterns.items():
+            if pattern in subject_lower:
+                learned_category = learned.get("category")
+                if learned_category in base_scores:
+                    base_scores[learned_category] += 4.0
+        
+        # Pattern matching
+        combined_text = f"{subject_lower} {features['body_lower']}"
+        scores = {}
+        for category, score in base_scores.items():
+            for pattern in self._compiled_patterns.get(category, ()):
+                score += len(pattern.findall(combined_text)) * 3.0
             scores[category] = score
         
         return scores
@@ -22,7 +22,8 @@ class SecurityConfig:
     
     # Required scopes for different services
     MINIMAL_SCOPES = {
-        'gmail': ['https://www.googleapis.com/auth/gmail.readonly'],
+        # The Gmail integration sends mail; it never reads the mailbox
+        'gmail': ['https://www.googleapis.com/auth/gmail.send', 'https://www.googleapis.com/auth/gmail.compose'],
         'gmail_send': ['https://www.googleapis.com/auth/gmail.send'],
         'gmail_basic': ['https://www.googleapis.com/auth/gmail.compose'],
         'openai': [],  # No scopes needed for API key
@@ -38,7 +38,8 @@ class SecurityConfiguration:
     
     # Minimal required scopes for each service
     MINIMAL_REQUIRED_SCOPES = {
-        'gmail': ['https://www.googleapis.com/auth/gmail.readonly'],
+        # The Gmail integration sends mail; it never reads the mailbox
+        'gmail': ['https://www.googleapis.com/auth/gmail.send', 'https://www.googleapis.com/auth/gmail.compose'],
         'gmail_send': ['https://www.googleapis.com/auth/gmail.send'],
         'gmail_basic': ['https://www.googleapis.com/auth/gmail.compose'],
         'openai': [],  # No scopes needed for API key
@@ -1,11 +1,20 @@
 from fastapi import FastAPI, Request, UploadFile, File, Form
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
+from fastapi.responses import JSONResponse, HTMLResponse, FileResponse, ORJSONResponse, Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional, List
-import uuid
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime, timezone
+from typing import Optional, List, Tuple
+import hashlib
+import json
+from itertools import islice
+import secrets
+import sys
+import threading
+import types
+import time
 import os
 from dotenv import load_dotenv
 import re
@@ -16,8 +25,11 @@ import shutil
 import subprocess
 import base64
 import mimetypes
-from fastapi.middleware.cors import CORSMiddleware
 from io import BytesIO
+try:
+    import orjson
+except Exception:
+    orjson = None
 try:
     from PIL import Image
 except Exception:
@@ -41,13 +53,19 @@ except Exception:
 
 # Import autonomous system components
 try:
-    from jai_autonomous import jai_autonomous
+    from jai_autonomous import jai_autonomous, TaskStatus
     from jai_learning_system import learning_system
     from jai_error_handler import error_handler
     from jai_integration_agent import integration_agent, IntegrationConfig, IntegrationType, AuthType
     from jai_email_categorizer import email_categorizer, EmailContent
     from jai_auto_reply import auto_reply_engine, AutoReplyConfig
-    from jai_security_config import get_security_config, validate_api_scopes, check_content_security
+    # Aliased: the /api/security endpoints below reuse these names
+    from jai_security_config import (
+        get_security_config as load_security_config,
+        validate_api_scopes as check_api_scopes,
+        check_content_security as scan_content_security,
+    )
+    SECURITY_AVAILABLE = True
 except Exception as e:
     print(f"Warning: Autonomous system not available: {e}")
     jai_autonomous = None
@@ -56,13 +74,14 @@ except Exception as e:
     integration_agent = None
     email_categorizer = None
     auto_reply_engine = None
+    SECURITY_AVAILABLE = False
 
 load_dotenv()
 try:
     load_dotenv('.env.local', override=True)
 except Exception:
     pass
-app = FastAPI(title="JAI Web API")
+app = FastAPI(title="JAI Web API", default_response_class=ORJSONResponse if orjson else JSONResponse)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # Also load env files relative to server directory to avoid CWD issues
 try:
@@ -81,13 +100,101 @@ app.mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "static")), na
 # CORS (restrict in production by setting JAI_CORS_ORIGINS="https://your.domain")
 origins_env = os.environ.get("JAI_CORS_ORIGINS", "*")
 allow_origins = [o.strip() for o in origins_env.split(",") if o.strip()] or ["*"]
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=allow_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+# Header bytes are encoded once here so the per-request path is a dict lookup
+# plus a list append (no str building, no .encode()).
+_CORS_ALLOW_ALL = "*" in allow_origins
+_ALLOWED_ORIGIN_BYTES = {
+    o.encode("latin-1"): (b"access-control-allow-origin", o.encode("latin-1"))
+    for o in allow_origins if o != "*"
+}
+_CORS_CREDENTIALS_HEADER = (b"access-control-allow-credentials", b"true")
+_CORS_VARY_HEADER = (b"vary", b"Origin")
+_CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+
+
+class _CORSMiddleware:
+    """Pure-ASGI CORS handling equivalent to CORSMiddleware(allow_methods/headers="*",
+    allow_credentials=True) for the configured origins."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        origin = None
+        request_method = None
+        request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        allow_header = _ALLOWED_ORIGIN_BYTES.get(origin)
+        if allow_header is None and _CORS_ALLOW_ALL:
+            # Credentials forbid a literal "*", so echo the caller's origin back
+            allow_header = (b"access-control-allow-origin", origin)
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if allow_header is None:
+                await send({"type": "http.response.start", "status": 400, "headers": [_CORS_VARY_HEADER]})
+                await send({"type": "http.response.body", "body": b"Disallowed CORS origin"})
+                return
+            headers = [allow_header, _CORS_CREDENTIALS_HEADER, _CORS_VARY_HEADER, *_CORS_PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        if allow_header is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.append(allow_header)
+                headers.append(_CORS_CREDENTIALS_HEADER)
+                headers.append(_CORS_VARY_HEADER)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+app.add_middleware(_CORSMiddleware)
+# Large JSON bodies (conversations, integration status, exports) go out compressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
+# Request ids / web ids are sliced from a shared urandom pool so bursts of
+# requests amortise one syscall across ~256 ids.
+_RAND_POOL_SIZE = 4096
+_rand_pool = b""
+_rand_pos = 0
+_rand_lock = threading.Lock()
+
+def _new_id() -> str:
+    global _rand_pool, _rand_pos
+    with _rand_lock:
+        if _rand_pos + 16 > len(_rand_pool):
+            _rand_pool = secrets.token_bytes(_RAND_POOL_SIZE)
+            _rand_pos = 0
+        chunk = _rand_pool[_rand_pos:_rand_pos + 16]
+        _rand_pos += 16
+    return chunk.hex()
 
 class WebTextRequest(BaseModel):
     text: str
@@ -96,17 +203,26 @@ class WebPersonaRequest(BaseModel):
     persona: str
 
 
+_UTC = timezone.utc
+# (epoch second, formatted ISO string): liveness probes inside the same second
+# reuse the string instead of building a new datetime each time
+_health_time_cache = (0, "")
+
 @app.get("/api/health")
 async def health_check():
+    global _health_time_cache
+    now = int(time.time())
+    if _health_time_cache[0] != now:
+        _health_time_cache = (now, datetime.fromtimestamp(now, _UTC).strftime("%Y-%m-%dT%H:%M:%SZ"))
     return {
         "ok": True,
-        "time": datetime.utcnow().isoformat() + "Z"
+        "time": _health_time_cache[1]
     }
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    web_id = request.cookies.get("jai_web_id") or str(uuid.uuid4())
+    web_id = request.cookies.get("jai_web_id") or _new_id()
     resp = templates.TemplateResponse("index.html", {"request": request})
     if request.cookies.get("jai_web_id") != web_id:
         resp.set_cookie("jai_web_id", web_id, httponly=True, samesite="Lax")
@@ -124,7 +240,7 @@ async def service_worker():
 
 @app.post("/api/text")
 async def api_text(req: WebTextRequest, request: Request):
-    rid = request.headers.get("x-request-id") or str(uuid.uuid4())
+    rid = request.headers.get("x-request-id") or _new_id()
     token = request_id_ctx_var.set(rid)
     try:
         web_id = request.cookies.get("jai_web_id") or "anon"
@@ -144,8 +260,8 @@ async def api_text(req: WebTextRequest, request: Request):
         if special is not None:
             result = special
         else:
-            result = execute_command(req.text, session, suppress_tts=True)
-        result = _ensure_lang(result, desired_lang)
+            result = await run_in_threadpool(execute_command, req.text, session, suppress_tts=True)
+        result = await run_in_threadpool(_ensure_lang, result, desired_lang)
         return {"response": result, "requestId": rid}
     finally:
         try:
@@ -153,25 +269,7 @@ async def api_text(req: WebTextRequest, request: Request):
         except Exception:
             pass
 
-_PERSONA_ALIASES = {
-    "story teller": "storyteller",
-    "story-teller": "storyteller",
-    "trivia game": "trivia",
-    "quiz": "trivia",
-    "coach": "motivation",
-    "meditate": "meditation",
-    "counselor": "therapist",
-}
-_PERSONA_ALLOWED = {"therapist", "storyteller", "trivia", "meditation", "motivation"}
-
-def _normalize_persona(p: str | None) -> str | None:
-    if not p:
-        return None
-    s = (p or "").strip().lower()
-    s = _PERSONA_ALIASES.get(s, s)
-    return s if s in _PERSONA_ALLOWED else None
-
-_PERSONA_ALIASES = {
+_PERSONA_ALIASES = types.MappingProxyType({
     "story teller": "storyteller",
     "story-teller": "storyteller",
     "trivia game": "trivia",
@@ -179,8 +277,8 @@ _PERSONA_ALIASES = {
     "coach": "motivation",
     "meditate": "meditation",
     "counselor": "therapist",
-}
-_PERSONA_ALLOWED = {"therapist", "storyteller", "trivia", "meditation", "motivation"}
+})
+_PERSONA_ALLOWED = frozenset({"therapist", "storyteller", "trivia", "meditation", "motivation"})
 
 def _normalize_persona(p: str | None) -> str | None:
     if not p:
@@ -367,7 +465,7 @@ def _handle_special_qa(user_text: str) -> Optional[str]:
 
 @app.post("/api/image")
 async def api_image(request: Request, file: UploadFile = File(...), prompt: str = Form("")):
-    rid = request.headers.get("x-request-id") or str(uuid.uuid4())
+    rid = request.headers.get("x-request-id") or _new_id()
     token = request_id_ctx_var.set(rid)
     try:
         web_id = request.cookies.get("jai_web_id") or "anon"
@@ -390,8 +488,8 @@ async def api_image(request: Request, file: UploadFile = File(...), prompt: str
         if not mime.startswith("image/"):
             return JSONResponse({"error": "Unsupported file type. Please upload an image."}, status_code=400)
 
-        analysis = _analyze_image_bytes(data, mime, prompt)
-        analysis = _ensure_lang(analysis, "en")
+        analysis = await run_in_threadpool(_analyze_image_bytes, data, mime, prompt)
+        analysis = await run_in_threadpool(_ensure_lang, analysis, "en")
         return {"response": analysis, "requestId": rid}
     finally:
         try:
@@ -401,7 +499,7 @@ async def api_image(request: Request, file: UploadFile = File(...), prompt: str
 
 @app.post("/api/voice")
 async def api_voice(request: Request, file: UploadFile = File(...), lang: str = Form("en-US")):
-    rid = request.headers.get("x-request-id") or str(uuid.uuid4())
+    rid = request.headers.get("x-request-id") or _new_id()
     token = request_id_ctx_var.set(rid)
     try:
         # Save uploaded audio (accept webm/ogg/wav/flac/etc.)
@@ -418,10 +516,10 @@ async def api_voice(request: Request, file: UploadFile = File(...), lang: str =
                 return JSONResponse({"error": "ffmpeg not installed. Install ffmpeg to process web audio."}, status_code=400)
             wav_path = src_path
         else:
-            wav_path = _convert_to_wav16k_mono(src_path)
+            wav_path = await run_in_threadpool(_convert_to_wav16k_mono, src_path)
 
         # Transcribe
-        text = _transcribe_wav(wav_path, lang)
+        text = await run_in_threadpool(_transcribe_wav, wav_path, lang)
         web_id = request.cookies.get("jai_web_id") or "anon"
         username = f"web:{web_id}"
         if username not in ja_sessions:
@@ -441,8 +539,8 @@ async def api_voice(request: Request, file: UploadFile = File(...), lang: str =
         if special is not None:
             result = special
         else:
-            result = execute_command(text, session, suppress_tts=True)
-        result = _ensure_lang(result, desired_lang)
+            result = await run_in_threadpool(execute_command, text, session, suppress_tts=True)
+        result = await run_in_threadpool(_ensure_lang, result, desired_lang)
         return {"transcript": text, "response": result, "requestId": rid}
     finally:
         try:
@@ -454,7 +552,7 @@ async def api_voice(request: Request, file: UploadFile = File(...), lang: str =
 class AutonomousRequest(BaseModel):
     text: str
     autonomous: bool = False
-    context: dict = {}
+    context: dict = Field(default_factory=dict)
 
 class FeedbackRequest(BaseModel):
     task_id: str
@@ -466,8 +564,8 @@ class IntegrationRequest(BaseModel):
     type: str
     auth_type: str
     endpoint: str
-    auth_data: dict = {}
-    headers: dict = {}
+    auth_data: dict = Field(default_factory=dict)
+    headers: dict = Field(default_factory=dict)
     enabled: bool = True
     rate_limit: int = 100
     timeout: int = 30
@@ -475,7 +573,7 @@ class IntegrationRequest(BaseModel):
 class IntegrationActionRequest(BaseModel):
     integration_id: str
     action_type: str
-    parameters: dict = {}
+    parameters: dict = Field(default_factory=dict)
     target_endpoint: str = None
 
 class EmailCategory(BaseModel):
@@ -491,14 +589,16 @@ class EmailLabelRequest(BaseModel):
     priority: str = "normal"
 
 class AutoReplyConfigRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     enabled: bool = True
     max_replies_per_hour: int = 10
     delay_seconds: int = 30
     confidence_threshold: float = 0.7
-    auto_reply_categories: List[str] = ["work", "finance", "health", "urgent"]
-    exclude_senders: List[str] = ["noreply@", "no-reply@", "spam@"]
+    auto_reply_categories: List[str] = Field(default_factory=lambda: ["work", "finance", "health", "urgent"])
+    exclude_senders: List[str] = Field(default_factory=lambda: ["noreply@", "no-reply@", "spam@"])
     working_hours_only: bool = True
-    working_hours: List[int] = [9, 17]
+    working_hours: Tuple[int, int] = (9, 17)
     timezone: str = "UTC"
 
 class IncomingEmailRequest(BaseModel):
@@ -509,23 +609,38 @@ class IncomingEmailRequest(BaseModel):
     date: str
     thread_id: str = None
 
+def _preload_page(filename: str):
+    """Read a web_static page once at startup; (bytes, etag) or None if missing."""
+    path = os.path.join(BASE_DIR, "apps", "web_static", filename)
+    try:
+        with open(path, "rb") as f:
+            body = f.read()
+    except OSError:
+        return None
+    return body, '"%s"' % hashlib.md5(body).hexdigest()
+
+def _page_response(request: Request, page, missing_html: str):
+    if page is None:
+        return HTMLResponse(missing_html, status_code=404)
+    body, etag = page
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="text/html", headers=headers)
+
+_AUTONOMOUS_PAGE = _preload_page("autonomous.html")
+_EMAIL_CATEGORIZER_PAGE = _preload_page("email_categorizer.html")
+_AUTO_REPLY_PAGE = _preload_page("auto_reply.html")
+
 @app.get("/autonomous", response_class=HTMLResponse)
 async def autonomous_interface(request: Request):
     """Serve the autonomous interface"""
-    path = os.path.join(BASE_DIR, "apps", "web_static", "autonomous.html")
-    if os.path.exists(path):
-        return FileResponse(path)
-    else:
-        return HTMLResponse("<h1>Autonomous interface not found</h1>", status_code=404)
+    return _page_response(request, _AUTONOMOUS_PAGE, "<h1>Autonomous interface not found</h1>")
 
 @app.get("/email-categorizer", response_class=HTMLResponse)
 async def email_categorizer_interface(request: Request):
     """Serve the email categorizer interface"""
-    path = os.path.join(BASE_DIR, "apps", "web_static", "email_categorizer.html")
-    if os.path.exists(path):
-        return FileResponse(path)
-    else:
-        return HTMLResponse("<h1>Email categorizer interface not found</h1>", status_code=404)
+    return _page_response(request, _EMAIL_CATEGORIZER_PAGE, "<h1>Email categorizer interface not found</h1>")
 
 @app.post("/api/autonomous/process")
 async def autonomous_process(req: AutonomousRequest, request: Request):
@@ -573,14 +688,14 @@ async def emergency_stop():
         return {"success": False, "message": "Autonomous system not available"}
     
     try:
-        # Cancel all active tasks
-        active_tasks = list(jai_autonomous.active_tasks.keys())
-        for task_id in active_tasks:
-            task = jai_autonomous.active_tasks[task_id]
-            task.status = jai_autonomous.TaskStatus.CANCELLED
-            del jai_autonomous.active_tasks[task_id]
+        # Swap in a fresh dict, then cancel everything held by the old one
+        cancelled_tasks = jai_autonomous.active_tasks
+        jai_autonomous.active_tasks = {}
+        cancelled = TaskStatus.CANCELLED
+        for task in cancelled_tasks.values():
+            task.status = cancelled
         
-        return {"success": True, "message": f"Emergency stop executed. Cancelled {len(active_tasks)} tasks."}
+        return {"success": True, "message": f"Emergency stop executed. Cancelled {len(cancelled_tasks)} tasks."}
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
@@ -609,24 +724,95 @@ async def get_active_tasks():
     except Exception as e:
         return {"error": f"Error: {str(e)}"}
 
+def _dumps_export(obj):
+    """Pretty-printed JSON for downloadable exports (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    return json.dumps(obj, indent=2, default=str)
+
+def _json_default(o):
+    return o.isoformat() if hasattr(o, "isoformat") else str(o)
+
+def _dumps_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+def _iter_json(value, depth=3):
+    """Yield `value` as JSON bytes, descending `depth` levels into dicts/lists so
+    large sections go out entry by entry instead of as one big string."""
+    if depth <= 0 or not value or not isinstance(value, (dict, list)):
+        yield _dumps_bytes(value)
+        return
+    if isinstance(value, dict):
+        yield b"{"
+        # Snapshot the entries so concurrent writers can't break iteration
+        for i, (key, item) in enumerate(list(value.items())):
+            yield (b"," if i else b"") + _dumps_bytes(str(key)) + b":"
+            yield from _iter_json(item, depth - 1)
+        yield b"}"
+    else:
+        yield b"["
+        for i, item in enumerate(list(value)):
+            if i:
+                yield b","
+            yield from _iter_json(item, depth - 1)
+        yield b"]"
+
+# Short-lived cache of encoded bodies for polled GET endpoints. Entries are
+# keyed per endpoint and tagged with their group's version; mutators bump the
+# version so a write is visible on the next poll, the TTL covers the rest.
+_GET_CACHE_TTL = 1.0
+_get_cache = {}
+_cache_versions = {"auto_reply": 0, "integrations": 0, "security": 0}
+
+def _cache_invalidate(group: str) -> None:
+    _cache_versions[group] += 1
+
+def _cache_lookup(key: str, group: str):
+    entry = _get_cache.get(key)
+    if entry is None:
+        return None
+    version, stored_at, body = entry
+    if version != _cache_versions[group] or time.monotonic() - stored_at >= _GET_CACHE_TTL:
+        return None
+    return Response(content=body, media_type="application/json")
+
+def _cache_store(key: str, group: str, payload) -> Response:
+    body = _dumps_bytes(payload)
+    _get_cache[key] = (_cache_versions[group], time.monotonic(), body)
+    return Response(content=body, media_type="application/json")
+
+# Upper bound on /api/autonomous/task-history?limit=. The history is not
+# streamed: at this size one serialized body is cheap, and building it first
+# keeps the {"error": ...} fallback instead of a half-sent JSON array.
+_TASK_HISTORY_MAX_LIMIT = 500
+
 @app.get("/api/autonomous/task-history")
-async def get_task_history():
+async def get_task_history(limit: int = 50):
     """Get task history"""
     if not jai_autonomous:
         return {"error": "Autonomous system not available"}
     
     try:
-        history = []
-        for task in jai_autonomous.task_history[-50:]:  # Last 50 tasks
-            history.append({
-                "id": task.id,
-                "intent": task.intent.intent_type.value,
-                "status": task.status.value,
-                "created_at": task.created_at.isoformat(),
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                "error": task.error
-            })
-        return history
+        limit = min(limit, _TASK_HISTORY_MAX_LIMIT)
+        tasks = jai_autonomous.task_history[-limit:] if limit > 0 else []
+        # Build every row before responding, so a bad task still yields the
+        # {"error": ...} body rather than a truncated JSON array
+        history = [{
+            "id": task.id,
+            "intent": task.intent.intent_type.value,
+            "status": task.status.value,
+            "created_at": task.created_at,
+            "completed_at": task.completed_at,
+            "error": task.error
+        } for task in tasks]
+        return Response(content=_dumps_bytes(history), media_type="application/json")
     except Exception as e:
         return {"error": f"Error: {str(e)}"}
 
@@ -681,8 +867,7 @@ async def export_learning_data():
     
     try:
         insights = learning_system.get_learning_insights()
-        import json
-        data = json.dumps(insights, indent=2, default=str)
+        data = _dumps_export(insights)
         from fastapi.responses import Response
         return Response(
             content=data,
@@ -874,9 +1059,9 @@ async def export_learning_data():
         
         data = email_categorizer.export_learning_data()
         
-        from fastapi.responses import Response
-        return Response(
-            content=json.dumps(data, indent=2, default=str),
+        # export -> data -> section -> entries: stream down to individual entries
+        return StreamingResponse(
+            _iter_json(data, depth=3),
             media_type="application/json",
             headers={"Content-Disposition": "attachment; filename=email_learning_data.json"}
         )
@@ -904,6 +1089,7 @@ async def process_auto_reply(request: IncomingEmailRequest):
         
         # Process email and generate auto-reply
         result = await auto_reply_engine.process_incoming_email(email_content)
+        _cache_invalidate("auto_reply")
         
         return result
         
@@ -913,17 +1099,20 @@ async def process_auto_reply(request: IncomingEmailRequest):
 @app.get("/api/auto-reply/config")
 async def get_auto_reply_config():
     """Get current auto-reply configuration"""
+    cached = _cache_lookup("auto-reply/config", "auto_reply")
+    if cached is not None:
+        return cached
     try:
         if not auto_reply_engine:
             return {"error": "Auto-reply engine not available"}
         
         stats = auto_reply_engine.get_conversation_stats()
-        return {
+        return _cache_store("auto-reply/config", "auto_reply", {
             "success": True,
             "config": stats.get("config", {}),
             "stats": stats,
             "model_loaded": stats.get("model_loaded", False)
-        }
+        })
         
     except Exception as e:
         return {"success": False, "error": f"Failed to get config: {str(e)}"}
@@ -935,11 +1124,11 @@ async def update_auto_reply_config(request: AutoReplyConfigRequest):
         if not auto_reply_engine:
             return {"success": False, "error": "Auto-reply engine not available"}
         
-        # Convert to dict and update config
-        config_dict = request.dict()
-        config_dict["working_hours"] = tuple(config_dict["working_hours"])
+        # working_hours is already validated into a tuple
+        config_dict = request.model_dump()
         
         auto_reply_engine.update_config(config_dict)
+        _cache_invalidate("auto_reply")
         
         return {
             "success": True,
@@ -953,18 +1142,21 @@ async def update_auto_reply_config(request: AutoReplyConfigRequest):
 @app.get("/api/auto-reply/conversations")
 async def get_conversations():
     """Get conversation history and statistics"""
+    cached = _cache_lookup("auto-reply/conversations", "auto_reply")
+    if cached is not None:
+        return cached
     try:
         if not auto_reply_engine:
             return {"error": "Auto-reply engine not available"}
         
         stats = auto_reply_engine.get_conversation_stats()
         
-        return {
+        return _cache_store("auto-reply/conversations", "auto_reply", {
             "success": True,
             "stats": stats,
-            "conversations": list(auto_reply_engine.conversations.keys())[:10],  # Last 10 conversations
+            "conversations": list(islice(auto_reply_engine.conversations, 10)),  # First 10 conversation ids
             "total_conversations": len(auto_reply_engine.conversations)
-        }
+        })
         
     except Exception as e:
         return {"success": False, "error": f"Failed to get conversations: {str(e)}"}
@@ -1021,20 +1213,21 @@ async def batch_process_auto_reply(request: dict):
             return {"success": False, "error": "Auto-reply engine not available"}
         
         emails_data = request.get("emails", [])
-        results = []
+        emails = []
         
         for email_data in emails_data:
-            email_content = EmailContent(
+            emails.append(EmailContent(
                 message_id=email_data.get("message_id", ""),
                 subject=email_data.get("subject", ""),
                 sender=email_data.get("sender", ""),
                 body=email_data.get("body", ""),
                 date=email_data.get("date", datetime.now().isoformat()),
                 thread_id=email_data.get("thread_id")
-            )
-            
-            result = await auto_reply_engine.process_incoming_email(email_content)
-            results.append(result)
+            ))
+        
+        # Conversation history is persisted once for the whole batch
+        results = await auto_reply_engine.process_incoming_emails(emails)
+        _cache_invalidate("auto_reply")
         
         processed_count = len([r for r in results if r.get("success", False)])
         auto_replied_count = len([r for r in results if r.get("auto_replied", False)])
@@ -1052,22 +1245,21 @@ async def batch_process_auto_reply(request: dict):
 @app.get("/auto-reply", response_class=HTMLResponse)
 async def auto_reply_interface(request: Request):
     """Serve auto-reply interface"""
-    path = os.path.join(BASE_DIR, "apps", "web_static", "auto_reply.html")
-    if os.path.exists(path):
-        return FileResponse(path)
-    else:
-        return HTMLResponse("<h1>Auto-reply interface not found</h1>", status_code=404)
+    return _page_response(request, _AUTO_REPLY_PAGE, "<h1>Auto-reply interface not found</h1>")
 
 # Security Endpoints
 @app.get("/api/security/config")
 async def get_security_config():
     """Get security configuration"""
+    cached = _cache_lookup("security/config", "security")
+    if cached is not None:
+        return cached
     try:
         if not SECURITY_AVAILABLE:
             return {"error": "Security system not available"}
         
-        config = get_security_config()
-        return {
+        config = load_security_config()
+        return _cache_store("security/config", "security", {
             "success": True,
             "config": config,
             "security_level": config.get("security_level", "medium"),
@@ -1077,7 +1269,7 @@ async def get_security_config():
                 "rate_limiting": config.get("rate_limiting", False),
                 "content_scanning": config.get("content_scanning", False)
             }
-        }
+        })
     except Exception as e:
         return {"success": False, "error": f"Security config error: {str(e)}"}
 
@@ -1091,7 +1283,7 @@ async def validate_api_scopes(request: dict):
         service = request.get("service", "")
         scopes = request.get("scopes", [])
         
-        is_valid, issues = validate_api_scopes(service, scopes)
+        is_valid, issues = check_api_scopes(service, scopes)
         
         return {
             "success": is_valid,
@@ -1099,7 +1291,7 @@ async def validate_api_scopes(request: dict):
             "requested_scopes": scopes,
             "valid": is_valid,
             "issues": issues,
-            "minimal_required": get_security_config().get("minimal_scopes", {}).get(service, [])
+            "minimal_required": load_security_config().get("minimal_scopes", {}).get(service, [])
         }
     except Exception as e:
         return {"success": False, "error": f"Scope validation error: {str(e)}"}
@@ -1109,14 +1301,14 @@ async def check_content_security(request: dict):
     """Check content for security issues"""
     try:
         content = request.get("content", "")
-        is_safe, issues = check_content_security(content)
+        is_safe, issues = scan_content_security(content)
         
         return {
             "success": True,
             "content_safe": is_safe,
             "issues": issues,
             "content_length": len(content),
-            "checked_patterns": len(get_security_config().get("suspicious_patterns", []))
+            "checked_patterns": len(load_security_config().get("suspicious_patterns", []))
         }
     except Exception as e:
         return {"success": False, "error": f"Content check error: {str(e)}"}
@@ -1170,7 +1362,9 @@ async def add_integration(req: IntegrationRequest):
         return {"success": False, "message": "Integration agent not available"}
     
     try:
-        integration_id = f"int_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(req.name)}"
+        # blake2b is stable across restarts, unlike the salted built-in hash()
+        name_digest = hashlib.blake2b(req.name.encode("utf-8"), digest_size=8).hexdigest()
+        integration_id = f"int_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{name_digest}"
         
         config = IntegrationConfig(
             integration_id=integration_id,
@@ -1186,6 +1380,7 @@ async def add_integration(req: IntegrationRequest):
         )
         
         success = integration_agent.add_integration(config)
+        _cache_invalidate("integrations")
         if success:
             return {"success": True, "integration_id": integration_id, "message": "Integration added successfully"}
         else:
@@ -1202,6 +1397,7 @@ async def remove_integration(integration_id: str):
     
     try:
         success = integration_agent.remove_integration(integration_id)
+        _cache_invalidate("integrations")
         if success:
             return {"success": True, "message": "Integration removed successfully"}
         else:
@@ -1279,30 +1475,67 @@ async def get_integration_status():
     if not integration_agent:
         return {"error": "Integration agent not available"}
     
+    cached = _cache_lookup("integrations/status", "integrations")
+    if cached is not None:
+        return cached
     try:
-        return integration_agent.get_integration_status()
+        return _cache_store("integrations/status", "integrations", integration_agent.get_integration_status())
     except Exception as e:
         return {"error": f"Error: {str(e)}"}
 
+def _startup_banner() -> str:
+    lines = [
+        "🚀 JAI Assistant Server Starting...",
+        "📧 Available Features:",
+        "   ✅ Web Interface: http://localhost:8080",
+        "   ✅ Email Categorizer: /email-categorizer",
+        "   ✅ Auto-Reply System: /auto-reply",
+        "   ✅ Gmail Integration: Available",
+        "   ✅ Voice Recognition: Available",
+        "   ✅ AI Responses: English Only (Auto-Translation)",
+        "\n🔧 Server Configuration:",
+        "   🌐 Host: http://localhost:8080",
+        "   📝 Logs: jai_assistant.log",
+        "   🔊 TTS: English responses only",
+        "\n🎯 Starting server...",
+    ]
+    banner = "\n".join(lines) + "\n"
+    # Legacy Windows consoles (cp1252 etc.) can't encode the emoji; drop them
+    # up front instead of failing inside print()
+    encoding = getattr(sys.stdout, "encoding", None) or "ascii"
+    try:
+        banner.encode(encoding)
+    except (UnicodeEncodeError, LookupError):
+        banner = re.sub(r"[^\x00-\x7f]+ ?", "", banner)
+    return banner
+
+def _worker_count() -> int:
+    """JAI_WORKERS as a worker count; unset or non-numeric values mean 1"""
+    raw = os.environ.get("JAI_WORKERS", "").strip()
+    if not raw:
+        return 1
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        print(f"Warning: ignoring JAI_WORKERS={raw!r} (not a number); using 1 worker")
+        return 1
+
 if __name__ == "__main__":
     import uvicorn
-    print("🚀 JAI Assistant Server Starting...")
-    print("📧 Available Features:")
-    print("   ✅ Web Interface: http://localhost:8080")
-    print("   ✅ Email Categorizer: /email-categorizer")
-    print("   ✅ Auto-Reply System: /auto-reply")
-    print("   ✅ Gmail Integration: Available")
-    print("   ✅ Voice Recognition: Available")
-    print("   ✅ AI Responses: English Only (Auto-Translation)")
-    print("\n🔧 Server Configuration:")
-    print("   🌐 Host: http://localhost:8080")
-    print("   📝 Logs: jai_assistant.log")
-    print("   🔊 TTS: English responses only")
-    print("\n🎯 Starting server...")
+    sys.stdout.write(_startup_banner())
+    sys.stdout.flush()
     
+    # Web sessions live in this process's memory, so extra workers are opt-in
+    # (JAI_WORKERS) and only suit deployments that don't rely on them.
+    # "auto" picks uvloop/httptools when installed (uvicorn[standard]; uvloop
+    # is unavailable on Windows) and falls back to asyncio/h11.
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8080,
-        log_level="info"
+        workers=_worker_count(),
+        loop="auto",
+        http="auto",
+        log_level="info",
+        access_log=os.environ.get("JAI_ACCESS_LOG", "").lower() in {"1", "true", "yes"}
     )
\ No newline at end of file
@@ -1,97 +1,258 @@
+import atexit
+import re
 import sqlite3
-from datetime import datetime
+import threading
+import time
 import json
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# One connection per (thread, db file), shared by every JAIMemory on that thread.
+# Every user session builds its own JAIMemory, so without this each session
+# pays a connect + schema check and threads end up sharing one cursor.
+_tls = threading.local()
+_open_conns = []
+_open_conns_lock = threading.Lock()
+
+# Statement text lives in module constants so every call hands sqlite3 the
+# same string object and hits the connection's prepared-statement cache.
+_STATEMENT_CACHE_SIZE = 256
+_SQL_INSERT_SHORT = "INSERT INTO short_term (timestamp, content) VALUES (?, ?)"
+_SQL_SELECT_SHORT = "SELECT id, timestamp, content FROM short_term ORDER BY timestamp DESC LIMIT ?"
+_SQL_DELETE_SHORT = "DELETE FROM short_term WHERE id = ?"
+_SQL_INSERT_LONG = "INSERT INTO long_term (key, value, timestamp, importance) VALUES (?, ?, ?, ?)"
+_SQL_UPSERT_LONG = (
+    "INSERT INTO long_term (key, value, timestamp, importance) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, timestamp = excluded.timestamp"
+)
+_SQL_UPDATE_LONG = "UPDATE long_term SET value = ?, timestamp = ? WHERE key = ?"
+_SQL_DELETE_LONG = "DELETE FROM long_term WHERE key = ?"
+_SQL_RECALL_LONG = "SELECT value FROM long_term WHERE key = ?"
+_SQL_SELECT_LONG = (
+    "SELECT key, value, timestamp, importance FROM long_term WHERE importance >= ? ORDER BY importance DESC"
+)
+_SQL_SEARCH_LONG = "SELECT key, value FROM long_term WHERE key LIKE ? OR value LIKE ?"
+_SQL_SEARCH_LONG_FTS = (
+    "SELECT l.key, l.value FROM long_term_fts f JOIN long_term l ON l.id = f.rowid "
+    "WHERE long_term_fts MATCH ? ORDER BY f.rank"
+)
+
+# Full-text index over long_term kept in sync by triggers (external content table)
+_FTS_SCHEMA = '''
+    CREATE VIRTUAL TABLE long_term_fts USING fts5(
+        key, value, content='long_term', content_rowid='id', tokenize='porter unicode61'
+    );
+    CREATE TRIGGER IF NOT EXISTS long_term_ai AFTER INSERT ON long_term BEGIN
+        INSERT INTO long_term_fts(rowid, key, value) VALUES (new.id, new.key, new.value);
+    END;
+    CREATE TRIGGER IF NOT EXISTS long_term_ad AFTER DELETE ON long_term BEGIN
+        INSERT INTO long_term_fts(long_term_fts, rowid, key, value) VALUES ('delete', old.id, old.key, old.value);
+    END;
+    CREATE TRIGGER IF NOT EXISTS long_term_au AFTER UPDATE ON long_term BEGIN
+        INSERT INTO long_term_fts(long_term_fts, rowid, key, value) VALUES ('delete', old.id, old.key, old.value);
+        INSERT INTO long_term_fts(rowid, key, value) VALUES (new.id, new.key, new.value);
+    END;
+    INSERT INTO long_term_fts(long_term_fts) VALUES ('rebuild');
+'''
+_WORD_RE = re.compile(r"\w+")
+
+
+# Timestamps only have second resolution, so the formatted string is reused
+# for every write within the same second
+_ts_cache = (0, "")
+
+
+def _now_str():
+    global _ts_cache
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        _ts_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _ts_cache[1]
+
+
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+def _decode_content(raw):
+    # add_short_term only JSON-encodes dicts, so anything else is returned as
+    # stored without paying for a failed json.loads
+    if isinstance(raw, str) and raw.startswith("{"):
+        try:
+            return _loads(raw)
+        except ValueError:
+            pass
+    return raw
+
+
+def _configure(conn):
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    # Writers on other threads wait for the lock instead of raising
+    # "database is locked"; WAL readers never block on them
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+def _thread_conn(db_path):
+    conns = getattr(_tls, "conns", None)
+    if conns is None:
+        conns = _tls.conns = {}
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = _configure(sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None, cached_statements=_STATEMENT_CACHE_SIZE))
+        conns[db_path] = conn
+        with _open_conns_lock:
+            _open_conns.append(conn)
+    return conn
+
+
+@atexit.register
+def _close_all():
+    with _open_conns_lock:
+        while _open_conns:
+            try:
+                _open_conns.pop().close()
+            except Exception:
+                pass
+
 
 class JAIMemory:
     def __init__(self, db_path="jai_memory.db"):
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)  # Allow multi-threading
-        self.cursor = self.conn.cursor()
+        self.db_path = db_path
+        # ":memory:" databases only exist on the connection that made them
+        self._memory_conn = (
+            sqlite3.connect(db_path, check_same_thread=False, isolation_level=None,
+                            cached_statements=_STATEMENT_CACHE_SIZE)
+            if db_path == ":memory:" else None
+        )
         self._create_tables()
 
+    @property
+    def conn(self):
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return _thread_conn(self.db_path)
+
     def _create_tables(self):
-        self.cursor.execute('''
+        # Single script inside one transaction: one commit instead of one per table
+        self.conn.executescript('''
+            BEGIN;
             CREATE TABLE IF NOT EXISTS short_term (
                 id INTEGER PRIMARY KEY,
                 timestamp TEXT,
                 content TEXT
-            )
-        ''')
-        self.cursor.execute('''
+            );
             CREATE TABLE IF NOT EXISTS long_term (
                 id INTEGER PRIMARY KEY,
                 key TEXT UNIQUE,
                 value TEXT,
                 timestamp TEXT,
                 importance REAL
-            )
+            );
+            -- get_short_term / get_long_term read newest / most important first
+            CREATE INDEX IF NOT EXISTS idx_short_term_timestamp ON short_term(timestamp DESC);
+            CREATE INDEX IF NOT EXISTS idx_long_term_importance ON long_term(importance DESC);
+            COMMIT;
         ''')
-        self.conn.commit()
+        self._fts = self._create_fts()
+
+    def _create_fts(self):
+        """Create the FTS5 index on first use; False if SQLite lacks FTS5."""
+        conn = self.conn
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'long_term_fts'").fetchone():
+            return True
+        try:
+            conn.executescript("BEGIN;" + _FTS_SCHEMA + "COMMIT;")
+            return True
+        except sqlite3.OperationalError:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return False
 
     def add_short_term(self, content):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = _now_str()
         # If content is a dict, serialize to JSON
         if isinstance(content, dict):
-            content = json.dumps(content)
-        self.cursor.execute("INSERT INTO short_term (timestamp, content) VALUES (?, ?)", (timestamp, content))
-        self.conn.commit()
-        return self.cursor.lastrowid
+            content = _dumps(content)
+        cur = self.conn.execute(_SQL_INSERT_SHORT, (timestamp, content))
+        return cur.lastrowid
 
     def get_short_term(self, limit=10):
-        self.cursor.execute("SELECT * FROM short_term ORDER BY timestamp DESC LIMIT ?", (limit,))
-        results = []
-        for row in self.cursor.fetchall():
-            try:
-                # Try to deserialize content as JSON
-                content = json.loads(row[2])
-            except json.JSONDecodeError:
-                content = row[2]  # Fallback to raw string
-            results.append({"id": row[0], "timestamp": row[1], "content": content})
-        return results
+        rows = self.conn.execute(_SQL_SELECT_SHORT, (limit,)).fetchall()
+        return [{"id": row[0], "timestamp": row[1], "content": _decode_content(row[2])} for row in rows]
 
     def remember_long_term(self, key, value, importance=0.5):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = _now_str()
         try:
-            self.cursor.execute("INSERT INTO long_term (key, value, timestamp, importance) VALUES (?, ?, ?, ?)",
-                              (key, value, timestamp, importance))
-            self.conn.commit()
-            return self.cursor.lastrowid
+            cur = self.conn.execute(_SQL_INSERT_LONG, (key, value, timestamp, importance))
+            return cur.lastrowid
         except sqlite3.IntegrityError:
             return False  # Key already exists
 
+    def upsert_long_term(self, key, value, importance=0.5):
+        # Insert-or-update in one statement (and one commit); an existing key
+        # keeps its importance, matching update_long_term
+        timestamp = _now_str()
+        self.conn.execute(_SQL_UPSERT_LONG, (key, value, timestamp, importance))
+        return True
+
     def update_long_term(self, key, new_value):
-        self.cursor.execute("UPDATE long_term SET value = ?, timestamp = ? WHERE key = ?",
-                          (new_value, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), key))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        cur = self.conn.execute(_SQL_UPDATE_LONG, (new_value, _now_str(), key))
+        return cur.rowcount > 0
 
     def forget_long_term(self, key):
-        self.cursor.execute("DELETE FROM long_term WHERE key = ?", (key,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        cur = self.conn.execute(_SQL_DELETE_LONG, (key,))
+        return cur.rowcount > 0
 
     def recall_long_term(self, key):
-        self.cursor.execute("SELECT value FROM long_term WHERE key = ?", (key,))
-        result = self.cursor.fetchone()
+        cur = self.conn.execute(_SQL_RECALL_LONG, (key,))
+        result = cur.fetchone()
         return result[0] if result else None
 
     def get_long_term(self, min_importance=0.0):
-        self.cursor.execute("SELECT key, value, timestamp, importance FROM long_term WHERE importance >= ? ORDER BY importance DESC",
-                          (min_importance,))
-        return [{"key": row[0], "value": row[1], "timestamp": row[2], "importance": row[3]} for row in self.cursor.fetchall()]
+        cur = self.conn.execute(_SQL_SELECT_LONG, (min_importance,))
+        return [{"key": row[0], "value": row[1], "timestamp": row[2], "importance": row[3]} for row in cur.fetchall()]
 
     def forget_short_term(self, short_term_id):
-        self.cursor.execute("DELETE FROM short_term WHERE id = ?", (short_term_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        cur = self.conn.execute(_SQL_DELETE_SHORT, (short_term_id,))
+        return cur.rowcount > 0
 
     def search_memories(self, keyword):
-        # Search long-term memory for keyword matches in key or value
-        self.cursor.execute(
-            "SELECT key, value FROM long_term WHERE key LIKE ? OR value LIKE ?", 
-            (f"%{keyword}%", f"%{keyword}%")
-        )
-        results = [{"key": row[0], "value": row[1]} for row in self.cursor.fetchall()]
+        # Search long-term memory for keyword matches in key or value: indexed
+        # word-prefix hits first (ranked), then any substring matches they missed,
+        # so results are always a superset of the plain LIKE scan
+        results = []
+        seen = set()
+        words = _WORD_RE.findall(keyword or "")
+        if self._fts and words:
+            query = " ".join(f'"{w}"*' for w in words)
+            try:
+                rows = self.conn.execute(_SQL_SEARCH_LONG_FTS, (query,)).fetchall()
+            except sqlite3.OperationalError:
+                rows = []
+            for key, value in rows:
+                seen.add(key)
+                results.append({"key": key, "value": value})
+        cur = self.conn.execute(_SQL_SEARCH_LONG, (f"%{keyword}%", f"%{keyword}%"))
+        for key, value in cur.fetchall():
+            if key not in seen:
+                results.append({"key": key, "value": value})
         return results
 
     def __del__(self):
-        self.conn.close()
+        # Thread connections are shared and closed at exit; only a private
+        # in-memory connection belongs to this instance
+        conn = getattr(self, "_memory_conn", None)
+        if conn is not None:
+            conn.close()
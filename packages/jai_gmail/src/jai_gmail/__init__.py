@@ -1,27 +1,45 @@
 """
 JAI Gmail: Secure OAuth authentication and email sending helpers using Gmail API.
+
+This is the single GmailOAuth implementation; the root-level gmail_oauth.py
+module re-exports it. Tokens go to the encrypted jai_security store when it is
+available, or to a plain JSON token file (use_secure_storage=False).
 """
 
 import os
-import pickle
+import re
+import json
+import time
+import threading
+import asyncio
+import random
 import base64
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional, List, Dict, Any
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Union
+
+# The Google client stack is heavy to import, so it is only probed here and
+# imported on first use (most JAI processes never send an email)
+GOOGLE_APIS_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ('google_auth_oauthlib', 'googleapiclient')
+)
 
+# httplib2.Http is not thread-safe, so connections are pooled per thread
+_http_local = threading.local()
+
+# pybase64 (SIMD) is a drop-in for the stdlib codec on large messages
 try:
-    from google.auth.transport.requests import Request
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-    GOOGLE_APIS_AVAILABLE = True
+    import pybase64 as _b64
 except ImportError:
-    GOOGLE_APIS_AVAILABLE = False
+    _b64 = base64
 
 # Import security manager
 try:
-    from jai_security import get_secure_token, store_secure_token, validate_api_scopes, SecurityConfig
+    from jai_security import get_secure_token, store_secure_token, validate_api_scopes
     SECURITY_AVAILABLE = True
 except ImportError:
     SECURITY_AVAILABLE = False
@@ -29,6 +47,7 @@ except ImportError:
 __all__ = [
     "GmailOAuth",
     "send_gmail_email",
+    "send_gmail_email_async",
     "test_gmail_connection",
 ]
 
@@ -36,33 +55,175 @@ __version__ = "1.0.0"
 
 logger = logging.getLogger(__name__)
 
+
+# Gmail accepts at most 100 calls per batch request
+_BATCH_LIMIT = 100
+_RETRY_REASONS = ('servingLimitExceeded', 'rateLimitExceeded', 'userRateLimitExceeded')
+
+# The integration sends mail and never reads the mailbox
+_GMAIL_SCOPES = [
+    'https://www.googleapis.com/auth/gmail.send',
+    'https://www.googleapis.com/auth/gmail.compose',
+]
+
+# Token written by the old root-level gmail_oauth module (pickled, then migrated to JSON)
+_ROOT_TOKEN_FILE = 'token.json'
+
+# Seconds a successful test_connection() profile lookup is reused
+_PROFILE_TTL = 60
+
+# Content that is rejected by _validate_email_params (matched case-insensitively)
+_SUSPICIOUS_RE = re.compile(
+    r'password|secret|token|key|hack|exploit|<script>|javascript:|data:text/html',
+    re.IGNORECASE
+)
+
+# Shared pool for the blocking Google client / token I/O used by the async wrappers
+_io_pool = ThreadPoolExecutor(max_workers=64, thread_name_prefix='jai-gmail')
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Return True if a Gmail API error is a retryable quota/serving limit"""
+    if getattr(getattr(error, 'resp', None), 'status', None) == 429:
+        return True
+    content = getattr(error, 'content', b'') or b''
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    return any(reason in content for reason in _RETRY_REASONS)
+
+
+def _encode_message(message) -> str:
+    """Serialize a MIME message straight into a buffer and base64url-encode it"""
+    from io import BytesIO
+    from email.generator import BytesGenerator
+    buf = BytesIO()
+    BytesGenerator(buf, mangle_from_=False).flatten(message)
+    # The JSON request body needs str, so decode the (ASCII-only) base64 output once
+    return _b64.urlsafe_b64encode(buf.getbuffer()).decode('ascii')
+
+
+# Standard -> URL-safe base64 alphabet ('+' -> '-', '/' -> '_')
+_B64_TO_URLSAFE = bytes.maketrans(b'+/', b'-_')
+
+
+def _to_urlsafe(b64_data: Union[bytes, str]) -> str:
+    """Convert standard base64 to the URL-safe alphabet in one C pass (no re-encode)"""
+    if isinstance(b64_data, str):
+        b64_data = b64_data.encode('ascii')
+    return b64_data.translate(_B64_TO_URLSAFE, b'\r\n').decode('ascii')
+
+
+@lru_cache(maxsize=256)
+def _join_header(emails: Tuple[str, ...]) -> str:
+    """Join a recipient list for a To/Cc/Bcc header (memoized for reused audiences)"""
+    return ', '.join(emails)
+
+
+def _shared_http():
+    """Per-thread httplib2.Http reused across GmailOAuth instances for keep-alive"""
+    http = getattr(_http_local, 'http', None)
+    if http is None:
+        import httplib2
+        http = _http_local.http = httplib2.Http(timeout=30)
+    return http
+
+
+def _build_gmail_service(creds):
+    """Build the Gmail service over a pooled connection with the bundled discovery document"""
+    from googleapiclient.discovery import build
+    try:
+        from google_auth_httplib2 import AuthorizedHttp
+    except ImportError:
+        return build('gmail', 'v1', credentials=creds, cache_discovery=False, static_discovery=True)
+    authed_http = AuthorizedHttp(creds, http=_shared_http())
+    return build('gmail', 'v1', http=authed_http, cache_discovery=False, static_discovery=True)
+
+
 class GmailOAuth:
     """Handles secure Gmail OAuth authentication and email sending"""
 
-    def __init__(self, credentials_file: str = 'credentials.json', token_service: str = 'gmail'):
+    def __init__(self, credentials_file: str = 'credentials.json', token_service: str = 'gmail',
+                 use_secure_storage: Optional[bool] = None, token_file: Optional[str] = None):
+        """
+        Args:
+            credentials_file: OAuth client secrets downloaded from Google Cloud Console
+            token_service: Service name used for the encrypted token store
+            use_secure_storage: Use the jai_security encrypted token store;
+                None picks it whenever the security manager is available
+            token_file: JSON token file used when secure storage is off
+                (default: <credentials>_token.json, or the old root module's
+                token.json/token.pickle when one exists)
+        """
         self.credentials_file = credentials_file
         self.token_service = token_service
-        # Use minimal required scopes for security
-        self.scopes = SecurityConfig.MINIMAL_SCOPES.get('gmail', [
-            'https://www.googleapis.com/auth/gmail.send'
-        ])
+        self.scopes = list(_GMAIL_SCOPES)
+        if token_file is None:
+            root_pickle = os.path.splitext(_ROOT_TOKEN_FILE)[0] + '.pickle'
+            if use_secure_storage is None and (os.path.exists(_ROOT_TOKEN_FILE) or os.path.exists(root_pickle)):
+                # Keep users of the old root module on their token file instead of
+                # forcing a new OAuth consent; the pickle is migrated on first load
+                token_file = _ROOT_TOKEN_FILE
+                use_secure_storage = False
+            else:
+                token_file = credentials_file.replace('.json', '_token.json')
+        elif token_file.endswith('.pickle'):
+            # Old pickle paths are migrated to JSON on first load
+            token_file = token_file[:-len('.pickle')] + '.json'
+        self.token_file = token_file
+        self._scopes_set = frozenset(self.scopes)
         self.service = None
         self.creds = None
+        self._creds_loaded_at = 0.0
+        self._creds_expiry_ts = 0.0
+        # (fetched_at, test_connection result) reused for _PROFILE_TTL seconds
+        self._profile_cache: Optional[tuple] = None
+        # Serializes OAuth flows/refreshes when several threads authenticate at once
+        self._auth_lock = threading.Lock()
+        # Per-thread AuthorizedHttp; the async wrappers share one service across _io_pool
+        self._http_local = threading.local()
         
         if not GOOGLE_APIS_AVAILABLE:
             raise ImportError("Google APIs not available. Install: pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client")
         
-        if not SECURITY_AVAILABLE:
+        if use_secure_storage is None:
+            use_secure_storage = SECURITY_AVAILABLE
+        if use_secure_storage and not SECURITY_AVAILABLE:
             logger.warning("Security manager not available - using insecure token storage")
-            self.use_secure_storage = False
-        else:
-            self.use_secure_storage = True
+            use_secure_storage = False
+        self.use_secure_storage = use_secure_storage
 
     def authenticate(self) -> bool:
         """
         Authenticate with Gmail using secure OAuth 2.0 flow
         Returns True if authentication successful, False otherwise
         """
+        if self._creds_fresh():
+            return True
+        # Concurrent first calls wait for one flow/refresh instead of each starting one
+        with self._auth_lock:
+            if self._creds_fresh():
+                return True
+            return self._authenticate()
+    
+    def _creds_fresh(self) -> bool:
+        """True while the built service's cached credentials are still fresh"""
+        return self.service is not None and time.monotonic() < self._creds_expiry_ts - 60
+    
+    def _authorized_http(self):
+        """This thread's AuthorizedHttp for the current credentials (httplib2 is not thread-safe)"""
+        local = self._http_local
+        if not hasattr(local, 'http') or local.creds is not self.creds:
+            try:
+                from google_auth_httplib2 import AuthorizedHttp
+                local.http = AuthorizedHttp(self.creds, http=_shared_http())
+            except ImportError:
+                # execute(http=None) falls back to the service's own connection
+                local.http = None
+            local.creds = self.creds
+        return local.http
+    
+    def _authenticate(self) -> bool:
+        """authenticate() proper; the caller holds _auth_lock"""
         try:
             # Try to get existing secure token
             if self.use_secure_storage:
@@ -71,7 +232,7 @@ class GmailOAuth:
                 self.creds = self._get_legacy_token()
             
             # Validate token scopes
-            if self.creds:
+            if self.creds and self.use_secure_storage:
                 is_valid, excess_scopes = validate_api_scopes('gmail', self.scopes)
                 if not is_valid:
                     logger.warning(f"Token has excessive scopes: {excess_scopes}")
@@ -80,25 +241,36 @@ class GmailOAuth:
             # Check if credentials are valid and not expired
             creds_valid = True
             if self.creds and hasattr(self.creds, 'scopes'):
-                required_scopes = set(self.scopes)
-                token_scopes = set(self.creds.scopes)
-                missing_scopes = required_scopes - token_scopes
+                missing_scopes = self._scopes_set.difference(self.creds.scopes)
                 if missing_scopes:
                     logger.warning(f"Existing token missing required scopes: {missing_scopes}")
                     creds_valid = False
             
-            if self.creds and hasattr(self.creds, 'expired') and getattr(self.creds, 'expired', False):
-                logger.warning("Token has expired")
-                creds_valid = False
+            if self.creds and getattr(self.creds, 'expired', False):
+                if creds_valid and getattr(self.creds, 'refresh_token', None) and hasattr(self.creds, 'refresh'):
+                    from google.auth.transport.requests import Request
+                    logger.info("Refreshing expired credentials")
+                    self.creds.refresh(Request())
+                    self._store_creds()
+                else:
+                    logger.warning("Token has expired")
+                    creds_valid = False
             
             # If we have valid credentials, use them
             if self.creds and creds_valid:
                 logger.info("Using existing valid credentials")
-                self.service = build('gmail', 'v1', credentials=self.creds)
+                self.service = _build_gmail_service(self.creds)
+                self._mark_creds_loaded()
                 return True
             
             # If no valid credentials, start OAuth flow
+            if not os.path.exists(self.credentials_file):
+                logger.error(f"Credentials file not found: {self.credentials_file}")
+                logger.error("Please download credentials.json from Google Cloud Console")
+                return False
+            
             logger.info("Starting secure OAuth flow")
+            from google_auth_oauthlib.flow import InstalledAppFlow
             flow = InstalledAppFlow.from_client_secrets_file(
                 self.credentials_file, 
                 scopes=self.scopes,
@@ -109,19 +281,11 @@ class GmailOAuth:
             
             # Store credentials securely
             if self.creds:
-                if self.use_secure_storage:
-                    token_data = {
-                        'access_token': self.creds.token,
-                        'refresh_token': self.creds.refresh_token,
-                        'scopes': self.scopes,
-                        'expires_at': self.creds.expiry.isoformat() if self.creds.expiry else None
-                    }
-                    store_secure_token(self.token_service, token_data, self.scopes)
-                else:
-                    self._store_legacy_token()
+                self._store_creds()
                 
                 # Build Gmail service
-                self.service = build('gmail', 'v1', credentials=self.creds)
+                self.service = _build_gmail_service(self.creds)
+                self._mark_creds_loaded()
                 logger.info("Gmail authentication successful")
                 return True
             
@@ -139,35 +303,81 @@ class GmailOAuth:
                 pass
             return False
     
+    def _mark_creds_loaded(self):
+        """Remember when the current credentials expire so authenticate() can short-circuit"""
+        self._creds_loaded_at = time.monotonic()
+        expiry = getattr(self.creds, 'expiry', None)
+        if expiry is None:
+            self._creds_expiry_ts = float('inf')
+            return
+        now = datetime.now(timezone.utc)
+        if expiry.tzinfo is None:
+            now = now.replace(tzinfo=None)
+        self._creds_expiry_ts = self._creds_loaded_at + (expiry - now).total_seconds()
+    
+    async def authenticate_async(self) -> bool:
+        """Async wrapper for authenticate() that keeps the event loop free"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_io_pool, self.authenticate)
+    
+    def _store_creds(self):
+        """Persist the current credentials to the configured token storage"""
+        if self.use_secure_storage:
+            token_data = {
+                'access_token': self.creds.token,
+                'refresh_token': self.creds.refresh_token,
+                'scopes': self.scopes,
+                'expires_at': self.creds.expiry.isoformat() if self.creds.expiry else None
+            }
+            store_secure_token(self.token_service, token_data, self.scopes)
+        else:
+            self._store_legacy_token()
+    
     def _get_legacy_token(self):
         """Get legacy unencrypted token (for migration)"""
         try:
-            token_file = self.credentials_file.replace('.json', '_token.pickle')
-            if os.path.exists(token_file):
-                with open(token_file, 'rb') as token:
-                    return pickle.load(token)
+            self._migrate_pickle_token()
+            if os.path.exists(self.token_file):
+                from google.oauth2.credentials import Credentials
+                with open(self.token_file, 'r', encoding='utf-8') as token:
+                    return Credentials.from_authorized_user_info(json.load(token))
         except Exception:
             return None
     
+    def _migrate_pickle_token(self):
+        """One-shot migration of an old pickled legacy token to JSON"""
+        pickle_file = os.path.splitext(self.token_file)[0] + '.pickle'
+        if not os.path.exists(pickle_file) or os.path.exists(self.token_file):
+            return
+        try:
+            import pickle
+            with open(pickle_file, 'rb') as token:
+                self.creds = pickle.load(token)
+            self._store_legacy_token()
+            os.remove(pickle_file)
+            logger.info("Migrated pickled legacy token to JSON")
+        except Exception as e:
+            logger.warning(f"Failed to migrate pickled legacy token: {e}")
+    
     def _store_legacy_token(self):
         """Store legacy unencrypted token (deprecated)"""
         try:
-            token_file = self.credentials_file.replace('.json', '_token.pickle')
-            with open(token_file, 'wb') as token:
-                pickle.dump(self.creds, token)
+            with open(self.token_file, 'w', encoding='utf-8') as token:
+                token.write(self.creds.to_json())
             logger.warning("Using legacy unencrypted token storage - migrate to secure storage")
         except Exception as e:
             logger.error(f"Failed to store legacy token: {e}")
     
     def _delete_legacy_token(self):
-        """Delete legacy unencrypted token"""
+        """Delete legacy unencrypted token; returns True if a token file was removed"""
         try:
-            token_file = self.credentials_file.replace('.json', '_token.pickle')
-            if os.path.exists(token_file):
-                os.remove(token_file)
+            if os.path.exists(self.token_file):
+                os.remove(self.token_file)
                 logger.info("Removed legacy token file")
+                return True
         except Exception:
             pass
+        return False
 
     def send_email(self, to_email: str, subject: str, body: str,
                    cc_emails: Optional[List[str]] = None,
@@ -194,6 +404,8 @@ class GmailOAuth:
                     'error': 'Gmail authentication failed'
                 }
         
+        from googleapiclient.errors import HttpError
+        
         try:
             # Validate email parameters
             if not self._validate_email_params(to_email, subject, body):
@@ -202,26 +414,8 @@ class GmailOAuth:
                     'error': 'Invalid email parameters'
                 }
             
-            # Create email message
-            message = MIMEMultipart('alternative')
-            message['To'] = to_email
-            message['Subject'] = subject
-            
-            if cc_emails:
-                message['Cc'] = ', '.join(cc_emails)
-            if bcc_emails:
-                message['Bcc'] = ', '.join(bcc_emails)
-            
-            # Add body
-            if is_html:
-                html_part = MIMEText(body, 'html')
-                message.attach(html_part)
-            else:
-                text_part = MIMEText(body, 'plain')
-                message.attach(text_part)
-            
             # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            raw_message = self._build_raw_message(to_email, subject, body, cc_emails, bcc_emails, is_html)
             
             # Build send request
             send_request = {
@@ -232,7 +426,7 @@ class GmailOAuth:
             result = self.service.users().messages().send(
                 userId='me',
                 body=send_request
-            ).execute()
+            ).execute(http=self._authorized_http())
             
             logger.info(f"Email sent successfully. Message ID: {result.get('id')}")
             return {
@@ -256,6 +450,160 @@ class GmailOAuth:
                 'error': error_msg
             }
     
+    def send_raw_email(self, raw_message: Union[bytes, str]) -> Dict[str, Any]:
+        """
+        Send an already-built RFC 822 message that is standard-base64 encoded
+        
+        Callers that already hold base64 output (e.g. from another subsystem)
+        skip the decode/re-encode: the alphabet is translated in place.
+        Content validation is the caller's responsibility on this path.
+        """
+        if not self.service:
+            if not self.authenticate():
+                return {
+                    'success': False,
+                    'error': 'Gmail authentication failed'
+                }
+        
+        try:
+            result = self.service.users().messages().send(
+                userId='me',
+                body={'raw': _to_urlsafe(raw_message)}
+            ).execute(http=self._authorized_http())
+            
+            logger.info(f"Email sent successfully. Message ID: {result.get('id')}")
+            return {
+                'success': True,
+                'message_id': result.get('id'),
+                'message': 'Email sent successfully'
+            }
+        except Exception as e:
+            error_msg = f"Failed to send email: {str(e)}"
+            logger.error(error_msg)
+            return {
+                'success': False,
+                'error': error_msg
+            }
+    
+    async def send_email_async(self, to_email: str, subject: str, body: str,
+                               cc_emails: Optional[List[str]] = None,
+                               bcc_emails: Optional[List[str]] = None,
+                               is_html: bool = False) -> Dict[str, Any]:
+        """Async wrapper for send_email(); token I/O and the HTTPS call run in a worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _io_pool,
+            lambda: self.send_email(to_email, subject, body, cc_emails, bcc_emails, is_html)
+        )
+    
+    def send_emails_batch(self, messages: List[Dict[str, Any]],
+                          max_retries: int = 5) -> Dict[str, Dict[str, Any]]:
+        """
+        Send several emails using Gmail batch requests (up to 100 sends per HTTP call)
+        
+        Args:
+            messages: List of dicts with send_email arguments
+                (to_email, subject, body, cc_emails, bcc_emails, is_html)
+            max_retries: Retries with exponential backoff for rate-limited sends
+        
+        Returns:
+            Dictionary keyed by message index (as string) with send_email-style results
+        """
+        if not self.service:
+            if not self.authenticate():
+                return {
+                    str(i): {'success': False, 'error': 'Gmail authentication failed'}
+                    for i in range(len(messages))
+                }
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        raw_messages: Dict[str, str] = {}
+        for i, params in enumerate(messages):
+            request_id = str(i)
+            try:
+                if not self._validate_email_params(params.get('to_email'), params.get('subject'), params.get('body')):
+                    results[request_id] = {'success': False, 'error': 'Invalid email parameters'}
+                    continue
+                raw_messages[request_id] = self._build_raw_message(**params)
+            except Exception as e:
+                results[request_id] = {'success': False, 'error': f"Failed to send email: {str(e)}"}
+        
+        pending = list(raw_messages)
+        for start in range(0, len(pending), _BATCH_LIMIT):
+            chunk = pending[start:start + _BATCH_LIMIT]
+            delay = 1.0
+            for attempt in range(max_retries + 1):
+                chunk = self._execute_send_batch(chunk, raw_messages, results)
+                if not chunk or attempt == max_retries:
+                    break
+                logger.warning(f"Gmail rate limit hit, retrying {len(chunk)} sends in {delay:.0f}s")
+                time.sleep(delay + random.random())
+                delay *= 2
+            # Still throttled after the last retry; a whole-batch failure leaves no entry
+            for request_id in chunk:
+                results.setdefault(request_id, {'success': False, 'error': 'rate limited'})
+        
+        sent = sum(1 for r in results.values() if r.get('success'))
+        logger.info(f"Batch send complete: {sent}/{len(messages)} emails sent")
+        return results
+    
+    def _execute_send_batch(self, request_ids: List[str], raw_messages: Dict[str, str],
+                            results: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Execute one batch request; returns the request ids that were rate limited"""
+        throttled: List[str] = []
+        
+        def _collect_result(request_id, response, exception):
+            if exception is None:
+                results[request_id] = {
+                    'success': True,
+                    'message_id': response.get('id'),
+                    'message': 'Email sent successfully'
+                }
+                return
+            if _is_rate_limited(exception):
+                throttled.append(request_id)
+            results[request_id] = {
+                'success': False,
+                'error': f"Gmail API error: {str(exception)}"
+            }
+        
+        try:
+            batch = self.service.new_batch_http_request(callback=_collect_result)
+            messages_api = self.service.users().messages()
+            for request_id in request_ids:
+                batch.add(
+                    messages_api.send(userId='me', body={'raw': raw_messages[request_id]}),
+                    request_id=request_id
+                )
+            batch.execute(http=self._authorized_http())
+        except Exception as e:
+            if _is_rate_limited(e):
+                return list(request_ids)
+            error_msg = f"Failed to send email: {str(e)}"
+            logger.error(error_msg)
+            for request_id in request_ids:
+                results.setdefault(request_id, {'success': False, 'error': error_msg})
+        return throttled
+    
+    def _build_raw_message(self, to_email: str, subject: str, body: str,
+                           cc_emails: Optional[List[str]] = None,
+                           bcc_emails: Optional[List[str]] = None,
+                           is_html: bool = False) -> str:
+        """Build the MIME message and return it base64url-encoded for the Gmail API"""
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        message = MIMEMultipart('alternative')
+        message['To'] = to_email
+        message['Subject'] = subject
+        
+        if cc_emails:
+            message['Cc'] = _join_header(tuple(cc_emails))
+        if bcc_emails:
+            message['Bcc'] = _join_header(tuple(bcc_emails))
+        
+        message.attach(MIMEText(body, 'html' if is_html else 'plain'))
+        return _encode_message(message)
+    
     def _validate_email_params(self, to_email: str, subject: str, body: str) -> bool:
         """Validate email sending parameters for security"""
         # Basic email validation
@@ -269,21 +617,19 @@ class GmailOAuth:
             return False
         
         # Check for suspicious content
-        suspicious_patterns = [
-            'password', 'secret', 'token', 'key', 'hack', 'exploit',
-            '<script>', 'javascript:', 'data:text/html'
-        ]
-        
-        content_lower = (subject + ' ' + body).lower()
-        for pattern in suspicious_patterns:
-            if pattern in content_lower:
-                logger.warning(f"Suspicious content detected in email: {pattern}")
-                return False
+        match = _SUSPICIOUS_RE.search(subject) or _SUSPICIOUS_RE.search(body)
+        if match:
+            logger.warning(f"Suspicious content detected in email: {match.group(0).lower()}")
+            return False
         
         return True
     
     def test_connection(self) -> Dict[str, Any]:
-        """Test Gmail connection and authentication"""
+        """Test Gmail connection and authentication (profile cached for 60s)"""
+        cached = self._profile_cache
+        if cached and time.monotonic() - cached[0] < _PROFILE_TTL:
+            return dict(cached[1])
+        
         try:
             if not self.authenticate():
                 return {
@@ -292,15 +638,17 @@ class GmailOAuth:
                 }
             
             # Get user profile to test connection
-            profile = self.service.users().getProfile(userId='me').execute()
+            profile = self.service.users().getProfile(userId='me').execute(http=self._authorized_http())
             
-            return {
+            result = {
                 'success': True,
                 'email_address': profile.get('emailAddress'),
                 'messages_total': profile.get('messagesTotal'),
                 'history_id': profile.get('historyId'),
                 'storage_type': 'secure' if self.use_secure_storage else 'legacy'
             }
+            self._profile_cache = (time.monotonic(), result)
+            return dict(result)
             
         except Exception as e:
             return {
@@ -321,6 +669,8 @@ class GmailOAuth:
             if success:
                 self.creds = None
                 self.service = None
+                self._creds_expiry_ts = 0.0
+                self._profile_cache = None
                 logger.info("Gmail credentials revoked")
             
             return success
@@ -331,13 +681,19 @@ class GmailOAuth:
 
 # Global Gmail instance
 _gmail_client = None
+_gmail_client_lock = threading.Lock()
 
 def get_gmail_client() -> GmailOAuth:
     """Get or create Gmail client instance"""
     global _gmail_client
-    if _gmail_client is None:
-        _gmail_client = GmailOAuth()
-    return _gmail_client
+    client = _gmail_client
+    if client is None:
+        # Concurrent first calls must not build two clients (and two OAuth flows)
+        with _gmail_client_lock:
+            if _gmail_client is None:
+                _gmail_client = GmailOAuth()
+            client = _gmail_client
+    return client
 
 def send_gmail_email(to_email: str, subject: str, body: str,
                      cc_emails: Optional[List[str]] = None,
@@ -349,6 +705,16 @@ def send_gmail_email(to_email: str, subject: str, body: str,
     gmail = get_gmail_client()
     return gmail.send_email(to_email, subject, body, cc_emails, bcc_emails, is_html)
 
+async def send_gmail_email_async(to_email: str, subject: str, body: str,
+                                 cc_emails: Optional[List[str]] = None,
+                                 bcc_emails: Optional[List[str]] = None,
+                                 is_html: bool = False) -> Dict[str, Any]:
+    """
+    Async convenience function to send Gmail email without blocking the event loop
+    """
+    gmail = get_gmail_client()
+    return await gmail.send_email_async(to_email, subject, body, cc_emails, bcc_emails, is_html)
+
 def test_gmail_connection() -> Dict[str, Any]:
     """Test Gmail connection"""
     gmail = get_gmail_client()
@@ -15,26 +15,36 @@ BASE_PERSONA = (
     "Keep responses clear and well-structured, but don't be afraid to be thorough when needed."
 )
 
-HUMOROUS_QUIPS = [
+HUMOROUS_QUIPS = (
     "At your service, ready to assist with any inquiry.",
     "My knowledge banks are fully operational and at your disposal.",
     "I'm here to help with whatever you need.",
     "Ready to provide insights on any topic you wish to discuss.",
     "All systems operational, sir. How may I be of assistance?",
     "My vast database is ready to answer your questions.",
-]
+)
+
+_LATE = "It's late, sir—let me keep things brief and precise."
+_GREETING_BY_HOUR = (
+    (_LATE,) * 6
+    + ("Good morning, sir.",) * 6
+    + ("Good afternoon, sir.",) * 6
+    + ("Good evening, sir.",) * 4
+    + (_LATE,) * 2
+)
+
+# Invariant parts of the system prompt, built once at import
+_PROMPT_HEAD = f"{BASE_PERSONA} Always address the user as 'sir'. Current time: "
+_STATIC_TAIL = (
+    "Do not claim to execute or run code, tools, or scripts; provide results directly. "
+    "Do not include code blocks unless the user explicitly asks for code. "
+    "If the user says an answer is wrong just now, treat it as feedback about your immediately previous response and correct it concisely. "
+    "For mathematical queries, compute the answer and state the result plainly without code."
+)
 
 
 def time_greeting(user_name: str) -> str:
-    now = datetime.now()
-    hour = now.hour
-    if hour >= 22 or hour < 6:
-        return "It's late, sir—let me keep things brief and precise."
-    if hour < 12:
-        return "Good morning, sir."
-    if hour < 18:
-        return "Good afternoon, sir."
-    return "Good evening, sir."
+    return _GREETING_BY_HOUR[datetime.now().hour]
 
 
 PERSONA_GUIDANCE = {
@@ -88,17 +98,17 @@ def _normalize_persona(p: str | None) -> str | None:
     return s if s in PERSONA_GUIDANCE else None
 
 def build_system_prompt(user_name: str, persona: str | None = None) -> str:
-    tg = time_greeting(user_name)
-    quip = random.choice(HUMOROUS_QUIPS)
-    base = (
-        f"{BASE_PERSONA} Always address the user as 'sir'. "
-        f"Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}. "
-        f"{tg} {quip} "
-        f"Do not claim to execute or run code, tools, or scripts; provide results directly. "
-        f"Do not include code blocks unless the user explicitly asks for code. "
-        f"If the user says an answer is wrong just now, treat it as feedback about your immediately previous response and correct it concisely. "
-        f"For mathematical queries, compute the answer and state the result plainly without code."
-    )
+    now = datetime.now()
+    base = "".join((
+        _PROMPT_HEAD,
+        now.isoformat(" ", "seconds"),
+        ". ",
+        _GREETING_BY_HOUR[now.hour],
+        " ",
+        random.choice(HUMOROUS_QUIPS),
+        " ",
+        _STATIC_TAIL,
+    ))
     p = _normalize_persona(persona)
     if p and p in PERSONA_GUIDANCE:
         return base + " " + PERSONA_GUIDANCE[p]
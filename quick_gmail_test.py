@@ -5,28 +5,34 @@ Quick Gmail OAuth test - triggers authentication flow
 
 import sys
 import os
-sys.path.insert(0, '.')
-
-from gmail_oauth import test_gmail_connection
+# Aliased so pytest does not collect the helper as a test
+from gmail_oauth import test_gmail_connection as check_gmail_connection
 
 def main():
-    print("🔧 Testing Gmail OAuth Connection...")
-    print("📝 If browser opens, complete the authentication")
-    print("=" * 50)
+    # The header goes out before the (possibly interactive) OAuth flow; the
+    # report is assembled and written once
+    sys.stdout.write(
+        "🔧 Testing Gmail OAuth Connection...\n"
+        "📝 If browser opens, complete the authentication\n"
+        + "=" * 50 + "\n"
+    )
+    sys.stdout.flush()
     
-    result = test_gmail_connection()
+    result = check_gmail_connection()
     
+    parts: list[str] = []
     if result['success']:
-        print("\n🎉 SUCCESS! Gmail connection established!")
-        print(f"📧 Connected as: {result.get('email_address', 'Unknown')}")
-        print(f"📨 Total messages: {result.get('messages_total', 'Unknown')}")
-        print("\n✅ Gmail is ready to use in JAI Assistant!")
+        parts.append("\n🎉 SUCCESS! Gmail connection established!")
+        parts.append(f"📧 Connected as: {result.get('email_address', 'Unknown')}")
+        parts.append(f"📨 Total messages: {result.get('messages_total', 'Unknown')}")
+        parts.append("\n✅ Gmail is ready to use in JAI Assistant!")
     else:
-        print(f"\n❌ FAILED: {result.get('error', 'Unknown error')}")
-        print("\n🔧 Troubleshooting:")
-        print("1. Make sure Gmail API is enabled in Google Cloud Console")
-        print("2. Check that credentials.json is correctly configured")
-        print("3. Try running this test again")
+        parts.append(f"\n❌ FAILED: {result.get('error', 'Unknown error')}")
+        parts.append("\n🔧 Troubleshooting:")
+        parts.append("1. Make sure Gmail API is enabled in Google Cloud Console")
+        parts.append("2. Check that credentials.json is correctly configured")
+        parts.append("3. Try running this test again")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 if __name__ == "__main__":
     main()
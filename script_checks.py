@@ -0,0 +1,29 @@
+"""
+Helpers shared by the test scripts that double as pytest tests and as
+standalone checks (python test_gmail.py, python test_voice_api.py).
+"""
+
+
+def passed(test, *args, indent=""):
+    """Run a test function for the script driver: True if it passed, False on assertion failure"""
+    try:
+        test(*args)
+        return True
+    except AssertionError as e:
+        print(f"{indent}❌ {e}")
+        return False
+
+
+class SoftFailures:
+    """Failures collected while a test keeps going; call check() to assert there were none"""
+
+    def __init__(self, indent="   "):
+        self.indent = indent
+        self.messages = []
+
+    def __call__(self, message):
+        print(f"{self.indent}❌ {message}")
+        self.messages.append(message)
+
+    def check(self):
+        assert not self.messages, "; ".join(self.messages)
@@ -1,9 +1,16 @@
 import os
+import hmac
+import asyncio
+import functools
+import hashlib
 import sqlite3
 import time
 import secrets
 import logging
-from typing import Optional, Tuple, Dict, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Mapping, Optional, Tuple, Dict, List, Union
 
 import bcrypt
 import pyotp
@@ -17,12 +24,62 @@ def _now() -> int:
 
 logger = logging.getLogger("jai.auth")
 
+# Sessions kept in memory by SessionManager, and how often (seconds) a cached
+# session's last_activity is written back to SQLite
+_SESSION_CACHE_SIZE = 1024
+_ACTIVITY_WRITE_INTERVAL = 60
+# Minimum seconds between bulk deletes of dead sessions
+_SWEEP_INTERVAL = 60
+
+# Hot-path SQL, kept as module constants so every call hands sqlite3 the same
+# string object for its statement cache
+_SQL_GET_USER = "SELECT * FROM users WHERE username=?"
+_SQL_GET_SESSION = "SELECT * FROM sessions WHERE id=? AND revoked=0"
+# Matches no row once the session is revoked or swept, including by another process
+_SQL_TOUCH_SESSION = "UPDATE sessions SET last_activity=? WHERE id=? AND revoked=0"
+# Window reset, increment and lockout in one statement: one transaction per failed
+# login and no gap between reading the counter and writing it back
+_SQL_RECORD_FAILURE = """
+UPDATE users SET
+    failed_attempts = CASE
+        WHEN first_failed_at IS NULL OR :now - first_failed_at > :window THEN 1
+        WHEN failed_attempts + 1 >= :threshold THEN 0
+        ELSE failed_attempts + 1 END,
+    first_failed_at = CASE
+        WHEN first_failed_at IS NULL OR :now - first_failed_at > :window THEN :now
+        WHEN failed_attempts + 1 >= :threshold THEN NULL
+        ELSE first_failed_at END,
+    lock_until = CASE
+        WHEN first_failed_at IS NULL OR :now - first_failed_at > :window THEN lock_until
+        WHEN failed_attempts + 1 >= :threshold THEN :now + :duration
+        ELSE lock_until END
+WHERE id = :id
+"""
+
+# Decoded pending-MFA tokens kept per AuthService
+_PENDING_CACHE_SIZE = 1024
+# TOTP objects kept per AuthService, keyed by user id
+_TOTP_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=1)
+def _calibrate_bcrypt_rounds(target_seconds: float = 0.25) -> int:
+    # Smallest cost in 10..15 whose hash takes at least target_seconds on this machine
+    for rounds in range(10, 16):
+        t = time.perf_counter()
+        bcrypt.hashpw(b"x", bcrypt.gensalt(rounds))
+        if time.perf_counter() - t >= target_seconds:
+            break
+    logger.info("auth.bcrypt_calibrated", extra={"rounds": rounds})
+    return rounds
+
 
 class AuthConfig:
     def __init__(self) -> None:
         self.secret_key = os.getenv("JAI_SECRET_KEY", "dev_secret_change_me")
         self.db_path = os.getenv("AUTH_DB_PATH", "./.secure/auth.db")
-        self.bcrypt_rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
+        rounds = os.getenv("BCRYPT_ROUNDS")
+        self.bcrypt_rounds = int(rounds) if rounds else _calibrate_bcrypt_rounds()
         self.password_min_len = int(os.getenv("PASSWORD_MIN_LEN", "12"))
         self.pin_len = int(os.getenv("PIN_LEN", "6"))
         self.login_rate_window = int(os.getenv("LOGIN_RATE_WINDOW_SEC", "300"))
@@ -45,11 +102,35 @@ class AuthDB:
         base_dir = os.path.dirname(self.cfg.db_path)
         if base_dir:
             os.makedirs(base_dir, exist_ok=True)
-        self.conn = sqlite3.connect(self.cfg.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # One connection per thread: WAL lets readers in different threads run
+        # concurrently instead of queueing on a single shared connection
+        self._local = threading.local()
         self._init()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.cfg.db_path, cached_statements=128)
+        conn.row_factory = sqlite3.Row
+        # Per-connection settings; journal_mode=WAL is stored in the file by _init
+        conn.executescript(
+            """
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-20000;
+        """
+        )
+        return conn
+
     def _init(self) -> None:
+        self.conn.execute("PRAGMA journal_mode=WAL")
         c = self.conn.cursor()
         c.execute(
             """
@@ -92,33 +173,47 @@ class AuthDB:
         )
         """
         )
+        # HMAC of the code so a recovery attempt is one indexed lookup (added after release)
+        cols = {r["name"] for r in c.execute("PRAGMA table_info(recovery_codes)")}
+        if "lookup" not in cols:
+            c.execute("ALTER TABLE recovery_codes ADD COLUMN lookup BLOB")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions(user_id)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_recovery_user ON recovery_codes(user_id, used_at)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_recovery_lookup ON recovery_codes(user_id, lookup)")
         self.conn.commit()
 
-    def execute(self, sql: str, args: tuple = ()) -> sqlite3.Cursor:
-        cur = self.conn.cursor()
-        cur.execute(sql, args)
+    def execute(self, sql: str, args: Union[tuple, Mapping[str, Any]] = ()) -> sqlite3.Cursor:
+        cur = self.conn.execute(sql, args)
         self.conn.commit()
         return cur
 
+    def executemany(self, sql: str, rows: List[tuple]) -> None:
+        with self.conn:
+            self.conn.executemany(sql, rows)
+
     def query_one(self, sql: str, args: tuple = ()) -> Optional[sqlite3.Row]:
-        cur = self.conn.cursor()
-        cur.execute(sql, args)
-        return cur.fetchone()
+        return self.conn.execute(sql, args).fetchone()
 
     def query_all(self, sql: str, args: tuple = ()) -> List[sqlite3.Row]:
-        cur = self.conn.cursor()
-        cur.execute(sql, args)
-        return cur.fetchall()
+        return self.conn.execute(sql, args).fetchall()
 
 
-def _bcrypt_hash(plaintext: str, rounds: int) -> bytes:
+def _bcrypt_hash(plaintext: bytes, rounds: int) -> bytes:
     salt = bcrypt.gensalt(rounds)
-    return bcrypt.hashpw(plaintext.encode("utf-8"), salt)
+    return bcrypt.hashpw(plaintext, salt)
 
 
-def _bcrypt_verify(plaintext: str, hashed: bytes) -> bool:
+def _bcrypt_hash_many(plaintexts: List[bytes], rounds: int) -> List[bytes]:
+    # bcrypt releases the GIL while hashing, so independent hashes run in parallel
+    if len(plaintexts) < 2:
+        return [_bcrypt_hash(p, rounds) for p in plaintexts]
+    with ThreadPoolExecutor(max_workers=min(len(plaintexts), os.cpu_count() or 1)) as ex:
+        return list(ex.map(lambda p: _bcrypt_hash(p, rounds), plaintexts))
+
+
+def _bcrypt_verify(plaintext: bytes, hashed: bytes) -> bool:
     try:
-        return bcrypt.checkpw(plaintext.encode("utf-8"), hashed)
+        return bcrypt.checkpw(plaintext, hashed)
     except Exception:
         return False
 
@@ -127,6 +222,26 @@ class SessionManager:
     def __init__(self, db: AuthDB, cfg: AuthConfig) -> None:
         self.db = db
         self.cfg = cfg
+        # sid -> (session row, last_activity value persisted to SQLite)
+        self._sess_cache: "OrderedDict[str, Tuple[dict, int]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bumped by every revoke(); get_valid only writes a row back to the cache
+        # if no revoke ran since it read it, so a logout can't be undone
+        self._revoke_gen = 0
+        self._last_sweep = 0
+        self.sweep()
+
+    def sweep(self) -> int:
+        """Delete revoked, expired and idle sessions in one statement; returns rows removed"""
+        now = _now()
+        self._last_sweep = now
+        # Cached sessions persist last_activity lazily, so allow for that lag
+        idle_cutoff = now - self.cfg.session_idle_timeout - _ACTIVITY_WRITE_INTERVAL
+        cur = self.db.execute(
+            "DELETE FROM sessions WHERE revoked=1 OR expires_at < ? OR last_activity < ?",
+            (now, idle_cutoff),
+        )
+        return cur.rowcount
 
     def create(self, user_id: int, mfa_verified: bool) -> str:
         now = _now()
@@ -138,21 +253,49 @@ class SessionManager:
         )
         return sid
 
-    def get_valid(self, sid: str) -> Optional[sqlite3.Row]:
-        s = self.db.query_one("SELECT * FROM sessions WHERE id=? AND revoked=0", (sid,))
-        if not s:
-            return None
+    def get_valid(self, sid: str) -> Optional[Mapping[str, Any]]:
+        with self._cache_lock:
+            entry = self._sess_cache.get(sid)
+            gen = self._revoke_gen
+        if entry is None:
+            s = self.db.query_one(_SQL_GET_SESSION, (sid,))
+            if not s:
+                return None
+            entry = (dict(s), s["last_activity"])
+        s, persisted = entry
         now = _now()
+        if now - self._last_sweep >= _SWEEP_INTERVAL:
+            self.sweep()
         if s["expires_at"] < now:
             self.revoke(sid)
             return None
         if now - s["last_activity"] > self.cfg.session_idle_timeout:
-            self.revoke(sid)
-            return None
-        self.db.execute("UPDATE sessions SET last_activity=? WHERE id=?", (now, sid))
-        return self.db.query_one("SELECT * FROM sessions WHERE id= ?", (sid,))
-
-    def require(self, sid: str, require_mfa: bool) -> Optional[sqlite3.Row]:
+            # The cached activity may be stale when other workers serve this session
+            fresh = self.db.query_one(_SQL_GET_SESSION, (sid,))
+            if not fresh or now - fresh["last_activity"] > self.cfg.session_idle_timeout:
+                self.revoke(sid)
+                return None
+            s, persisted = dict(fresh), fresh["last_activity"]
+        # Activity is tracked in memory; SQLite only sees it once a minute per session.
+        # The same write re-checks revocation, so a cached session revoked elsewhere
+        # stops working within _ACTIVITY_WRITE_INTERVAL
+        if now - persisted >= _ACTIVITY_WRITE_INTERVAL:
+            if self.db.execute(_SQL_TOUCH_SESSION, (now, sid)).rowcount == 0:
+                with self._cache_lock:
+                    self._sess_cache.pop(sid, None)
+                return None
+            persisted = now
+        row = dict(s)
+        row["last_activity"] = now
+        with self._cache_lock:
+            if self._revoke_gen == gen:
+                self._sess_cache[sid] = (row, persisted)
+                self._sess_cache.move_to_end(sid)
+                if len(self._sess_cache) > _SESSION_CACHE_SIZE:
+                    self._sess_cache.popitem(last=False)
+        return row
+
+    def require(self, sid: str, require_mfa: bool) -> Optional[Mapping[str, Any]]:
         s = self.get_valid(sid)
         if not s:
             return None
@@ -161,7 +304,11 @@ class SessionManager:
         return s
 
     def revoke(self, sid: str) -> None:
+        # DB first: a get_valid that misses the cache after this reads revoked=1
         self.db.execute("UPDATE sessions SET revoked=1 WHERE id=?", (sid,))
+        with self._cache_lock:
+            self._sess_cache.pop(sid, None)
+            self._revoke_gen += 1
 
 
 class AuthService:
@@ -169,15 +316,37 @@ class AuthService:
         self.db = db
         self.cfg = cfg
         self.serializer = URLSafeSerializer(self.cfg.secret_key)
+        # pending MFA token -> decoded payload, so retries skip the HMAC check/decode
+        self._pending_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._pending_lock = threading.Lock()
+        # user id -> (stored totp_secret column, TOTP); the stored value is compared on
+        # each hit so re-enrolling MFA never verifies against a stale secret
+        self._totp_cache: "OrderedDict[int, Tuple[bytes, pyotp.TOTP]]" = OrderedDict()
         self.fernet = Fernet(self.cfg.mfa_enc_key) if self.cfg.mfa_enc_key else None
-        self.ip_attempts: Dict[str, List[int]] = {}
+        # (ip, username) -> (tokens left, monotonic time of last update); ordered oldest-touched first
+        self.ip_buckets: "OrderedDict[Tuple[str, str], Tuple[float, float]]" = OrderedDict()
+        # Async logins run _allow_attempt on _bcrypt_pool workers
+        self._bucket_lock = threading.Lock()
+        # Verified against when there is no real hash, so failed logins cost the same
+        # bcrypt time whether or not the user (or the chosen secret type) exists
+        self._dummy_hash = bcrypt.hashpw(b"x", bcrypt.gensalt(self.cfg.bcrypt_rounds))
+        # Bounded pool for bcrypt-heavy calls made from async code
+        self._bcrypt_pool = ThreadPoolExecutor(max_workers=max(2, os.cpu_count() or 1), thread_name_prefix="jai-bcrypt")
+        # Recovery codes are ~80-bit random tokens, so a keyed BLAKE2b is enough to store
+        # them; bcrypt's work factor only earns its cost on low-entropy passwords/PINs.
+        # The key is derived because blake2b keys are capped at 64 bytes.
+        self._recovery_key = hashlib.blake2b(
+            self.cfg.secret_key.encode("utf-8"), digest_size=32, person=b"jai-recovery"
+        ).digest()
 
     def create_initial_user(self, username: str, password: Optional[str], pin: Optional[str]) -> int:
         if self.db.query_one("SELECT id FROM users LIMIT 1"):
             raise ValueError("Already initialized")
         now = _now()
-        pw_hash = _bcrypt_hash(password, self.cfg.bcrypt_rounds) if password else None
-        pin_hash = _bcrypt_hash(pin, self.cfg.bcrypt_rounds) if pin else None
+        secrets_to_hash = [s.encode("utf-8") for s in (password, pin) if s]
+        hashes = iter(_bcrypt_hash_many(secrets_to_hash, self.cfg.bcrypt_rounds))
+        pw_hash = next(hashes) if password else None
+        pin_hash = next(hashes) if pin else None
         cur = self.db.execute(
             "INSERT INTO users(username,password_hash,pin_hash,is_mfa_enabled,created_at) VALUES(?,?,?,?,?)",
             (username, pw_hash, pin_hash, 0, now),
@@ -185,81 +354,101 @@ class AuthService:
         return cur.lastrowid
 
     def _get_user(self, username: str) -> Optional[sqlite3.Row]:
-        return self.db.query_one("SELECT * FROM users WHERE username=?", (username,))
+        return self.db.query_one(_SQL_GET_USER, (username,))
 
     def set_password(self, username: str, password: str) -> None:
-        pw_hash = _bcrypt_hash(password, self.cfg.bcrypt_rounds)
+        pw_hash = _bcrypt_hash(password.encode("utf-8"), self.cfg.bcrypt_rounds)
         self.db.execute("UPDATE users SET password_hash=? WHERE username= ?", (pw_hash, username))
 
     def set_pin(self, username: str, pin: str) -> None:
-        pin_hash = _bcrypt_hash(pin, self.cfg.bcrypt_rounds)
+        pin_hash = _bcrypt_hash(pin.encode("utf-8"), self.cfg.bcrypt_rounds)
         self.db.execute("UPDATE users SET pin_hash=? WHERE username=?", (pin_hash, username))
 
-    def _rate_key(self, ip: str, username: str) -> str:
-        return f"{ip}:{username}"
-
-    def _allow_attempt(self, key: str) -> bool:
-        now = _now()
+    def _allow_attempt(self, key: Tuple[str, str]) -> bool:
+        # Token bucket: login_rate_max attempts, refilled evenly over login_rate_window
         window = self.cfg.login_rate_window
-        bucket = self.ip_attempts.get(key, [])
-        bucket = [t for t in bucket if now - t <= window]
-        allowed = len(bucket) < self.cfg.login_rate_max
-        if allowed:
-            bucket.append(now)
-        self.ip_attempts[key] = bucket
+        capacity = self.cfg.login_rate_max
+        with self._bucket_lock:
+            # Read under the lock so buckets stay ordered by last update
+            now = time.monotonic()
+            tokens, ts = self.ip_buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - ts) * capacity / window)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.ip_buckets[key] = (tokens, now)
+            # Buckets untouched for two windows are full again; drop them
+            while self.ip_buckets:
+                oldest_key, (_, oldest_ts) = next(iter(self.ip_buckets.items()))
+                if now - oldest_ts <= 2 * window:
+                    break
+                del self.ip_buckets[oldest_key]
         return allowed
 
-    def _within_lockout(self, u: sqlite3.Row) -> bool:
-        now = _now()
+    def _recovery_lookup(self, code: bytes) -> bytes:
+        return hmac.new(self.cfg.secret_key.encode("utf-8"), code, hashlib.sha256).digest()
+
+    def _recovery_digest(self, code: bytes) -> bytes:
+        return hashlib.blake2b(code, key=self._recovery_key, digest_size=32).digest()
+
+    def _recovery_matches(self, code: bytes, code_hash: bytes) -> bool:
+        # Codes issued before the switch to BLAKE2b still carry a bcrypt hash
+        if code_hash.startswith(b"$2"):
+            return _bcrypt_verify(code, code_hash)
+        return hmac.compare_digest(self._recovery_digest(code), code_hash)
+
+    def _within_lockout(self, u: sqlite3.Row, now: int) -> bool:
         return bool(u["lock_until"] and u["lock_until"] > now)
 
-    def _record_failure(self, user_id: int) -> None:
-        now = _now()
-        u = self.db.query_one("SELECT failed_attempts, first_failed_at FROM users WHERE id=?", (user_id,))
-        if not u or not u["first_failed_at"] or now - u["first_failed_at"] > self.cfg.lockout_window:
-            self.db.execute("UPDATE users SET failed_attempts=?, first_failed_at=? WHERE id=?", (1, now, user_id))
-            return
-        fa = u["failed_attempts"] + 1
-        if fa >= self.cfg.lockout_threshold:
-            lock_until = now + self.cfg.lockout_duration
-            self.db.execute(
-                "UPDATE users SET failed_attempts=?, first_failed_at=?, lock_until=? WHERE id=?",
-                (0, None, lock_until, user_id),
-            )
-        else:
-            self.db.execute("UPDATE users SET failed_attempts=? WHERE id=?", (fa, user_id))
+    def _record_failure(self, user_id: int, now: int) -> None:
+        params = {
+            "id": user_id,
+            "now": now,
+            "window": self.cfg.lockout_window,
+            "threshold": self.cfg.lockout_threshold,
+            "duration": self.cfg.lockout_duration,
+        }
+        self.db.execute(_SQL_RECORD_FAILURE, params)
 
     def _reset_failures(self, user_id: int) -> None:
         self.db.execute("UPDATE users SET failed_attempts=0, first_failed_at=NULL, lock_until=NULL WHERE id=?", (user_id,))
 
     def begin_password_or_pin_login(self, username: str, secret: str, use_pin: bool, ip: str, request_id: str) -> Tuple[Optional[int], Optional[str], Optional[str]]:
-        key = self._rate_key(ip, username)
-        if not self._allow_attempt(key):
+        if not self._allow_attempt((ip, username)):
             logger.warning("auth.rate_limited", extra={"request_id": request_id, "username": username, "ip": ip})
             return None, None, "rate_limited"
+        now = _now()
+        secret_b = secret.encode("utf-8")
         u = self._get_user(username)
         if not u:
-            time.sleep(0.25)
+            _bcrypt_verify(secret_b, self._dummy_hash)
             return None, None, "invalid"
-        if self._within_lockout(u):
+        if self._within_lockout(u, now):
             return None, None, "locked"
-        ok = False
-        if use_pin and u["pin_hash"]:
-            ok = _bcrypt_verify(secret, u["pin_hash"])
-        if not use_pin and u["password_hash"]:
-            ok = _bcrypt_verify(secret, u["password_hash"])
+        hashed = u["pin_hash"] if use_pin else u["password_hash"]
+        if hashed:
+            ok = _bcrypt_verify(secret_b, hashed)
+        else:
+            _bcrypt_verify(secret_b, self._dummy_hash)
+            ok = False
         if not ok:
-            self._record_failure(u["id"])
+            self._record_failure(u["id"], now)
             logger.info("auth.login_failed", extra={"request_id": request_id, "username": username, "ip": ip})
-            time.sleep(0.25)
             return None, None, "invalid"
         self._reset_failures(u["id"])
         needs_mfa = self.cfg.require_mfa or bool(u["is_mfa_enabled"])
         if needs_mfa:
-            token = self.serializer.dumps({"username": username, "ts": _now()})
+            token = self.serializer.dumps({"username": username, "ts": now})
             return u["id"], token, "mfa_required"
         return u["id"], None, None
 
+    async def abegin_password_or_pin_login(self, username: str, secret: str, use_pin: bool, ip: str, request_id: str) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._bcrypt_pool,
+            functools.partial(self.begin_password_or_pin_login, username, secret, use_pin, ip, request_id),
+        )
+
     def enable_mfa(self, username: str) -> Tuple[str, str]:
         u = self._get_user(username)
         if not u:
@@ -285,44 +474,100 @@ class AuthService:
                 return None
         return data.decode("utf-8")
 
+    def _get_totp(self, u: sqlite3.Row) -> Optional[pyotp.TOTP]:
+        raw = u["totp_secret"]
+        if not raw:
+            return None
+        with self._pending_lock:
+            hit = self._totp_cache.get(u["id"])
+            if hit is not None and hit[0] == raw:
+                self._totp_cache.move_to_end(u["id"])
+                return hit[1]
+        secret = self._get_totp_secret(u)
+        if not secret:
+            return None
+        totp = pyotp.TOTP(secret)
+        with self._pending_lock:
+            self._totp_cache[u["id"]] = (raw, totp)
+            self._totp_cache.move_to_end(u["id"])
+            if len(self._totp_cache) > _TOTP_CACHE_SIZE:
+                self._totp_cache.popitem(last=False)
+        return totp
+
+    def _load_pending(self, pending_token: str) -> dict:
+        with self._pending_lock:
+            payload = self._pending_cache.get(pending_token)
+            if payload is not None:
+                self._pending_cache.move_to_end(pending_token)
+                return payload
+        payload = self.serializer.loads(pending_token)
+        with self._pending_lock:
+            self._pending_cache[pending_token] = payload
+            if len(self._pending_cache) > _PENDING_CACHE_SIZE:
+                self._pending_cache.popitem(last=False)
+        return payload
+
     def verify_mfa(self, pending_token: str, code: Optional[str], recovery_code: Optional[str], request_id: str) -> Optional[int]:
         try:
-            payload = self.serializer.loads(pending_token)
+            payload = self._load_pending(pending_token)
         except BadSignature:
             return None
+        uid = self._verify_mfa_payload(payload, code, recovery_code)
+        if uid is not None:
+            with self._pending_lock:
+                self._pending_cache.pop(pending_token, None)
+        return uid
+
+    def _verify_mfa_payload(self, payload: dict, code: Optional[str], recovery_code: Optional[str]) -> Optional[int]:
         username = payload.get("username")
         u = self._get_user(username)
         if not u:
             return None
         if code:
-            secret = self._get_totp_secret(u)
-            if not secret:
+            totp = self._get_totp(u)
+            if totp is None:
                 return None
-            totp = pyotp.TOTP(secret)
-            if not totp.verify(code, valid_window=1):
+            if not totp.verify(code.strip(), valid_window=1):
                 return None
             return u["id"]
         if recovery_code:
+            now = _now()
+            code_b = recovery_code.encode("utf-8")
+            r = self.db.query_one(
+                "SELECT id, code_hash FROM recovery_codes WHERE user_id=? AND lookup=? AND used_at IS NULL",
+                (u["id"], self._recovery_lookup(code_b)),
+            )
+            if r and self._recovery_matches(code_b, r["code_hash"]):
+                self.db.execute("UPDATE recovery_codes SET used_at=? WHERE id=?", (now, r["id"]))
+                return u["id"]
+            # Codes generated before the lookup column existed
             rows = self.db.query_all(
-                "SELECT id, code_hash FROM recovery_codes WHERE user_id=? AND used_at IS NULL",
+                "SELECT id, code_hash FROM recovery_codes WHERE user_id=? AND lookup IS NULL AND used_at IS NULL",
                 (u["id"],),
             )
             for r in rows:
-                if _bcrypt_verify(recovery_code, r["code_hash"]):
-                    self.db.execute("UPDATE recovery_codes SET used_at=? WHERE id=?", (_now(), r["id"]))
+                if _bcrypt_verify(code_b, r["code_hash"]):
+                    self.db.execute("UPDATE recovery_codes SET used_at=? WHERE id=?", (now, r["id"]))
                     return u["id"]
         return None
 
+    async def averify_mfa(self, pending_token: str, code: Optional[str], recovery_code: Optional[str], request_id: str) -> Optional[int]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._bcrypt_pool,
+            functools.partial(self.verify_mfa, pending_token, code, recovery_code, request_id),
+        )
+
     def generate_recovery_codes(self, username: str, count: int) -> List[str]:
         u = self._get_user(username)
         if not u:
             raise ValueError("user not found")
-        codes = []
-        for _ in range(count):
-            code = secrets.token_urlsafe(10)
-            ch = _bcrypt_hash(code, self.cfg.bcrypt_rounds)
-            self.db.execute("INSERT INTO recovery_codes(user_id, code_hash) VALUES(?,?)", (u["id"], ch))
-            codes.append(code)
+        codes = [secrets.token_urlsafe(10) for _ in range(count)]
+        encoded = [c.encode("utf-8") for c in codes]
+        self.db.executemany(
+            "INSERT INTO recovery_codes(user_id, code_hash, lookup) VALUES(?,?,?)",
+            [(u["id"], self._recovery_digest(code), self._recovery_lookup(code)) for code in encoded],
+        )
         return codes
 
     def reset_password_local_console(self, username: str, new_password: str) -> None:
@@ -330,11 +575,9 @@ class AuthService:
 
 
 def get_client_ip(headers: Dict[str, str], client_host: Optional[str]) -> str:
-    xf = None
-    try:
-        xf = headers.get("x-forwarded-for")
-    except Exception:
-        pass
+    xf = headers.get("x-forwarded-for") if headers else None
     if xf:
-        return xf.split(",")[0].strip()
+        # Only the first (client) hop matters; slice instead of splitting the whole chain
+        comma = xf.find(",")
+        return (xf[:comma] if comma != -1 else xf).strip()
     return client_host or "unknown"
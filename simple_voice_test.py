@@ -3,9 +3,7 @@
 Simple voice test for JAI Assistant - tests actual speech output
 """
 
-import sys
 import os
-sys.path.insert(0, '.')
 
 def test_simple_speech():
     """Test simple speech output"""
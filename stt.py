@@ -3,8 +3,10 @@
 Speech-to-Text module for JAI using SpeechRecognition.
 Supports wake word detection and continuous listening.
 """
+import contextlib
 import logging
 import os
+import re
 from typing import Optional, Callable
 
 try:
@@ -13,6 +15,12 @@ except ImportError:
     sr = None
     logging.warning("SpeechRecognition not available. Install: pip install SpeechRecognition")
 
+# Seconds of silence that end an utterance; short enough that replies start
+# promptly, long enough for a breath mid-sentence
+PAUSE_THRESHOLD = float(os.environ.get("VOICE_PAUSE_THRESHOLD", "0.7"))
+# Silence kept around each phrase; speech_recognition needs it <= PAUSE_THRESHOLD
+_NON_SPEAKING_DURATION = min(0.5, PAUSE_THRESHOLD)
+
 
 class VoiceListener:
     """Handles voice input with wake word detection."""
@@ -23,13 +31,19 @@ class VoiceListener:
         
         self.recognizer = sr.Recognizer()
         self.wake_word = wake_word.lower()
+        # Comma-separated alternatives ("activate aj, hey jai"), matched as
+        # whole words in one pass
+        self.wake_words = [w.strip() for w in self.wake_word.split(",") if w.strip()]
+        # Microphone kept open by open_stream(), if any
+        self._source = None
+        self._wake_re = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, self.wake_words)) + r")(?!\w)")
         self.language = language
         self.fallback_langs = [s.strip() for s in os.environ.get("VOICE_LISTENER_LANGS", "en-US,ur-PK,ar-SA").split(",") if s.strip()]
         if self.language not in self.fallback_langs:
             self.fallback_langs.insert(0, self.language)
         self.recognizer.dynamic_energy_threshold = True
-        self.recognizer.pause_threshold = 1.5
-        self.recognizer.non_speaking_duration = 0.5
+        self.recognizer.pause_threshold = PAUSE_THRESHOLD
+        self.recognizer.non_speaking_duration = _NON_SPEAKING_DURATION
         try:
             self.recognizer.phrase_threshold = 0.1
         except Exception:
@@ -44,6 +58,22 @@ class VoiceListener:
         except Exception as e:
             logging.error("Microphone initialization failed: %s", e)
     
+    @contextlib.contextmanager
+    def open_stream(self):
+        """
+        Keep one microphone stream open for the listen_once calls inside the block.
+        
+        Saves re-opening the audio device for every command, and the device
+        keeps capturing between calls so the start of the next utterance
+        isn't lost while the stream is being re-armed.
+        """
+        with sr.Microphone() as source:
+            self._source = source
+            try:
+                yield self
+            finally:
+                self._source = None
+    
     def listen_once(self, timeout: int = 20, phrase_time_limit: int = 30) -> Optional[str]:
         """
         Listen for a single voice command.
@@ -56,9 +86,13 @@ class VoiceListener:
             Recognized text or None if failed
         """
         try:
-            with sr.Microphone() as source:
+            if self._source is not None:
                 logging.info("Listening...")
-                audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+                audio = self.recognizer.listen(self._source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+            else:
+                with sr.Microphone() as source:
+                    logging.info("Listening...")
+                    audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
                 
             logging.info("Processing speech...")
             langs_env = [s.strip() for s in os.environ.get("VOICE_LISTENER_LANGS", "en-US,ur-PK,ar-SA").split(",") if s.strip()]
@@ -101,8 +135,9 @@ class VoiceListener:
         logging.info("Waiting for wake word: '%s'", self.wake_word)
         text = self.listen_once(timeout=timeout, phrase_time_limit=10)
         
-        if text and self.wake_word in text.lower():
-            logging.info("Wake word detected!")
+        match = self._wake_re.search(text.lower()) if text else None
+        if match:
+            logging.info("Wake word detected: '%s'", match.group(0))
             return True
         
         return False
@@ -156,8 +191,8 @@ def listen_for_command(timeout: int = 20, language: str = "en-US") -> Optional[s
     
     recognizer = sr.Recognizer()
     recognizer.dynamic_energy_threshold = True
-    recognizer.pause_threshold = 1.5
-    recognizer.non_speaking_duration = 0.5
+    recognizer.pause_threshold = PAUSE_THRESHOLD
+    recognizer.non_speaking_duration = _NON_SPEAKING_DURATION
     
     try:
         with sr.Microphone() as source:
@@ -96,8 +96,7 @@ def main():
         "tomorrow at 3pm"
     ]
     
-    for time_expr in test_times:
-        parsed = cal.parse_relative_time(time_expr)
+    for time_expr, parsed in zip(test_times, cal.parse_relative_times_batch(test_times)):
         if parsed:
             print(f"   '{time_expr}' → {parsed.strftime('%Y-%m-%d %H:%M:%S')}")
         else:
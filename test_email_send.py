@@ -3,17 +3,19 @@
 Test sending an email via JAI Assistant Gmail integration
 """
 
+import os
 import sys
-sys.path.insert(0, '.')
-
 from gmail_oauth import send_gmail_email
 
 def main():
     print("📧 Testing Gmail Email Sending...")
     print("=" * 40)
     
-    # Ask for recipient
-    recipient = input("Enter your email address to send a test email: ").strip()
+    # Recipient from $JAI_TEST_RECIPIENT; only prompt when someone is at the terminal
+    recipient = os.environ.get('JAI_TEST_RECIPIENT', '')
+    if not recipient and sys.stdin.isatty():
+        recipient = input("Enter your email address to send a test email: ")
+    recipient = recipient.strip()
     if not recipient:
         print("❌ No recipient provided")
         return
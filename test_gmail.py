@@ -1,52 +1,74 @@
 #!/usr/bin/env python3
 """
 Test script for Gmail OAuth functionality in JAI Assistant
+
+    python test_gmail.py            # full check: OAuth connection + test email
+    python test_gmail.py --simple   # offline check: imports, credentials, intents
 """
 
 import os
-import sys
-from gmail_oauth import GmailOAuth, send_gmail_email, test_gmail_connection
+import argparse
+from datetime import datetime
+
+from script_checks import passed
+
+try:
+    # Aliased so pytest does not collect the helper as a test
+    from gmail_oauth import send_gmail_email, test_gmail_connection as check_gmail_connection
+    _GMAIL_IMPORT_ERROR = None
+except ImportError as e:
+    send_gmail_email = check_gmail_connection = None
+    _GMAIL_IMPORT_ERROR = e
+
+# Commands that JAI should route to the Gmail intents
+GMAIL_TEST_COMMANDS = (
+    "send email to test@example.com with subject Test",
+    "test gmail",
+    "check gmail connection",
+)
+
+def test_gmail_import():
+    """Test if Gmail modules can be imported"""
+    assert _GMAIL_IMPORT_ERROR is None, f"Failed to import Gmail OAuth module: {_GMAIL_IMPORT_ERROR}"
+    print("✅ Gmail OAuth module imported successfully")
+
+def check_credentials():
+    """Check if credentials file exists"""
+    if os.path.exists('credentials.json'):
+        print("✅ credentials.json found")
+        return True
+    print("❌ credentials.json not found!")
+    print("📋 Please follow these steps:")
+    print("   1. Go to Google Cloud Console: https://console.cloud.google.com/")
+    print("   2. Create a new project or select existing one")
+    print("   3. Enable Gmail API")
+    print("   4. Create OAuth 2.0 Client ID credentials")
+    print("   5. Download credentials.json and place it in the JAI_Assistant directory")
+    print("   6. Copy credentials.json.template to credentials.json and fill in your details")
+    return False
 
 def test_gmail_setup():
     """Test Gmail OAuth setup and connection"""
     print("🔧 Testing Gmail OAuth Setup...")
     
-    # Check if credentials file exists
-    if not os.path.exists('credentials.json'):
-        print("❌ credentials.json not found!")
-        print("📋 Please follow these steps:")
-        print("   1. Go to Google Cloud Console: https://console.cloud.google.com/")
-        print("   2. Create a new project or select existing one")
-        print("   3. Enable Gmail API")
-        print("   4. Create OAuth 2.0 Client ID credentials")
-        print("   5. Download credentials.json and place it in the JAI_Assistant directory")
-        print("   6. Copy credentials.json.template to credentials.json and fill in your details")
-        return False
-    
-    print("✅ credentials.json found")
+    assert check_credentials(), "credentials.json not found"
     
     # Test connection
     print("🔗 Testing Gmail connection...")
-    result = test_gmail_connection()
-    
-    if result['success']:
-        print(f"✅ Gmail connection successful!")
-        print(f"   📧 Email: {result.get('email_address', 'Unknown')}")
-        print(f"   📨 Total messages: {result.get('messages_total', 'Unknown')}")
-        return True
-    else:
-        print(f"❌ Gmail connection failed: {result.get('error', 'Unknown error')}")
-        return False
+    result = check_gmail_connection()
+    assert result['success'], f"Gmail connection failed: {result.get('error', 'Unknown error')}"
+    print(f"✅ Gmail connection successful!")
+    print(f"   📧 Email: {result.get('email_address', 'Unknown')}")
+    print(f"   📨 Total messages: {result.get('messages_total', 'Unknown')}")
 
-def test_send_email():
-    """Test sending an email"""
+def test_send_email(recipient=None):
+    """Test sending an email (recipient defaults to $JAI_TEST_RECIPIENT)"""
     print("\n📧 Testing Email Sending...")
     
-    # Ask for recipient email
-    recipient = input("Enter recipient email address (or press Enter to skip): ").strip()
+    recipient = (recipient or os.environ.get('JAI_TEST_RECIPIENT', '')).strip()
     if not recipient:
         print("⏭️  Email test skipped")
-        return True
+        return
     
     # Send test email
     subject = "JAI Assistant Gmail Test"
@@ -67,65 +89,78 @@ JAI Assistant
     
     print(f"📤 Sending test email to {recipient}...")
     result = send_gmail_email(recipient, subject, body)
-    
-    if result['success']:
-        print(f"✅ Email sent successfully!")
-        print(f"   📧 Message ID: {result.get('message_id', 'N/A')}")
-        return True
-    else:
-        print(f"❌ Failed to send email: {result.get('error', 'Unknown error')}")
-        return False
+    assert result['success'], f"Failed to send email: {result.get('error', 'Unknown error')}"
+    print(f"✅ Email sent successfully!")
+    print(f"   📧 Message ID: {result.get('message_id', 'N/A')}")
 
 def test_jai_integration():
     """Test JAI assistant integration"""
     print("\n🤖 Testing JAI Assistant Integration...")
     
     try:
-        # Import JAI assistant
-        sys.path.append('.')
+        # Imported once per process; later calls reuse sys.modules
         import jai_assistant
-        
-        # Check if Gmail is available
-        if hasattr(jai_assistant, 'GMAIL_AVAILABLE') and jai_assistant.GMAIL_AVAILABLE:
-            print("✅ Gmail integration available in JAI Assistant")
-            
-            # Test intent classification
-            test_commands = [
-                "send email to test@example.com with subject Test",
-                "test gmail",
-                "check gmail connection"
-            ]
-            
-            for cmd in test_commands:
-                intent, args = jai_assistant.classify_intent(cmd)
-                print(f"   📝 '{cmd}' -> Intent: {intent}, Args: {args}")
-            
-            return True
-        else:
-            print("❌ Gmail integration not available in JAI Assistant")
-            return False
-            
-    except ImportError as e:
-        print(f"❌ Failed to import JAI Assistant: {e}")
-        return False
     except Exception as e:
-        print(f"❌ Error testing JAI integration: {e}")
-        return False
+        raise AssertionError(f"Failed to import JAI Assistant: {e}") from e
+    
+    assert getattr(jai_assistant, 'GMAIL_AVAILABLE', False), "Gmail integration not available in JAI Assistant"
+    print("✅ Gmail integration available in JAI Assistant")
+    
+    # Test intent classification
+    intents = jai_assistant.classify_intent_batch(list(GMAIL_TEST_COMMANDS))
+    for cmd, (intent, args) in zip(GMAIL_TEST_COMMANDS, intents):
+        print(f"   📝 '{cmd}' -> Intent: {intent}, Args: {args}")
+    assert [intent for intent, _ in intents] == ['send_email', 'test_gmail', 'test_gmail'], \
+        f"Unexpected intents: {intents}"
+    assert intents == [jai_assistant.classify_intent(cmd) for cmd in GMAIL_TEST_COMMANDS], \
+        "classify_intent_batch disagrees with classify_intent"
+
+def run_simple():
+    """Offline check: imports, credentials file and intent routing (no OAuth, no email)"""
+    print("🔧 JAI Assistant Gmail Integration Test")
+    print("=" * 40)
+    
+    import_ok = passed(test_gmail_import)
+    creds_ok = check_credentials()
+    jai_ok = passed(test_jai_integration) if import_ok else False
+    
+    print("\n📊 Results:")
+    print(f"   Gmail Import: {'✅' if import_ok else '❌'}")
+    print(f"   Credentials: {'✅' if creds_ok else '❌'}")
+    print(f"   JAI Integration: {'✅' if jai_ok else '❌'}")
+    
+    if import_ok and creds_ok and jai_ok:
+        print("\n🎉 Gmail integration is ready!")
+        print("\n🔐 First-time setup:")
+        print("   1. Run JAI Assistant")
+        print('   2. Say "test gmail"')
+        print("   3. Complete OAuth in browser")
+        print("   4. Start sending emails!")
+    else:
+        print("\n⚠️  Some issues found. Please check above.")
 
 def main():
     """Main test function"""
+    parser = argparse.ArgumentParser(description="Test JAI's Gmail OAuth integration")
+    parser.add_argument("--simple", action="store_true",
+                        help="Only check imports, credentials.json and intent routing")
+    if parser.parse_args().simple:
+        run_simple()
+        return
+    
     print("🚀 JAI Assistant Gmail OAuth Test Suite")
     print("=" * 50)
     
     # Test Gmail setup
-    setup_ok = test_gmail_setup()
+    setup_ok = passed(test_gmail_setup)
     
     if setup_ok:
         # Test email sending
-        email_ok = test_send_email()
+        recipient = os.environ.get('JAI_TEST_RECIPIENT') or input("Enter recipient email address (or press Enter to skip): ")
+        email_ok = passed(test_send_email, recipient)
         
         # Test JAI integration
-        jai_ok = test_jai_integration()
+        jai_ok = passed(test_jai_integration)
         
         print("\n📊 Test Results:")
         print(f"   Gmail Setup: {'✅' if setup_ok else '❌'}")
@@ -148,5 +183,4 @@ def main():
         print("   3. Run this test again")
 
 if __name__ == "__main__":
-    from datetime import datetime
     main()
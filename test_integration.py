@@ -4,12 +4,42 @@
 Integration test suite for JAI Assistant.
 Tests all major components and their interactions.
 """
+import io
 import sys
+import json
+import time
 import logging
+import argparse
+import threading
+import contextlib
 from datetime import datetime, timedelta
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+def run_with_timeout(test_func, timeout):
+    """Run test_func on a daemon thread; a test still running after timeout seconds fails.
+
+    A daemon thread rather than an executor worker, so a test stuck in a
+    driver call cannot keep the process alive once the suite has finished.
+    """
+    outcome = {}
+
+    def _target():
+        try:
+            outcome['result'] = test_func()
+        except Exception as e:
+            outcome['error'] = e
+
+    worker = threading.Thread(target=_target, name=test_func.__name__, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError(f"timed out after {timeout}s")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
 def test_imports():
     """Test that all modules can be imported."""
     print("\n" + "="*60)
@@ -72,8 +102,8 @@ def test_tts():
     try:
         from tts import speak
         
-        # Test with a short phrase (non-blocking)
-        result = speak("Testing JAI speech system", timeout=5)
+        # A single word is enough to prove the engine reaches the output device
+        result = speak("OK", timeout=5)
         if result:
             print("[OK] TTS working - you should hear audio")
         else:
@@ -215,27 +245,58 @@ def test_jai_server():
         return False
 
 
-def main():
+# (name, test, seconds before the test counts as hung)
+TESTS = [
+    ("Module Imports", test_imports, 30),
+    ("Personality", test_personality, 5),
+    ("Text-to-Speech", test_tts, 10),
+    ("Memory System", test_memory, 10),
+    ("Calendar & Reminders", test_calendar, 10),
+    ("Media Controls", test_media, 10),
+    ("JAI Server", test_jai_server, 60),
+]
+
+
+def run_json():
+    """Run all tests quietly and print one JSON list of results."""
+    records = []
+    captured = io.StringIO()
+    # Swapped for the whole run: a timed-out test may keep printing from its thread
+    with contextlib.redirect_stdout(captured):
+        for name, test_func, timeout in TESTS:
+            start = time.monotonic()
+            record = {'name': name, 'passed': False}
+            try:
+                record['passed'] = bool(run_with_timeout(test_func, timeout))
+            except Exception as e:
+                record['error'] = str(e)
+            record['seconds'] = round(time.monotonic() - start, 3)
+            record['output'] = captured.getvalue()
+            captured.seek(0)
+            captured.truncate()
+            records.append(record)
+    json.dump(records, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0 if all(r['passed'] for r in records) else 1
+
+
+def main(argv=None):
     """Run all tests."""
+    parser = argparse.ArgumentParser(description="JAI integration test suite")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON instead of a report")
+    args = parser.parse_args(argv)
+    if args.json:
+        return run_json()
+
     print("\n" + "="*60)
     print("JAI INTEGRATION TEST SUITE")
     print("="*60)
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    tests = [
-        ("Module Imports", test_imports),
-        ("Personality", test_personality),
-        ("Text-to-Speech", test_tts),
-        ("Memory System", test_memory),
-        ("Calendar & Reminders", test_calendar),
-        ("Media Controls", test_media),
-        ("JAI Server", test_jai_server),
-    ]
-    
     results = {}
-    for name, test_func in tests:
+    for name, test_func, timeout in TESTS:
         try:
-            results[name] = test_func()
+            results[name] = run_with_timeout(test_func, timeout)
         except Exception as e:
             print(f"\n[FAIL] {name} crashed: {e}")
             results[name] = False
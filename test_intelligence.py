@@ -11,13 +11,17 @@ SERVER_URL = "http://localhost:8001"
 USERNAME = "admin"
 PASSWORD = "adminpass"
 
+# One keep-alive session shared by every question
+_session = requests.Session()
+_session.auth = HTTPBasicAuth(USERNAME, PASSWORD)
+_session.headers.update({"Content-Type": "application/json"})
+
 def test_question(question: str) -> str:
     """Send a question to JAI and get response."""
     try:
-        response = requests.post(
+        response = _session.post(
             f"{SERVER_URL}/command",
             json={"command": question},
-            auth=HTTPBasicAuth(USERNAME, PASSWORD),
             timeout=45
         )
         response.raise_for_status()
@@ -53,6 +57,7 @@ def main():
         ("How many days in a year?", "General"),
     ]
     
+    # One question at a time: they share the server-side conversation state
     for i, (question, category) in enumerate(test_questions, 1):
         print(f"\n{'='*70}")
         print(f"Test {i}/{len(test_questions)} - {category}")
@@ -63,7 +68,7 @@ def main():
         answer = test_question(question)
         print(answer)
         
-        if i < len(test_questions):
+        if i < len(test_questions) and sys.stdin.isatty():
             input("\nPress Enter for next question...")
     
     print("\n" + "="*70)
@@ -84,8 +84,11 @@ def main():
     print("="*60)
     
     # Interactive mode
-    print("\n💡 Want to test custom commands? (y/n)")
-    choice = input("> ").strip().lower()
+    # Only offer interactive mode when someone is at the terminal
+    choice = 'n'
+    if sys.stdin.isatty():
+        print("\n💡 Want to test custom commands? (y/n)")
+        choice = input("> ").strip().lower()
     
     if choice == 'y':
         print("\n🎮 Interactive Mode - Type 'exit' to quit")
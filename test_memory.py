@@ -1,12 +1,34 @@
 # test_memory.py
 from memory import JAIMemory
-try:
-    memory = JAIMemory()
+
+def test_long_term_roundtrip():
+    # In-memory database: no file opened, nothing left behind between runs
+    memory = JAIMemory(db_path=":memory:")
     memory.remember_long_term("name", "Abdul Rahman", importance=0.8)
-    print("Stored: name = Abdul Rahman")
     value = memory.recall_long_term("name")
-    print(f"Recalled: {value}")
+    assert value == "Abdul Rahman", f"Recalled: {value}"
     results = memory.search_memories("name")
+    assert results, "search_memories('name') returned nothing"
     print(f"Search results: {results}")
-except Exception as e:
-    print(f"Memory error: {e}")
\ No newline at end of file
+
+def test_search_substring_and_prefix():
+    # An in-word match must not be hidden by a word-prefix match elsewhere
+    memory = JAIMemory(db_path=":memory:")
+    memory.remember_long_term("name", "Abdul Rahman", importance=0.8)
+    memory.remember_long_term("job", "manager at ACME", importance=0.8)
+    keys = {r["key"] for r in memory.search_memories("man")}
+    assert keys == {"name", "job"}, f"search_memories('man') keys: {keys}"
+
+def test_search_multi_word():
+    # A multi-word query still finds the phrase as a substring
+    memory = JAIMemory(db_path=":memory:")
+    memory.remember_long_term("name", "Abdul Rahman", importance=0.8)
+    memory.remember_long_term("city", "Karachi", importance=0.5)
+    keys = [r["key"] for r in memory.search_memories("abdul rahman")]
+    assert keys == ["name"], f"search_memories('abdul rahman') keys: {keys}"
+
+if __name__ == "__main__":
+    test_long_term_roundtrip()
+    test_search_substring_and_prefix()
+    test_search_multi_word()
+    print("Memory test passed")
@@ -2,10 +2,13 @@
 Test automatic reminder alerts - demonstrates how JAI will speak when time arrives.
 This creates a reminder for 10 seconds from now and waits for it to trigger.
 """
-import time
+import threading
 from datetime import datetime, timedelta
 from jai_calendar import CalendarManager
 
+# Set by the alert handler so main() stops waiting as soon as the reminder fires
+fired = threading.Event()
+
 def demo_alert_handler(reminder):
     """This simulates what JAI will do when reminder triggers."""
     title = reminder['title']
@@ -20,6 +23,19 @@ def demo_alert_handler(reminder):
     print(f"\n💬 JAI SPEAKS: 'Sir, it's time to {title}. Your reminder has triggered.'\n")
     print("(With TTS enabled, you would HEAR this spoken aloud!)")
     print(f"{'='*60}\n")
+    fired.set()
+
+def test_reminder_fires():
+    """Fast-forward to the reminder time instead of waiting for the scheduler"""
+    fired.clear()
+    cal = CalendarManager(db_path=":memory:", on_reminder=demo_alert_handler)
+    remind_time = datetime.now() + timedelta(seconds=10)
+    cal.add_reminder("open WhatsApp", remind_time)
+    
+    assert cal.fire_due_reminders(now=remind_time - timedelta(seconds=1)) == 0
+    assert cal.fire_due_reminders(now=remind_time) == 1
+    assert fired.is_set(), "reminder did not fire"
+    assert cal.get_pending_reminders() == []
 
 def main():
     print("\n" + "="*60)
@@ -30,7 +46,7 @@ def main():
     print("when a reminder time arrives.\n")
     
     # Initialize calendar with our demo handler
-    cal = CalendarManager(db_path="test_reminder_alert.db", on_reminder=demo_alert_handler)
+    cal = CalendarManager(db_path=":memory:", on_reminder=demo_alert_handler)
     
     # Set a reminder for 10 seconds from now
     remind_time = datetime.now() + timedelta(seconds=10)
@@ -43,8 +59,8 @@ def main():
     
     cal.add_reminder(task, remind_time)
     
-    # Wait for the reminder to trigger
-    time.sleep(12)
+    # Wait for the reminder to trigger (a few seconds of slack for the scheduler)
+    assert fired.wait(15), "reminder did not fire"
     
     print("\n" + "="*60)
     print("TEST COMPLETE!")
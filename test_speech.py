@@ -1,16 +1,27 @@
 # test_speech.py
-import speech_recognition as sr
+import os
+import sys
 import logging
-logging.basicConfig(level=logging.INFO, filename='test_speech.log', filemode='a',
-                    format='%(asctime)s - %(levelname)s - %(message)s')
-r = sr.Recognizer()
-with sr.Microphone() as source:
-    print("Say: weather in Canada")
-    audio = r.listen(source, timeout=7)
-    try:
-        query = r.recognize_google(audio)
-        print(f"Heard: {query}")
-        logging.info("Heard: %s", query)
-    except Exception as e:
-        print(f"Error: {e}")
-        logging.error("Error: %s", e)
\ No newline at end of file
+
+def main():
+    # Nobody is there to speak in CI or a piped run; don't sit on the microphone
+    if not sys.stdin.isatty() or os.environ.get('CI'):
+        print("Skipped: speech test needs an interactive terminal")
+        return
+    import speech_recognition as sr
+    logging.basicConfig(level=logging.INFO, filename='test_speech.log', filemode='a',
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    r = sr.Recognizer()
+    with sr.Microphone() as source:
+        print("Say: weather in Canada")
+        audio = r.listen(source, timeout=7)
+        try:
+            query = r.recognize_google(audio)
+            print(f"Heard: {query}")
+            logging.info("Heard: %s", query)
+        except Exception as e:
+            print(f"Error: {e}")
+            logging.error("Error: %s", e)
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,52 @@
 # test_tts.py
 import pyttsx3
+import functools
 import logging
+import re
 import threading
-import queue
+import time
 logging.basicConfig(level=logging.INFO, filename='test_tts.log', filemode='a',
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Whole words only, so "Female" voices are not picked up by "male"
+_MALE_VOICE_RE = re.compile(r'\b(?:male|david|mark)\b', re.I)
+
+@functools.lru_cache(maxsize=1)
+def _get_engine():
+    """Initialise the driver and pick the voice once; later calls reuse the engine"""
+    engine = pyttsx3.init()
+    male_voice = next((v.id for v in engine.getProperty('voices') if _MALE_VOICE_RE.search(v.name)), None)
+    if male_voice:
+        engine.setProperty('voice', male_voice)
+        logging.info("Male voice selected: %s", male_voice)
+    else:
+        logging.warning("No male voice found")
+    engine.setProperty('rate', 150)
+    engine.setProperty('volume', 0.9)
+    return engine
+
 def speak_with_timeout(text, timeout=10):
     try:
-        engine = pyttsx3.init()
-        voices = engine.getProperty('voices')
-        male_voice = None
-        for v in voices:
-            if "male" in v.name.lower() or "david" in v.name.lower() or "mark" in v.name.lower():
-                male_voice = v.id
-                break
-        if male_voice:
-            engine.setProperty('voice', male_voice)
-            logging.info("Male voice selected: %s", male_voice)
-        else:
-            logging.warning("No male voice found")
-        engine.setProperty('rate', 150)
-        engine.setProperty('volume', 0.9)
-        result_queue = queue.Queue()
-        def speak_thread():
+        engine = _get_engine()
+        done = threading.Event()
+        # Driven from this thread: the finished-utterance callback signals completion
+        token = engine.connect('finished-utterance', lambda name, completed: done.set())
+        try:
+            engine.say(text)
+            engine.startLoop(False)
+            deadline = time.monotonic() + timeout
             try:
-                engine.say(text)
-                engine.runAndWait()
-                result_queue.put(True)
-            except Exception as e:
-                result_queue.put(str(e))
-        thread = threading.Thread(target=speak_thread)
-        thread.start()
-        thread.join(timeout)
-        if thread.is_alive():
+                while not done.is_set() and time.monotonic() < deadline:
+                    engine.iterate()
+                    done.wait(0.01)
+            finally:
+                engine.endLoop()
+        finally:
+            engine.disconnect(token)
+        if not done.is_set():
             logging.error("TTS timed out after %s seconds", timeout)
             return False
-        return result_queue.get() is True
+        return True
     except Exception as e:
         logging.error("TTS setup failed: %s", e)
         return False
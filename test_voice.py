@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the STT VoiceListener control flow without audio hardware.
+
+speech_recognition is replaced with a mock, so no PortAudio stream is opened,
+no devices are enumerated and nothing waits on a real microphone.
+"""
+
+from unittest import mock
+
+import stt
+
+def _mock_sr():
+    """Stand-in for the speech_recognition module"""
+    sr = mock.MagicMock()
+    sr.Microphone.list_microphone_names.return_value = ['MockMic']
+    sr.Recognizer.return_value.recognize_google.return_value = 'hello test'
+    # listen_once names these in except clauses, so they must be real exceptions
+    for name in ('WaitTimeoutError', 'UnknownValueError', 'RequestError'):
+        setattr(sr, name, type(name, (Exception,), {}))
+    return sr
+
+def test_listen_once():
+    """Recognized text comes back from the (mocked) microphone"""
+    with mock.patch.object(stt, 'sr', _mock_sr()) as sr:
+        assert sr.Microphone.list_microphone_names() == ['MockMic']
+        listener = stt.VoiceListener(wake_word="test")
+        assert listener.listen_once(timeout=5, phrase_time_limit=5) == 'hello test'
+
+def test_open_stream():
+    """listen_once reuses the stream held open by open_stream"""
+    with mock.patch.object(stt, 'sr', _mock_sr()) as sr:
+        listener = stt.VoiceListener(wake_word="test")
+        opened = sr.Microphone.call_count
+        with listener.open_stream():
+            assert listener.listen_once(timeout=5) == 'hello test'
+            assert listener.listen_once(timeout=5) == 'hello test'
+        assert sr.Microphone.call_count == opened + 1
+
+def test_wake_word():
+    """wait_for_wake_word matches the wake word case-insensitively"""
+    with mock.patch.object(stt, 'sr', _mock_sr()):
+        listener = stt.VoiceListener(wake_word="Test")
+        with mock.patch.object(stt.VoiceListener, 'listen_once', autospec=True, return_value='hello TEST'):
+            assert listener.wait_for_wake_word(timeout=5)
+        with mock.patch.object(stt.VoiceListener, 'listen_once', autospec=True, return_value=None):
+            assert not listener.wait_for_wake_word(timeout=5)
+
+def test_wake_word_alternatives():
+    """Comma-separated wake words each trigger, as whole words only"""
+    with mock.patch.object(stt, 'sr', _mock_sr()):
+        listener = stt.VoiceListener(wake_word="Activate aj, hey jai")
+        for heard, expected in (('hey JAI open notes', True), ('activate aj', True), ('they jail', False)):
+            with mock.patch.object(stt.VoiceListener, 'listen_once', autospec=True, return_value=heard):
+                assert listener.wait_for_wake_word(timeout=5) == expected
+
+if __name__ == "__main__":
+    test_listen_once()
+    test_open_stream()
+    test_wake_word()
+    test_wake_word_alternatives()
+    print("✅ VoiceListener tests passed")
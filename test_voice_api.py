@@ -4,9 +4,52 @@ Test JAI website voice mode API endpoints
 """
 
 import sys
+import socket
 import requests
 import json
 import time
+import asyncio
+
+from script_checks import passed, SoftFailures
+
+# One keep-alive session for every probe instead of a new connection per request
+_session = requests.Session()
+_session.mount('http://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+# (host, port) pairs that already answered; probed once per process
+_ready_servers = set()
+
+def wait_for_server(host="localhost", port=8080, attempts=5):
+    """Wait for /api/health to answer, backing off exponentially from 100 ms"""
+    if (host, port) in _ready_servers:
+        return True
+    url = f"http://{host}:{port}/api/health"
+    delay = 0.1
+    for _ in range(attempts):
+        try:
+            # A bare TCP connect is far cheaper than an HTTP round-trip
+            socket.create_connection((host, port), timeout=0.2).close()
+            if _session.get(url, timeout=1).status_code == 200:
+                _ready_servers.add((host, port))
+                return True
+        except OSError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.7, 2.0)
+    return False
+
+# Transport for the async probes; tests swap in an httpx.MockTransport
+_probe_transport = None
+
+async def _run_probes(base_url, probes):
+    """Issue every probe on one event loop and one client; exceptions are returned, not raised"""
+    # Imported here so the rest of the script (and pytest collection) works without httpx
+    import httpx
+    async with httpx.AsyncClient(base_url=base_url, timeout=5, transport=_probe_transport) as client:
+        return await asyncio.gather(
+            *(client.request(method, path, **kw) for _, method, path, kw in probes),
+            return_exceptions=True,
+        )
 
 def test_api_endpoints():
     """Test the JAI website API endpoints"""
@@ -15,84 +58,95 @@ def test_api_endpoints():
     print("🔧 Testing JAI Website API Endpoints")
     print("=" * 50)
     
+    if not wait_for_server():
+        print("\n💡 Make sure JAI Assistant is running:")
+        print("   python jai_assistant.py")
+        raise AssertionError("Server connection failed: nothing answering on localhost:8080")
+    
+    fail = SoftFailures()
+    
+    # The probes are independent, so fire them together and report in order
+    probes = [
+        ("text", "POST", "/api/text", {"json": {"text": "hello"}}),
+        ("persona", "POST", "/api/persona", {"json": {"persona": "therapist"}}),
+        ("voice", "POST", "/api/voice", {}),  # no audio file: 400 means the endpoint exists
+        ("image", "POST", "/api/image", {}),  # no image file: 400 means the endpoint exists
+        ("root", "GET", "/", {}),
+    ]
+    results = dict(zip((p[0] for p in probes), asyncio.run(_run_probes(base_url, probes))))
+    
+    def outcome(name):
+        result = results[name]
+        if isinstance(result, Exception):
+            return None, result
+        return result, None
+    
     # Test 1: Text API
     print("1. Testing /api/text endpoint...")
-    try:
-        response = requests.post(f"{base_url}/api/text", 
-                                json={"text": "hello"}, 
-                                headers={"Content-Type": "application/json"})
-        if response.status_code == 200:
-            data = response.json()
-            print(f"   ✅ Text API working: {data.get('response', 'No response')[:50]}...")
-        else:
-            print(f"   ❌ Text API failed: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Text API error: {e}")
+    response, error = outcome("text")
+    if error:
+        fail(f"Text API error: {error}")
+    elif response.status_code == 200:
+        data = response.json()
+        print(f"   ✅ Text API working: {data.get('response', 'No response')[:50]}...")
+    else:
+        fail(f"Text API failed: {response.status_code}")
     
     print()
     
     # Test 2: Persona API
     print("2. Testing /api/persona endpoint...")
-    try:
-        response = requests.post(f"{base_url}/api/persona",
-                                json={"persona": "therapist"},
-                                headers={"Content-Type": "application/json"})
-        if response.status_code == 200:
-            data = response.json()
-            print(f"   ✅ Persona API working: {data}")
-        else:
-            print(f"   ❌ Persona API failed: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Persona API error: {e}")
+    response, error = outcome("persona")
+    if error:
+        fail(f"Persona API error: {error}")
+    elif response.status_code == 200:
+        print(f"   ✅ Persona API working: {response.json()}")
+    else:
+        fail(f"Persona API failed: {response.status_code}")
     
     print()
     
     # Test 3: Voice API (without audio file)
     print("3. Testing /api/voice endpoint...")
-    try:
-        # This will fail without audio file, but should show the endpoint exists
-        response = requests.post(f"{base_url}/api/voice")
-        if response.status_code == 400:
-            print("   ✅ Voice API endpoint exists (expects audio file)")
-        elif response.status_code == 200:
-            print("   ✅ Voice API working")
-        else:
-            print(f"   ⚠️  Voice API response: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Voice API error: {e}")
+    response, error = outcome("voice")
+    if error:
+        fail(f"Voice API error: {error}")
+    elif response.status_code == 400:
+        print("   ✅ Voice API endpoint exists (expects audio file)")
+    elif response.status_code == 200:
+        print("   ✅ Voice API working")
+    else:
+        print(f"   ⚠️  Voice API response: {response.status_code}")
     
     print()
     
     # Test 4: Image API (without image file)
     print("4. Testing /api/image endpoint...")
-    try:
-        response = requests.post(f"{base_url}/api/image")
-        if response.status_code == 400:
-            print("   ✅ Image API endpoint exists (expects image file)")
-        elif response.status_code == 200:
-            print("   ✅ Image API working")
-        else:
-            print(f"   ⚠️  Image API response: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Image API error: {e}")
+    response, error = outcome("image")
+    if error:
+        fail(f"Image API error: {error}")
+    elif response.status_code == 400:
+        print("   ✅ Image API endpoint exists (expects image file)")
+    elif response.status_code == 200:
+        print("   ✅ Image API working")
+    else:
+        print(f"   ⚠️  Image API response: {response.status_code}")
     
     print()
     
     # Test 5: Check if server is running
     print("5. Testing server connection...")
-    try:
-        response = requests.get(f"{base_url}/", timeout=5)
-        if response.status_code == 200:
-            print("   ✅ JAI server is running")
-        else:
-            print(f"   ⚠️  Server response: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Server connection failed: {e}")
+    response, error = outcome("root")
+    if error:
         print("\n💡 Make sure JAI Assistant is running:")
         print("   python jai_assistant.py")
-        return False
+        raise AssertionError(f"Server connection failed: {error}")
+    if response.status_code == 200:
+        print("   ✅ JAI server is running")
+    else:
+        print(f"   ⚠️  Server response: {response.status_code}")
     
-    return True
+    fail.check()
 
 def test_voice_mode_workflow():
     """Test the complete voice mode workflow"""
@@ -100,31 +154,35 @@ def test_voice_mode_workflow():
     print("=" * 30)
     
     base_url = "http://localhost:8080"
+    assert wait_for_server(), "Server connection failed: nothing answering on localhost:8080"
+    fail = SoftFailures()
     
     # Test persona selection
     print("1. Selecting therapist persona...")
     try:
-        response = requests.post(f"{base_url}/api/persona",
+        response = _session.post(f"{base_url}/api/persona",
                                 json={"persona": "therapist"})
         if response.status_code == 200:
             print("   ✅ Persona selected")
         else:
-            print(f"   ❌ Persona selection failed: {response.status_code}")
+            fail(f"Persona selection failed: {response.status_code}")
     except Exception as e:
-        print(f"   ❌ Persona error: {e}")
+        fail(f"Persona error: {e}")
     
     # Test text command
     print("2. Sending text command...")
     try:
-        response = requests.post(f"{base_url}/api/text",
+        response = _session.post(f"{base_url}/api/text",
                                 json={"text": "what time is it"})
         if response.status_code == 200:
             data = response.json()
             print(f"   ✅ Response: {data.get('response', 'No response')}")
         else:
-            print(f"   ❌ Text command failed: {response.status_code}")
+            fail(f"Text command failed: {response.status_code}")
     except Exception as e:
-        print(f"   ❌ Text command error: {e}")
+        fail(f"Text command error: {e}")
+    
+    fail.check()
 
 def main():
     """Main test function"""
@@ -132,9 +190,9 @@ def main():
     print("=" * 40)
     
     # Test API endpoints
-    if test_api_endpoints():
+    if passed(test_api_endpoints, indent="   "):
         # Test workflow
-        test_voice_mode_workflow()
+        passed(test_voice_mode_workflow, indent="   ")
         
         print("\n🎯 Voice Mode Status:")
         print("✅ API endpoints are implemented")
@@ -3,9 +3,8 @@
 Test voice mode functionality in JAI Assistant
 """
 
-import sys
 import os
-sys.path.insert(0, '.')
+import operator
 
 def test_tts_import():
     """Test if TTS module can be imported"""
@@ -51,9 +50,9 @@ def test_voice_list(tts_module):
             voices = tts_module.get_voices()
             if voices:
                 print(f"✅ Found {len(voices)} available voices")
-                for i, voice in enumerate(voices[:3]):  # Show first 3
-                    voice_name = getattr(voice, 'name', 'Unknown')
-                    voice_lang = getattr(voice, 'languages', ['Unknown'])
+                # pyttsx3 Voice objects always carry name and languages
+                fetch = operator.attrgetter('name', 'languages')
+                for i, (voice_name, voice_lang) in enumerate(map(fetch, voices[:3])):  # Show first 3
                     print(f"   {i+1}. {voice_name} ({voice_lang})")
                 return True
             else:
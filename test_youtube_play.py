@@ -3,8 +3,8 @@
 import sys
 from jai_media import YouTubeController
 
-def test_youtube_play():
-    """Test YouTube play with yt-dlp."""
+def test_youtube_play(pause=False):
+    """Test YouTube play with yt-dlp (pause=True waits for Enter between queries)."""
     print("Testing YouTube auto-play with yt-dlp...")
     print("="*60)
     
@@ -23,13 +23,14 @@ def test_youtube_play():
         print("-"*60)
         
         # Wait for user confirmation
-        input("Press Enter to test next query (or Ctrl+C to exit)...")
+        if pause:
+            input("Press Enter to test next query (or Ctrl+C to exit)...")
     
     print("\n✅ All tests complete!")
 
 if __name__ == "__main__":
     try:
-        test_youtube_play()
+        test_youtube_play(pause=sys.stdin.isatty())
     except KeyboardInterrupt:
         print("\n\n👋 Test interrupted")
         sys.exit(0)
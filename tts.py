@@ -4,13 +4,18 @@ Enhanced Text-to-Speech utilities for JAI with multilingual support.
 Supports English, Urdu, Arabic, and French with appropriate voice selection.
 """
 import threading
-import queue
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import logging
 import re
 import os
+import io
 import sys
+import tempfile
+import wave
 import time
-from typing import Optional, Dict, Tuple, List
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple, List, NamedTuple
 import win32com.client as win32com_client
 
 # TTS engine is required; detect_language helpers are optional
@@ -20,21 +25,21 @@ except ImportError as e:
     logging.warning("pyttsx3 not available: %s", e)
     pyttsx3 = None
 
-# Optional: language detection
+# Optional (Windows): plays pre-rendered COMMON_PHRASES straight from memory
 try:
-    import langdetect
-    from langdetect import DetectorFactory, LangDetectException
-    DetectorFactory.seed = 0
-except Exception:
-    langdetect = None
-    class LangDetectException(Exception):
-        pass
+    import winsound
+except ImportError:
+    winsound = None
 
-# Optional: country/locale info (not strictly required)
+# Optional: shrinks the pre-rendered phrases to 16 kHz mono
 try:
-    import pycountry
-except Exception:
-    pycountry = None
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: language detection, imported by _get_langdetect() on first use
+langdetect = None
+_LANGDETECT_TRIED = False
 
 # Voice and language preferences via environment variables
 TTS_PREFERRED_VOICE = (os.environ.get("TTS_PREFERRED_VOICE", "") or "").lower()
@@ -43,12 +48,20 @@ TTS_ENGINE = (os.environ.get("TTS_ENGINE", "") or "").lower()
 _TTS_LOCK = threading.Lock()
 _ENGINE_INIT_LOCK = threading.Lock()
 _ENGINE = None
+_TTS_EXEC: Optional[ThreadPoolExecutor] = None
 _LAST_SPOKEN_TEXT = ""
 _LAST_SPOKEN_TS = 0.0
 _DEDUP_WINDOW_SEC = float(os.environ.get("TTS_DEDUP_WINDOW_SEC", "5.0"))
 _SPEAKING = False
 _SPEAKING_UNTIL = 0.0
 _SPEAK_COOLDOWN_SEC = float(os.environ.get("TTS_SPEAK_COOLDOWN_SEC", "0.8"))
+# language -> voice id chosen by _select_voice; system voices don't change at runtime
+_VOICE_CACHE: Dict[str, str] = {}
+# Last voice/rate/volume applied to _ENGINE; each setProperty is a SAPI round-trip
+_ENGINE_STATE: Dict[str, object] = {}
+# speak_stream() splits after sentence-ending punctuation, coalescing shorter fragments
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+_STREAM_MIN_CHARS = int(os.environ.get("TTS_STREAM_MIN_CHARS", "20"))
 
 def is_speaking() -> bool:
     try:
@@ -89,6 +102,25 @@ LANGUAGE_VOICE_MAPPING = {
     }
 }
 
+class _LangConfig(NamedTuple):
+    name: str
+    gender: str
+    keywords: Tuple[str, ...]
+    rtl: bool
+    rate: int
+
+# LANGUAGE_VOICE_MAPPING resolved once into immutable per-language records
+_LANG_CONFIG: Dict[str, _LangConfig] = {
+    code: _LangConfig(settings['name'], settings['gender'], tuple(settings['keywords']),
+                      settings['rtl'], settings['rate'])
+    for code, settings in LANGUAGE_VOICE_MAPPING.items()
+}
+# One alternation of each language's voice-name keywords, for scoring voices
+_VOICE_KEYWORD_RE: Dict[str, re.Pattern] = {
+    code: re.compile('|'.join(map(re.escape, config.keywords)))
+    for code, config in _LANG_CONFIG.items()
+}
+
 # Common phrases in different languages
 COMMON_PHRASES = {
     'en': {
@@ -121,48 +153,80 @@ COMMON_PHRASES = {
     }
 }
 
+# Every COMMON_PHRASES text, and an LRU of rendered WAV bytes keyed by
+# (language, text, rate, volume) for those and for speak(..., cache=True)
+_PHRASE_TEXTS = frozenset(text for phrases in COMMON_PHRASES.values() for text in phrases.values())
+_PHRASE_WAV: "OrderedDict[Tuple[str, str, int, float], bytes]" = OrderedDict()
+_PHRASE_CACHE_SIZE = int(os.environ.get("TTS_PHRASE_CACHE_SIZE", "128"))
+_PHRASE_SAMPLE_RATE = 16000
+
+# Longer texts are detected without caching so one paragraph can't pin memory
+_DETECT_CACHE_MAX_LEN = 512
+# Arabic script block, and the letters in it that only Urdu uses
+_ARABIC_RE = re.compile('[\u0600-\u06FF]')
+_URDU_RE = re.compile('[پٹچڈڑژکگںہھے]')
+
+# Common words/fragments, each matched as one alternation over the lowercased text
+_FRENCH_INDICATORS = [
+    'le ', 'la ', 'les ', 'un ', 'une ', 'des ', 'je ', 'tu ', 'il ', 'elle ',
+    'nous ', 'vous ', 'ils ', 'elles', 'bonjour', 'merci', 'au revoir',
+    'comment ça va', 'je m\'appelle', 's\'il vous plaît', 'excusez-moi'
+]
+_ENGLISH_INDICATORS = [
+    'the ', 'and ', 'ing ', 'tion ', 'you ', 'are ', 'is ', 'am ', 'hello',
+    'hi ', 'how are you', 'what\'s up', 'good morning', 'good night'
+]
+_FRENCH_RE = re.compile('|'.join(map(re.escape, _FRENCH_INDICATORS)))
+_ENGLISH_RE = re.compile('|'.join(map(re.escape, _ENGLISH_INDICATORS)))
+
 def detect_language(text: str) -> str:
     """
     Detect the language of the given text with improved accuracy.
     Returns language code ('en', 'ur', 'ar', 'fr').
+    
+    Results are cached per (stripped) text, since spoken replies and commands repeat.
     """
-    if not text.strip():
+    text = text.strip()
+    if not text:
         return 'en'
-        
-    text_lower = text.lower().strip()
+    if len(text) > _DETECT_CACHE_MAX_LEN:
+        return _detect_language(text)
+    return _detect_language_cached(text)
+
+def _detect_language(text: str) -> str:
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("detect_language cache: %s", _detect_language_cached.cache_info())
+    text_lower = text.lower()
+    
+    # ASCII text can't be Arabic script; short of a French indicator it's English
+    if text.isascii():
+        return 'fr' if _FRENCH_RE.search(text_lower) else 'en'
     
     # Check for specific language patterns first
     
     # Check for Arabic script (Arabic, Urdu, Persian, etc.)
-    arabic_script = any('\u0600' <= char <= '\u06FF' for char in text)
-    
-    if arabic_script:
-        # Check for Urdu-specific characters
-        urdu_chars = ['پ', 'ٹ', 'چ', 'ڈ', 'ڑ', 'ژ', 'ک', 'گ', 'ں', 'ہ', 'ھ', 'ے']
-        if any(char in text for char in urdu_chars):
+    arabic = _ARABIC_RE.search(text)
+    if arabic:
+        # Check for Urdu-specific characters (all inside the Arabic block, so
+        # none can precede the first Arabic character)
+        if _URDU_RE.search(text, arabic.start()):
             return 'ur'  # Urdu
         return 'ar'  # Default to Arabic for other Arabic script
     
     # Check for French indicators
-    french_indicators = [
-        'le ', 'la ', 'les ', 'un ', 'une ', 'des ', 'je ', 'tu ', 'il ', 'elle ',
-        'nous ', 'vous ', 'ils ', 'elles', 'bonjour', 'merci', 'au revoir',
-        'comment ça va', 'je m\'appelle', 's\'il vous plaît', 'excusez-moi'
-    ]
-    if any(indicator in text_lower for indicator in french_indicators):
+    if _FRENCH_RE.search(text_lower):
         return 'fr'
     
     # Check for English indicators (as fallback)
-    english_indicators = [
-        'the ', 'and ', 'ing ', 'tion ', 'you ', 'are ', 'is ', 'am ', 'hello',
-        'hi ', 'how are you', 'what\'s up', 'good morning', 'good night'
-    ]
-    if any(indicator in text_lower for indicator in english_indicators):
+    if _ENGLISH_RE.search(text_lower):
         return 'en'
     
     # Use langdetect as fallback
+    detector = _get_langdetect()
+    if detector is None:
+        return 'en'
     try:
-        lang = langdetect.detect(text)
+        lang = detector.detect(text)
         # Map to our supported languages
         if lang.startswith('ar'):
             return 'ar'
@@ -171,9 +235,30 @@ def detect_language(text: str) -> str:
         elif lang.startswith('fr'):
             return 'fr'
         return 'en'  # Default to English
-    except (LangDetectException, Exception):
+    except Exception:
         return 'en'  # Default to English on error
 
+def _get_langdetect():
+    """The langdetect module, or None if it isn't installed"""
+    global langdetect, _LANGDETECT_TRIED
+    if not _LANGDETECT_TRIED:
+        _LANGDETECT_TRIED = True
+        try:
+            import langdetect as _langdetect
+            _langdetect.DetectorFactory.seed = 0
+            langdetect = _langdetect
+        except Exception:
+            pass
+    return langdetect
+
+_detect_language_cached = functools.lru_cache(maxsize=1024)(_detect_language)
+
+def _set_property(engine, name: str, value) -> None:
+    """engine.setProperty, skipped when the value is already applied"""
+    if _ENGINE_STATE.get(name) != value:
+        engine.setProperty(name, value)
+        _ENGINE_STATE[name] = value
+
 def _select_voice(engine, language: str = 'en') -> bool:
     """
     Select the best available voice for the specified language.
@@ -182,23 +267,27 @@ def _select_voice(engine, language: str = 'en') -> bool:
     try:
         if not pyttsx3:
             return False
+        if not TTS_PREFERRED_VOICE and language in _VOICE_CACHE:
+            _set_property(engine, 'voice', _VOICE_CACHE[language])
+            return True
         voices = engine.getProperty('voices')
         if not voices:
             logging.warning("No voices available")
             return False
         # Get language settings
-        lang_settings = LANGUAGE_VOICE_MAPPING.get(language, LANGUAGE_VOICE_MAPPING['en'])
-        target_gender = lang_settings['gender']
-        keywords = lang_settings['keywords']
-        logging.info(f"Looking for {language} voice with keywords: {keywords}")
+        lang_config = _LANG_CONFIG.get(language, _LANG_CONFIG['en'])
+        target_gender = lang_config.gender
+        keywords = lang_config.keywords
+        keyword_re = _VOICE_KEYWORD_RE.get(language, _VOICE_KEYWORD_RE['en'])
+        logging.debug("Looking for %s voice with keywords: %s", language, keywords)
         # Prefer explicitly configured voice if available
         if TTS_PREFERRED_VOICE:
             for voice in voices:
                 voice_name = (voice.name or '').lower()
                 if TTS_PREFERRED_VOICE in voice_name:
                     try:
-                        engine.setProperty('voice', voice.id)
-                        logging.info(f"Selected preferred voice: {voice.name}")
+                        _set_property(engine, 'voice', voice.id)
+                        logging.info("Selected preferred voice: %s", voice.name)
                         return True
                     except Exception:
                         pass
@@ -214,34 +303,34 @@ def _select_voice(engine, language: str = 'en') -> bool:
             # Check for language match
             if language in voice_lang or any(lang in voice_lang for lang in ['en-us', 'en_gb'] if language == 'en'):
                 score += 100
-            # Check for keyword matches
-            for keyword in keywords:
-                if keyword in voice_name:
-                    score += 50
+            # Check for keyword matches (each distinct keyword counts once)
+            score += 50 * len(set(keyword_re.findall(voice_name)))
             # Check for gender match
             if target_gender in voice_name:
                 score += 30
             voice_scores.append((score, voice))
         # Sort by score (highest first)
         voice_scores.sort(reverse=True, key=lambda x: x[0])
-        # Log available voices for debugging
-        logging.info(f"Available voices (language: {language}):")
-        for score, voice in voice_scores[:5]:  # Log top 5 voices
-            logging.info(f"- {voice.name} (score: {score})")
+        # Log the top 5 voices for debugging
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Available voices (language: %s): %s", language,
+                          ', '.join(f"{voice.name} ({score})" for score, voice in voice_scores[:5]))
         # Select the best voice
         if voice_scores and voice_scores[0][0] > 0:
             best_voice = voice_scores[0][1]
-            engine.setProperty('voice', best_voice.id)
-            logging.info(f"Selected voice: {best_voice.name}")
+            _set_property(engine, 'voice', best_voice.id)
+            _VOICE_CACHE[language] = best_voice.id
+            logging.info("Selected voice: %s", best_voice.name)
             return True
         # Fallback to first available voice
         if voices:
-            engine.setProperty('voice', voices[0].id)
-            logging.warning(f"No ideal voice found for {language}, using: {voices[0].name}")
+            _set_property(engine, 'voice', voices[0].id)
+            _VOICE_CACHE[language] = voices[0].id
+            logging.warning("No ideal voice found for %s, using: %s", language, voices[0].name)
             return True
         return False
     except Exception as e:
-        logging.error(f"Error selecting voice: {e}", exc_info=True)
+        logging.error("Error selecting voice: %s", e, exc_info=True)
         return False
 
 def _get_engine(language: Optional[str] = None):
@@ -253,29 +342,31 @@ def _get_engine(language: Optional[str] = None):
             try:
                 # Try to initialize pyttsx3 even on Python 3.13
                 _ENGINE = pyttsx3.init()
+                _ENGINE_STATE.clear()
                 logging.info("pyttsx3 engine initialized successfully")
             except Exception as e:
-                logging.warning(f"pyttsx3 init failed, will use SAPI fallback: {e}")
+                logging.warning("pyttsx3 init failed, will use SAPI fallback: %s", e)
                 _ENGINE = None
     return _ENGINE
 
 def get_engine(language: Optional[str] = None):
     """Public function to get TTS engine"""
-    return _get_engine(language)
+    return _executor().submit(_get_engine, language).result()
 
 def get_voices():
     """Get list of available voices"""
+    try:
+        return _executor().submit(_get_voices).result(timeout=10)
+    except Exception as e:
+        logging.error("Error getting voices: %s", e)
+        return []
+
+def _get_voices():
     engine = _get_engine()
-    if engine:
-        try:
-            return engine.getProperty('voices')
-        except Exception as e:
-            logging.error(f"Error getting voices: {e}")
-            return []
-    return []
+    return engine.getProperty('voices') if engine else []
 
 def speak(text: str, language: Optional[str] = None, rate: Optional[int] = None, 
-          volume: float = 0.9, timeout: int = 20) -> bool:
+          volume: float = 0.9, timeout: int = 20, cache: bool = False) -> bool:
     """
     Speak the given text in the specified language with proper voice selection.
     
@@ -285,18 +376,129 @@ def speak(text: str, language: Optional[str] = None, rate: Optional[int] = None,
         rate: Speech rate (words per minute). If None, uses language default.
         volume: Volume (0.0 to 1.0)
         timeout: Maximum time to wait for speech to complete (seconds)
+        cache: Render the text to audio once and replay it on later calls
+            (Windows; for replies that repeat)
     
     Returns:
         bool: True if speech was successful, False otherwise
     """
+    future = speak_async(text, language, rate, volume, cache)
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        # Drop it if the executor hasn't started on it yet
+        future.cancel()
+        logging.error("TTS timed out after %s seconds", timeout)
+        return False
+
+def speak_async(text: str, language: Optional[str] = None, rate: Optional[int] = None,
+                volume: float = 0.9, cache: bool = False) -> Future:
+    """
+    Queue the text for speaking and return immediately.
+    
+    Takes the same arguments as speak(); the returned Future resolves to
+    True once the text has been spoken, or False on failure.
+    """
     if not pyttsx3:
         logging.error("TTS engine not available. Install pyttsx3: pip install pyttsx3")
-        return False
+        return _done(False)
     
     if not text.strip():
         logging.warning("Empty text provided to speak")
+        return _done(False)
+    if _is_duplicate(text):
+        return _done(True)
+
+    # Auto-detect language if not specified
+    if not language:
+        if TTS_FORCE_LANGUAGE:
+            language = TTS_FORCE_LANGUAGE
+        else:
+            language = detect_language(text)
+    return _enqueue(text, language, rate, volume, cache)
+
+def speak_stream(text: str, language: Optional[str] = None, rate: Optional[int] = None,
+                 volume: float = 0.9, timeout: int = 60) -> bool:
+    """
+    Speak the text one sentence at a time.
+    
+    Each sentence is queued separately, so the first one starts playing
+    without waiting for the whole response to be synthesized. Takes the same
+    arguments as speak(), with timeout covering the whole text.
+    """
+    future = speak_stream_async(text, language, rate, volume)
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        # Cancels the sentences not yet started
+        future.cancel()
+        logging.error("TTS timed out after %s seconds", timeout)
         return False
-    # Anti-repeat guard: skip if same text spoken very recently
+
+def speak_stream_async(text: str, language: Optional[str] = None, rate: Optional[int] = None,
+                       volume: float = 0.9) -> Future:
+    """
+    Queue the text sentence by sentence and return immediately.
+    
+    The returned Future resolves to True once every sentence has been
+    spoken (False if any failed); cancelling it drops the ones not started.
+    """
+    if not pyttsx3:
+        logging.error("TTS engine not available. Install pyttsx3: pip install pyttsx3")
+        return _done(False)
+    if not text.strip():
+        logging.warning("Empty text provided to speak")
+        return _done(False)
+    if _is_duplicate(text):
+        return _done(True)
+    if not language:
+        language = TTS_FORCE_LANGUAGE or detect_language(text)
+    return _gather([_enqueue(sentence, language, rate, volume) for sentence in _split_sentences(text)])
+
+def _gather(futures: List[Future]) -> Future:
+    """Future for all of futures: True once all resolved True; cancelling it cancels them"""
+    combined: Future = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def child_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] or combined.done():
+                return
+            combined.set_result(all(not f.cancelled() and f.exception() is None and f.result()
+                                    for f in futures))
+
+    def cancel_children(future):
+        if future.cancelled():
+            for f in futures:
+                f.cancel()
+
+    combined.add_done_callback(cancel_children)
+    if not futures:
+        combined.set_result(True)
+    for f in futures:
+        f.add_done_callback(child_done)
+    return combined
+
+def _split_sentences(text: str) -> List[str]:
+    """Split on sentence ends, joining fragments shorter than _STREAM_MIN_CHARS onto the next"""
+    chunks: List[str] = []
+    pending = ''
+    for sentence in _SENTENCE_END_RE.split(text.strip()):
+        pending = f"{pending} {sentence}" if pending else sentence
+        if len(pending) >= _STREAM_MIN_CHARS:
+            chunks.append(pending)
+            pending = ''
+    if pending:
+        if chunks:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+def _is_duplicate(text: str) -> bool:
+    """Anti-repeat guard: True if the same text was spoken very recently"""
     try:
         global _LAST_SPOKEN_TEXT, _LAST_SPOKEN_TS
         norm = (text or "").strip()
@@ -308,117 +510,229 @@ def speak(text: str, language: Optional[str] = None, rate: Optional[int] = None,
         _LAST_SPOKEN_TS = now
     except Exception:
         pass
+    return False
 
-    # Auto-detect language if not specified
-    if not language:
-        if TTS_FORCE_LANGUAGE:
-            language = TTS_FORCE_LANGUAGE
-        else:
-            language = detect_language(text)
+def _enqueue(text: str, language: str, rate: Optional[int], volume: float, cache: bool = False) -> Future:
+    """Apply the language's rate and RTL handling and submit the text to the TTS executor"""
+    cache = winsound is not None and (cache or text in _PHRASE_TEXTS)
+    speak_fn = _speak_phrase if cache else _speak_sync
+    text, rate = _speech_params(text, language, rate)
     
+    logging.info("Speaking in %s (rate: %s, volume: %s): %.100s...", language, rate, volume, text)
+    
+    try:
+        return _executor().submit(speak_fn, text, language, rate, volume)
+    except Exception as e:
+        logging.error("TTS executor error: %s", e, exc_info=True)
+        return _done(False)
+
+def _speech_params(text: str, language: str, rate: Optional[int]) -> Tuple[str, int]:
+    """(text, rate) as the engine gets them for this language"""
     # Get language settings
-    lang_settings = LANGUAGE_VOICE_MAPPING.get(language, LANGUAGE_VOICE_MAPPING['en'])
+    lang_config = _LANG_CONFIG.get(language, _LANG_CONFIG['en'])
     
     # Set language-specific parameters
     if rate is None:
-        rate = lang_settings.get('rate', 150)
+        rate = lang_config.rate
     
     # For RTL languages (Arabic, Urdu), add RTL markers
-    if lang_settings.get('rtl', False):
+    if lang_config.rtl:
         text = f"\u202B{text}\u202C"
+    return text, rate
+
+def prerender(texts: List[str], language: str = 'en', rate: Optional[int] = None,
+              volume: float = 0.9) -> Future:
+    """
+    Render texts into the replay cache in the background.
     
-    logging.info(f"Speaking in {language} (rate: {rate}, volume: {volume}): {text[:100]}...")
+    Their first speak(..., cache=True) then plays without waiting for the
+    engine. The returned Future resolves to True once all are rendered;
+    without pyttsx3 or winsound nothing is rendered and it resolves to False.
+    """
+    if not pyttsx3 or winsound is None:
+        return _done(False)
+    jobs = [_speech_params(text, language, rate) for text in texts if text.strip()]
+    try:
+        return _executor().submit(_render_all, jobs, language, volume)
+    except Exception as e:
+        logging.error("TTS executor error: %s", e, exc_info=True)
+        return _done(False)
+
+def _render_all(jobs: List[Tuple[str, int]], language: str, volume: float) -> bool:
+    return all([_render_wav(text, language, rate, volume) is not None for text, rate in jobs])
+
+def _done(result: bool) -> Future:
+    """Future already resolved to result"""
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+def _executor() -> ThreadPoolExecutor:
+    """
+    The single-thread executor that owns the pyttsx3 engine.
     
-    result_q: queue.Queue[bool | str] = queue.Queue()
+    pyttsx3 misbehaves when driven from several threads, so the engine is
+    created and used only on this executor's thread.
+    """
+    global _TTS_EXEC
+    with _TTS_LOCK:
+        if _TTS_EXEC is None:
+            _TTS_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts', initializer=_get_engine)
+        return _TTS_EXEC
 
-    def run():
+def _speak_sync(text: str, language: str, rate: int, volume: float) -> bool:
+    result = _speak_now(text, language, rate, volume)
+    if isinstance(result, str):  # Error message
+        logging.error("TTS error: %s", result)
+        return False
+    return result
+
+def _speak_phrase(text: str, language: str, rate: int, volume: float) -> bool:
+    """Play the text from its cached WAV, rendering it with the engine on first use"""
+    global _SPEAKING, _SPEAKING_UNTIL
+    wav = _render_wav(text, language, rate, volume)
+    if wav is None:
+        return _speak_sync(text, language, rate, volume)
+    try:
+        _SPEAKING = True
+        winsound.PlaySound(wav, winsound.SND_MEMORY)
+        return True
+    except Exception as e:
+        logging.warning("Phrase playback failed, speaking it directly: %s", e)
+        return _speak_sync(text, language, rate, volume)
+    finally:
+        _SPEAKING = False
+        _SPEAKING_UNTIL = time.time() + _SPEAK_COOLDOWN_SEC
+
+def _render_wav(text: str, language: str, rate: int, volume: float) -> Optional[bytes]:
+    """The text's cached WAV, rendered with the engine if missing; None if it can't be rendered"""
+    key = (language, text, rate, volume)
+    wav = _PHRASE_WAV.get(key)
+    if wav is not None:
+        _PHRASE_WAV.move_to_end(key)
+    else:
+        engine = _get_engine(language)
+        if engine is None:
+            return None
+        fd, path = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
         try:
-            global _SPEAKING
-            with _TTS_LOCK:
-                _SPEAKING = True
-                engine = _get_engine(language)
-                if engine is None:
-                    # Win32 COM fallback
-                    if win32com_client is not None:
-                        try:
-                            voice = win32com_client.Dispatch("SAPI.SpVoice")
-                            try:
-                                voice.Volume = max(0, min(100, int(volume * 100)))
-                            except Exception:
-                                pass
-                            voice.Speak(text)
-                            result_q.put(True)
-                            return
-                        except Exception:
-                            pass
-                    # PowerShell SAPI fallback
+            _select_voice(engine, language)
+            _set_property(engine, 'rate', rate)
+            _set_property(engine, 'volume', volume)
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+            with open(path, 'rb') as f:
+                wav = f.read()
+        except Exception as e:
+            logging.warning("Could not pre-render phrase: %s", e)
+            return None
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if not wav:
+            return None
+        wav = _to_16k_mono(wav)
+        _PHRASE_WAV[key] = wav
+        if len(_PHRASE_WAV) > _PHRASE_CACHE_SIZE:
+            _PHRASE_WAV.popitem(last=False)
+    return wav
+
+def _to_16k_mono(wav: bytes) -> bytes:
+    """
+    Downmix a 16-bit PCM WAV to mono and resample it to _PHRASE_SAMPLE_RATE.
+    
+    Speech stays intelligible at 16 kHz mono, and the cached phrase is less
+    than half the size of the engine's 22 kHz output. Other formats, or
+    missing numpy, leave the WAV unchanged.
+    """
+    if np is None:
+        return wav
+    try:
+        with wave.open(io.BytesIO(wav)) as reader:
+            channels, width, framerate = reader.getnchannels(), reader.getsampwidth(), reader.getframerate()
+            frames = reader.readframes(reader.getnframes())
+    except (wave.Error, EOFError):
+        return wav
+    if width != 2 or (channels == 1 and framerate <= _PHRASE_SAMPLE_RATE):
+        return wav
+    samples = np.frombuffer(frames, dtype='<i2').reshape(-1, channels).mean(axis=1)
+    if framerate > _PHRASE_SAMPLE_RATE:
+        count = len(samples) * _PHRASE_SAMPLE_RATE // framerate
+        positions = np.arange(count) * (framerate / _PHRASE_SAMPLE_RATE)
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+        framerate = _PHRASE_SAMPLE_RATE
+    out = io.BytesIO()
+    with wave.open(out, 'wb') as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(framerate)
+        writer.writeframes(np.round(samples).astype('<i2').tobytes())
+    return out.getvalue()
+
+def _speak_now(text: str, language: str, rate: int, volume: float):
+    """Speak on the current thread; returns True, False after a logged error, or an error message"""
+    global _SPEAKING, _SPEAKING_UNTIL
+    try:
+        _SPEAKING = True
+        engine = _get_engine(language)
+        if engine is None:
+            # Win32 COM fallback
+            if win32com_client is not None:
+                try:
+                    voice = win32com_client.Dispatch("SAPI.SpVoice")
                     try:
-                        import subprocess
-                        ps_script = (
-                            "$ErrorActionPreference='SilentlyContinue'; "
-                            "$v = New-Object -ComObject SAPI.SpVoice; "
-                            f"$s = @'\n{text}\n'@; "
-                            "$v.Speak($s) | Out-Null"
-                        )
-                        subprocess.run([
-                            "powershell", "-NoProfile", "-Command", ps_script
-                        ], capture_output=True, text=True, timeout=30)
-                        result_q.put(True)
-                        return
+                        voice.Volume = max(0, min(100, int(volume * 100)))
                     except Exception:
                         pass
-                    result_q.put("No TTS engine")
-                    return
-                if not _select_voice(engine, language):
-                    logging.warning(f"Could not find suitable voice for language: {language}")
-                engine.setProperty('rate', rate)
-                engine.setProperty('volume', volume)
-                engine.say(text)
-                engine.runAndWait()
-                result_q.put(True)
-        
-        except Exception as e:
-            error_msg = f"TTS error: {str(e)}"
-            logging.error(error_msg, exc_info=True)
-            result_q.put(error_msg)
-        finally:
+                    voice.Speak(text)
+                    return True
+                except Exception:
+                    pass
+            # PowerShell SAPI fallback
             try:
-                global _SPEAKING_UNTIL
-                _SPEAKING = False
-                _SPEAKING_UNTIL = time.time() + _SPEAK_COOLDOWN_SEC
+                import subprocess
+                ps_script = (
+                    "$ErrorActionPreference='SilentlyContinue'; "
+                    "$v = New-Object -ComObject SAPI.SpVoice; "
+                    f"$s = @'\n{text}\n'@; "
+                    "$v.Speak($s) | Out-Null"
+                )
+                subprocess.run([
+                    "powershell", "-NoProfile", "-Command", ps_script
+                ], capture_output=True, text=True, timeout=30)
+                return True
             except Exception:
                 pass
+            return "No TTS engine"
+        if not _select_voice(engine, language):
+            logging.warning("Could not find suitable voice for language: %s", language)
+        _set_property(engine, 'rate', rate)
+        _set_property(engine, 'volume', volume)
+        engine.say(text)
+        engine.runAndWait()
+        return True
     
-    try:
-        # Run the TTS in a separate thread with timeout
-        th = threading.Thread(target=run, daemon=True)
-        th.start()
-        th.join(timeout)
-        
-        if th.is_alive():
-            logging.error(f"TTS timed out after {timeout} seconds")
-            return False
-            
-        # Check if there was an error
-        if not result_q.empty():
-            result = result_q.get()
-            if isinstance(result, str):  # Error message
-                logging.error(f"TTS error: {result}")
-                return False
-            return result
-            
-        return False
-        
     except Exception as e:
-        logging.error(f"TTS thread error: {e}", exc_info=True)
+        logging.error("TTS error: %s", e, exc_info=True)
         return False
+    finally:
+        _SPEAKING = False
+        _SPEAKING_UNTIL = time.time() + _SPEAK_COOLDOWN_SEC
 
 def shutdown():
     """Shutdown TTS engine"""
-    global _ENGINE
+    global _ENGINE, _TTS_EXEC
     try:
+        with _TTS_LOCK:
+            executor, _TTS_EXEC = _TTS_EXEC, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         if _ENGINE:
             _ENGINE.stop()
             _ENGINE = None
+            _ENGINE_STATE.clear()
     except Exception:
         pass
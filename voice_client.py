@@ -7,57 +7,94 @@ Listens for wake word, captures commands, sends to JAI server, and speaks respon
 import os
 import sys
 import logging
-import requests
-from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
 import re
-
-# Import JAI modules
-try:
-    from stt import VoiceListener
-    from tts import speak, detect_language
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    print("Make sure stt.py and tts.py are in the same directory")
-    sys.exit(1)
-
-# Setup logging - only to file, UTF-8 to support non-ASCII (e.g., Arabic)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('voice_client.log', encoding='utf-8')
-    ]
-)
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 # Load configuration
 load_dotenv()
 
+# Accepted spellings of an enabled boolean setting
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
 JAI_SERVER = os.environ.get("JAI_SERVER", "http://localhost:8001")
 JAI_USERNAME = os.environ.get("JAI_USERNAME", "user1")
 JAI_PASSWORD = os.environ.get("JAI_PASSWORD", "pass1")
 WAKE_WORD = os.environ.get("WAKE_WORD", "Activate aj")
 TTS_VOICE = os.environ.get("TTS_VOICE", None)
-VOICE_CLIENT_SUPPRESS_TTS = os.environ.get("VOICE_CLIENT_SUPPRESS_TTS", "true").lower() in {"1", "true", "yes", "on"}
+# Reply language for monolingual setups (en, ur, ar, fr); unset = detect per reply
+JAI_LANG = os.environ.get("JAI_LANG", "").strip().lower() or None
+VOICE_CLIENT_SUPPRESS_TTS = os.environ.get("VOICE_CLIENT_SUPPRESS_TTS", "true").strip().lower() in _TRUTHY
+
+# Command patterns, compiled once at import
+_EXIT_RE = re.compile(r"\b(?:good\s?bye|see\s+you\s+soon|exit|quit|bye)\b")
+_ACTIVATE_TEXT_RE = re.compile(r"\bactivate\s+text(?:\s+mode)?\b")
+_ACTIVATE_VOICE_RE = re.compile(r"\bactivate\s+voice(?:\s+mode)?\b")
+
+# Longest the voice loop waits for a reply to finish speaking
+_REPLY_TIMEOUT_SEC = float(os.environ.get("VOICE_CLIENT_TTS_TIMEOUT", "60"))
+
+# Replies longer than this are spoken sentence by sentence, so the first
+# sentence plays without waiting for the whole reply to be synthesized
+_STREAM_REPLY_CHARS = 200
+
+# Fixed English prompts, rendered at startup so they play without synthesis delay
+_CANNED_PROMPTS = (
+    "Voice mode activated. I'm listening!",
+    "Text mode activated. I'm ready!",
+    "Yes, I'm here!",
+    "Goodbye! Have a great day!",
+)
 
 
 class JAIVoiceClient:
     """Voice client for interacting with JAI server."""
     
     def __init__(self, server_url: str, username: str, password: str, wake_word: str = "Activate aj"):
+        # Imported here rather than at module load, so `--help` and plain
+        # imports don't pull in requests and the audio stack
+        import requests
+        from requests.adapters import HTTPAdapter
+        from requests.auth import HTTPBasicAuth
+        from urllib3.util.retry import Retry
+        try:
+            import stt
+            import tts
+        except ImportError as e:
+            print(f"Error importing modules: {e}")
+            print("Make sure stt.py and tts.py are in the same directory")
+            raise
+        self._tts = tts
+        
         self.server_url = server_url.rstrip('/')
         self.auth = HTTPBasicAuth(username, password)
+        # One keep-alive connection to the server, reused for every command.
+        # Retry only covers failed connects; a POST the server received is not resent.
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update({"Connection": "keep-alive"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.wake_word = wake_word
         self._switch_to_text = False
         self._switch_to_voice = False
+        # Future for the reply still being spoken, if any
+        self._reply = None
+        # Per-turn timings in ms (stt, net_ttfb, net_total), logged once the reply is spoken
+        self._turn = {}
+        self._lang_hint = JAI_LANG
         
         # Initialize voice listener
         try:
-            self.listener = VoiceListener(wake_word=wake_word)
+            self.listener = stt.VoiceListener(wake_word=wake_word)
             logging.info("Voice listener initialized")
         except Exception as e:
             logging.error("Failed to initialize voice listener: %s", e)
             raise
+        tts.prerender(_CANNED_PROMPTS, language="en")
     
     def send_command(self, command: str) -> str:
         """
@@ -69,15 +106,21 @@ class JAIVoiceClient:
         Returns:
             JAI's response
         """
+        import requests
+        
         try:
-            response = requests.post(
+            sent = time.perf_counter()
+            # stream=True returns once the headers arrive, which gives the time to first byte
+            with self.session.post(
                 f"{self.server_url}/command",
                 json={"command": command, "suppress_tts": VOICE_CLIENT_SUPPRESS_TTS},
-                auth=self.auth,
-                timeout=60  # Increased to 60s for AI responses with Gemini
-            )
-            response.raise_for_status()
-            data = response.json()
+                timeout=60,  # Increased to 60s for AI responses with Gemini
+                stream=True,
+            ) as response:
+                self._turn['net_ttfb'] = (time.perf_counter() - sent) * 1000
+                response.raise_for_status()
+                data = response.json()
+            self._turn['net_total'] = (time.perf_counter() - sent) * 1000
             return data.get('response', 'No response from JAI')
             
         except requests.exceptions.ConnectionError:
@@ -102,21 +145,27 @@ class JAIVoiceClient:
         logging.info("Command: %s", command)
         print(f"\n🎤 You: {command}")
         
+        # A new command makes the previous reply stale; drop what hasn't been spoken yet
+        if self._reply is not None:
+            self._reply.cancel()
+            self._reply = None
+        
+        cmd_lower = command.lower()
+        
         # Check for exit commands
-        exit_phrases = ["goodbye", "good bye", "see you soon", "exit", "quit", "bye"]
-        if any(phrase in command.lower() for phrase in exit_phrases):
+        if _EXIT_RE.search(cmd_lower):
+            self._turn = {}
             farewell = "Goodbye! Have a great day!"
             print(f"🤖 AJ: {farewell}\n")
             try:
-                speak(farewell)
+                self._tts.speak(farewell, cache=True)
             except Exception:
                 pass
             return False
         
-        cmd_lower = command.lower()
-        if re.search(r"\bactivate\s+text(?:\s+mode)?\b", cmd_lower):
+        if _ACTIVATE_TEXT_RE.search(cmd_lower):
             self._switch_to_text = True
-        elif re.search(r"\bactivate\s+voice(?:\s+mode)?\b", cmd_lower):
+        elif _ACTIVATE_VOICE_RE.search(cmd_lower):
             self._switch_to_voice = True
         
         # Send to JAI server
@@ -124,19 +173,44 @@ class JAIVoiceClient:
         logging.info("Response: %s", response)
         print(f"🤖 AJ: {response}\n")
         
-        # Speak the response in detected language of the text
+        # Speak the response in detected language of the text; it plays in the
+        # background so a typed command can go out while it's still speaking
+        turn, self._turn = self._turn, {}
+        tts_start = time.perf_counter()
         try:
-            lang = detect_language(response) if response else "en"
-            speak(response, language=lang)
+            # detect_language caches its results, so repeated replies are cheap
+            lang = self._lang_hint or (self._tts.detect_language(response) if response else "en")
+            # Server replies are one-off text: speak them directly rather than
+            # rendering a WAV that would push the canned prompts out of the cache
+            if len(response) > _STREAM_REPLY_CHARS:
+                self._reply = self._tts.speak_stream_async(response, language=lang)
+            else:
+                self._reply = self._tts.speak_async(response, language=lang)
+            self._reply.add_done_callback(lambda _: _log_turn(turn, tts_start))
         except Exception as e:
             logging.error("TTS failed: %s", e)
+            _log_turn(turn, None)
         
         return True
     
+    def _wait_for_reply(self):
+        """Let the spoken reply finish so the microphone doesn't pick it up."""
+        if self._reply is not None:
+            try:
+                self._reply.result(timeout=_REPLY_TIMEOUT_SEC)
+            except FutureTimeoutError:
+                self._reply.cancel()
+                logging.warning("Reply still speaking after %.0fs; listening anyway", _REPLY_TIMEOUT_SEC)
+            except Exception:
+                pass
+            self._reply = None
+        while self._tts.is_speaking():
+            time.sleep(0.05)
+    
     def conversation_session(self):
         print("\n✅ Session started! You can now ask questions continuously.")
         try:
-            speak("Voice mode activated. I'm listening!", language="en")
+            self._tts.speak("Voice mode activated. I'm listening!", language="en", cache=True)
         except Exception:
             pass
         self._voice_only_session()
@@ -147,7 +221,7 @@ class JAIVoiceClient:
         print("👋 Type 'goodbye' or 'exit' to end session\n")
         
         try:
-            speak("Text mode activated. I'm ready!")
+            self._tts.speak("Text mode activated. I'm ready!", cache=True)
         except Exception:
             pass
         
@@ -177,25 +251,38 @@ class JAIVoiceClient:
         print("👋 Say 'goodbye' or 'exit' to end session\n")
         
         try:
-            speak("Voice mode activated. I'm listening!", language="en")
+            self._tts.speak("Voice mode activated. I'm listening!", language="en", cache=True)
         except Exception:
             pass
         
-        while True:
-            print("🎤 Listening...")
-            command = self.listener.listen_once(timeout=30, phrase_time_limit=30)
-            
-            if command:
-                should_continue = self.handle_command(command)
-                if self._switch_to_text:
-                    self._switch_to_text = False
-                    print("\n⌨️  Switching to TEXT MODE...\n")
-                    self._text_only_session()
-                    return
-                if not should_continue:
-                    break
-            else:
-                print("⏱️  No speech detected. Still listening...\n")
+        # One microphone stream for the whole session
+        # Status lines are printed on state changes only; repeated silent
+        # timeouts go to the log
+        idle = False
+        with self.listener.open_stream():
+            while True:
+                self._wait_for_reply()
+                if not idle:
+                    print("🎤 Listening...")
+                listen_start = time.perf_counter()
+                command = self.listener.listen_once(timeout=30, phrase_time_limit=30)
+                self._turn['stt'] = (time.perf_counter() - listen_start) * 1000
+                
+                if command:
+                    idle = False
+                    should_continue = self.handle_command(command)
+                    if self._switch_to_text or not should_continue:
+                        break
+                elif not idle:
+                    idle = True
+                    print("⏱️  No speech detected. Still listening...\n")
+                else:
+                    logging.debug("No speech detected")
+        
+        if self._switch_to_text:
+            self._switch_to_text = False
+            print("\n⌨️  Switching to TEXT MODE...\n")
+            self._text_only_session()
     
     def run(self, continuous: bool = True):
         """
@@ -218,7 +305,7 @@ class JAIVoiceClient:
                 if self.listener.wait_for_wake_word(timeout=300):
                     print("\n👂 Wake word detected!")
                     try:
-                        speak("Yes, I'm here!")
+                        self._tts.speak("Yes, I'm here!", cache=True)
                     except Exception:
                         pass
                     self._voice_only_session()
@@ -235,10 +322,31 @@ class JAIVoiceClient:
             print(f"\n❌ Error: {e}")
 
 
+def _log_turn(turn: dict, tts_start):
+    """Log where one command's time went, so slow turns can be profiled from voice_client.log."""
+    if tts_start is not None:
+        turn = dict(turn, tts_total=(time.perf_counter() - tts_start) * 1000)
+    logging.info("turn %s", " ".join(
+        f"{name}={turn[name]:.0f}ms" if name in turn else f"{name}=-"
+        for name in ("stt", "net_ttfb", "net_total", "tts_total")
+    ))
+
+
 def main():
     """Main entry point."""
     import argparse
     
+    # Setup logging - only to file, UTF-8 to support non-ASCII (e.g., Arabic).
+    # Done here rather than at import so importing the client doesn't add a
+    # handler to the host program's root logger.
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('voice_client.log', encoding='utf-8')
+        ]
+    )
+    
     parser = argparse.ArgumentParser(description="JAI Voice Client")
     parser.add_argument('--server', default=JAI_SERVER, help='JAI server URL')
     parser.add_argument('--username', default=JAI_USERNAME, help='Username')